@@ -0,0 +1,92 @@
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from rich import box
+from rich.table import Table
+
+from mireport.cli import configure_rich_output
+from mireport.cli import console_print as print
+from mireport.conversionresults import ConversionResultsBuilder
+from mireport.data.disclosures import VSME_DEFAULTS
+from mireport.report.disclosure_layout import DisclosureLayoutStrategy
+from mireport.report.layout import ReportLayoutOrganiser
+from mireport.xlsx_template_reader._binder import WorkbookBinder
+from mireport.xlsx_template_reader._fact_creator import FactCreator
+from mireport.xlsx_template_reader._reader import WorkbookReader
+from mireport.xlsx_template_reader.processor import XlsxProcessor
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Time WorkbookBinder.bind() and ReportLayoutOrganiser.organise() on filled in templates (the workbook is loaded, and the facts created, once)."
+    )
+    parser.add_argument(
+        "xlsx_files",
+        type=Path,
+        nargs="*",
+        default=sorted(Path("tests/data").glob("VSME-Digital-Template-Sample-*.xlsx")),
+        help="Workbooks to use (default: the samples in tests/data).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Runs per timing; the best of five timings is shown (default: 10).",
+    )
+    return parser
+
+
+def bestOf(function: Callable[[], object], repeat: int) -> float:
+    """Fastest time, in milliseconds, of a call to function."""
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        timings.append((time.perf_counter() - start) / repeat)
+    return min(timings) * 1000
+
+
+def timeWorkbook(path: Path, repeat: int) -> tuple[int, float, float]:
+    """Facts in the workbook and the best bind() and organise() timings."""
+    results = ConversionResultsBuilder()
+    processor = XlsxProcessor.from_file(path, results, VSME_DEFAULTS)
+    processor._verifyEntryPoint()
+    processor.getAndValidateRequiredMetadata()
+    processor.checkTemplate()
+    report = processor._report
+    workbook = processor._reader._workbook
+
+    def bind() -> object:
+        # bind() uses up the reader's named ranges, so start afresh.
+        reader = WorkbookReader(workbook, results)
+        return WorkbookBinder(reader, report.taxonomy, results).bind()
+
+    FactCreator(
+        bind(), processor._reader, report, results, VSME_DEFAULTS
+    ).create_all_facts()
+    layout = DisclosureLayoutStrategy.for_entry_point(report.taxonomy.entryPoint)
+
+    def organise() -> object:
+        return ReportLayoutOrganiser(report.taxonomy, report).organise(layout)
+
+    return report.factCount, bestOf(bind, repeat), bestOf(organise, repeat)
+
+
+def main() -> None:
+    args = parser().parse_args()
+    table = Table(title="Binding and layout", box=box.SIMPLE)
+    table.add_column("Workbook", no_wrap=True)
+    for heading in ("Facts", "bind (ms)", "organise (ms)"):
+        table.add_column(heading, justify="right")
+    for path in args.xlsx_files:
+        facts, bindTime, organiseTime = timeWorkbook(path, args.repeat)
+        table.add_row(path.name, f"{facts:,}", f"{bindTime:.2f}", f"{organiseTime:.2f}")
+    print(table)
+
+
+if __name__ == "__main__":
+    configure_rich_output()
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import difflib
+import random
+import time
+
+from rich import box
+from rich.table import Table
+
+from mireport.cli import configure_rich_output
+from mireport.cli import console_print as print
+from mireport.stringutil import CloseMatchIndex
+from mireport.taxonomy import getTaxonomy, listTaxonomies
+from mireport.xlsx_template_reader._enumerations import eeDomainByLabel
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare closest enumeration member matching using difflib with CloseMatchIndex, on mistyped member labels of the built-in taxonomies."
+    )
+    parser.add_argument(
+        "entry_point",
+        nargs="?",
+        default=None,
+        help="Taxonomy entry point (default: the latest).",
+    )
+    parser.add_argument(
+        "--cells",
+        type=int,
+        default=50,
+        help="Cell values to try per enumeration concept (default: 50).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser
+
+
+def mistype(label: str, rng: random.Random) -> str:
+    """label as someone might type it into the template by hand."""
+    chars = list(rng.choice((label, label.lower(), label.upper())))
+    for _ in range(rng.randrange(len(chars) // 8 + 2)):
+        position = rng.randrange(len(chars) + 1)
+        match rng.randrange(3):
+            case 0 if position < len(chars):
+                del chars[position]
+            case 1:
+                chars.insert(position, rng.choice("abcdefghijklmnopqrstuvwxyz -."))
+            case _ if position < len(chars):
+                chars[position] = chars[position].swapcase()
+    return "".join(chars).strip()
+
+
+def main() -> None:
+    args = parser().parse_args()
+    taxonomy = getTaxonomy(args.entry_point or max(listTaxonomies()))
+    rng = random.Random(args.seed)
+
+    table = Table(
+        title=f"Closest match per cell ({taxonomy.entryPoint})", box=box.SIMPLE
+    )
+    table.add_column("Enumeration", no_wrap=True)
+    for heading in ("Labels", "difflib (ms)", "Index (ms)", "Speed-up"):
+        table.add_column(heading, justify="right")
+
+    totalDifflib = totalIndex = 0.0
+    for concept in sorted(taxonomy.concepts, key=str):
+        if not (concept.isEnumerationSet or concept.isEnumerationSingle):
+            continue
+        labels = eeDomainByLabel(concept)
+        if not labels:
+            continue
+        cells = [mistype(rng.choice(list(labels)), rng) for _ in range(args.cells)]
+
+        start = time.perf_counter()
+        expected = [
+            difflib.get_close_matches(cell, labels, n=1, cutoff=0.6) for cell in cells
+        ]
+        difflibTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = CloseMatchIndex(labels)
+        found = [index.closest(cell) for cell in cells]
+        indexTime = time.perf_counter() - start
+
+        for cell, wanted, got in zip(cells, expected, found, strict=True):
+            if (wanted[0] if wanted else None) != got:
+                print(f"[red]Different match for {cell!r}: {wanted} != {got!r}")
+
+        totalDifflib += difflibTime
+        totalIndex += indexTime
+        table.add_row(
+            str(concept.qname),
+            f"{len(labels):,}",
+            f"{difflibTime / len(cells) * 1000:.2f}",
+            f"{indexTime / len(cells) * 1000:.2f}",
+            f"{difflibTime / indexTime:.1f}x",
+        )
+    print(table)
+    print(
+        f"difflib {totalDifflib:.2f} s, index {totalIndex:.2f} s (including building it)."
+    )
+
+
+if __name__ == "__main__":
+    configure_rich_output()
+    main()
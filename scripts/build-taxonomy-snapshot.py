@@ -0,0 +1,43 @@
+import argparse
+import time
+from pathlib import Path
+
+from mireport.cli import configure_rich_output
+from mireport.cli import console_print as print
+from mireport.taxonomy import buildTaxonomyManifest, buildTaxonomySnapshots
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Build the taxonomy manifest and the binary snapshots of the built-in taxonomies that are used to speed up start up. Rerun whenever the taxonomy JSON changes."
+    )
+    parser.add_argument(
+        "output_dir",
+        type=Path,
+        nargs="?",
+        default=None,
+        help="Directory to write to (default: alongside the taxonomy JSON, where they are picked up automatically).",
+    )
+    parser.add_argument(
+        "--manifest-only",
+        action="store_true",
+        help="Only rebuild the (checked in) manifest, not the snapshots.",
+    )
+    return parser
+
+
+def main() -> None:
+    args = parser().parse_args()
+    start = time.perf_counter()
+    written = [buildTaxonomyManifest(args.output_dir)]
+    if not args.manifest_only:
+        written.extend(buildTaxonomySnapshots(args.output_dir))
+    elapsed = time.perf_counter() - start
+    for path in written:
+        print(f"Wrote {path} ({path.stat().st_size:,} bytes).")
+    print(f"Finished in {elapsed:,.2f} seconds.")
+
+
+if __name__ == "__main__":
+    configure_rich_output()
+    main()
@@ -1,10 +1,16 @@
 import argparse
 import glob
+import json
 import logging
+import os
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple
 
 from mireport.arelle.report_info import ArelleReportProcessor, getOrCreateReportPackage
+from mireport.arelle.worker_pool import ArelleWorkerPool
 from mireport.cli import configure_rich_output
 from mireport.cli import console_print as print
 from mireport.conversionresults import (
@@ -19,9 +25,10 @@ def parse_args() -> argparse.Namespace:
         description="Check an XBRL report is valid and, optionally, and create a viewer for it including any validation messages."
     )
     parser.add_argument(
-        "report_path",
-        type=Path,
-        help="Path to the report (bare XHTML file or XBRL report package) to be checked.",
+        "report_paths",
+        type=str,
+        nargs="+",
+        help="Path to the report (bare XHTML file or XBRL report package) to be checked. Give several paths, directories or globs to check many reports in parallel (batch mode).",
     )
     parser.add_argument(
         "--taxonomy-packages",
@@ -42,6 +49,18 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="The path of the xBRL-JSON to be created.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Batch mode: number of Arelle worker processes (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=None,
+        help="Batch mode: path of a JSON lines file to write each report's messages to.",
+    )
     parser.add_argument(
         "--ignore-calculation-warnings",
         action=argparse.BooleanOptionalAction,
@@ -83,7 +102,6 @@ def main() -> None:
         print("[red]Debugging information will be included in the output.[/red]")
         logging.root.setLevel(logging.DEBUG)
 
-    report_path: Path = args.report_path
     taxonomy_package_globs: list[str] = args.taxonomy_packages
     viewer_path: Path | None = args.viewer_path
     json_path: Path | None = args.json_path
@@ -120,6 +138,18 @@ def main() -> None:
         print("No taxonomy packages specified so working ONLINE.")
         workOffline = False
 
+    if isBatch(args):
+        if viewer_path or json_path:
+            raise SystemExit(
+                "Viewer and xBRL-JSON output are not available in batch mode."
+            )
+        reports = findReports(args.report_paths)
+        if not reports:
+            raise SystemExit(f"No reports found in {' '.join(args.report_paths)}.")
+        checkReports(reports, taxonomy_packages, workOffline, args)
+        return
+
+    report_path = Path(args.report_paths[0])
     if not report_path.is_file():
         raise SystemExit(f"Report path {report_path} cannot be found.")
 
@@ -130,35 +160,30 @@ def main() -> None:
     )
     source = getOrCreateReportPackage(report_path)
 
-    outputsWanted: bool = bool(viewer_path or json_path)
-    arelle_messages = []
-    if not outputsWanted:
-        arelle_result = arp.validateReportPackage(
-            source, disableCalculationValidation=args.ignore_calculation_warnings
-        )
-        arelle_messages.extend(arelle_result.messages)
-    else:
-        if viewer_path:
-            arelle_result = arp.generateInlineViewer(source)
-            arelle_messages.extend(arelle_result.messages)
-            if arelle_result.has_viewer:
-                if viewer_path.is_file():
-                    print(f"Overwriting {viewer_path}.")
-                arelle_result.viewer.saveToFilepath(viewer_path)
-                print(f"Viewer written to {viewer_path}.")
-            else:
-                print("Failed to create inline viewer.")
-
-        if json_path:
-            arelle_result = arp.generateXBRLJson(source)
-            arelle_messages.extend(arelle_result.messages)
-            if arelle_result.has_json:
-                if json_path.is_file():
-                    print(f"Overwriting {json_path}.")
-                arelle_result.xbrl_json.saveToFilepath(json_path)
-                print(f"xBRL-JSON written to {json_path}.")
-            else:
-                print("Failed to create xBRL-JSON.")
+    arelle_result = arp.processReportPackage(
+        source,
+        viewer=viewer_path is not None,
+        xbrlJson=json_path is not None,
+        disableCalculationValidation=args.ignore_calculation_warnings,
+    )
+    arelle_messages = arelle_result.messages
+    if viewer_path:
+        if arelle_result.has_viewer:
+            if viewer_path.is_file():
+                print(f"Overwriting {viewer_path}.")
+            arelle_result.viewer.saveToFilepath(viewer_path)
+            print(f"Viewer written to {viewer_path}.")
+        else:
+            print("Failed to create inline viewer.")
+
+    if json_path:
+        if arelle_result.has_json:
+            if json_path.is_file():
+                print(f"Overwriting {json_path}.")
+            arelle_result.xbrl_json.saveToFilepath(json_path)
+            print(f"xBRL-JSON written to {json_path}.")
+        else:
+            print("Failed to create xBRL-JSON.")
     results = ConversionResultsBuilder().addMessages(arelle_messages).build()
     elapsed = (time.perf_counter_ns() - start) / 1_000_000_000
     print(f"Finished querying Arelle ({elapsed:,.2f} seconds elapsed).")
@@ -184,6 +209,154 @@ def main() -> None:
     final_word_and_exit(results, args.quiet)
 
 
+REPORT_SUFFIXES = frozenset({".zip", ".xbri", ".xhtml", ".html", ".htm"})
+# Inline viewers (as written by this script and the converter) are HTML but
+# not reports, so directory scans leave them out.
+VIEWER_SUFFIX = "_viewer.html"
+
+
+class ReportCheck(NamedTuple):
+    report: Path
+    seconds: float
+    results: ConversionResults | None
+    error: str | None = None
+
+
+def isBatch(args: argparse.Namespace) -> bool:
+    if args.workers is not None or args.summary is not None:
+        return True
+    if len(args.report_paths) != 1:
+        return True
+    return not Path(args.report_paths[0]).is_file()
+
+
+def isViewer(path: Path) -> bool:
+    return path.name.lower().endswith(VIEWER_SUFFIX)
+
+
+def findReports(candidates: list[str]) -> list[Path]:
+    """Expand the given files, directories and globs into report paths.
+    Directories and globs leave out any inline viewers; files named outright
+    are always checked."""
+    reports: set[Path] = set()
+    for candidate in candidates:
+        pattern = any(c in candidate for c in "*?[")
+        for match in glob.glob(candidate, recursive=True) or [candidate]:
+            path = Path(match)
+            if path.is_dir():
+                reports.update(
+                    p
+                    for p in path.rglob("*")
+                    if p.is_file()
+                    and p.suffix.lower() in REPORT_SUFFIXES
+                    and not isViewer(p)
+                )
+            elif path.is_file():
+                if not (pattern and isViewer(path)):
+                    reports.add(path)
+            else:
+                print(f"[yellow]Ignoring {path}: not found.[/yellow]")
+    return sorted(reports)
+
+
+def checkReports(
+    reports: list[Path],
+    taxonomy_packages: list[Path],
+    workOffline: bool,
+    args: argparse.Namespace,
+) -> None:
+    """Validate many reports across a pool of warm Arelle worker processes,
+    optionally writing each report's messages as a line of JSON."""
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(reports)))
+    print(f"Checking {len(reports)} reports using {workers} Arelle workers.")
+    pool = ArelleWorkerPool(
+        workers=workers, taxonomyPackages=taxonomy_packages, workOffline=workOffline
+    )
+
+    def check(report: Path) -> ReportCheck:
+        start = time.perf_counter_ns()
+        try:
+            arelle_result = pool.validateReportPackage(
+                getOrCreateReportPackage(report),
+                disableCalculationValidation=args.ignore_calculation_warnings,
+            )
+            results = (
+                ConversionResultsBuilder().addMessages(arelle_result.messages).build()
+            )
+            error = None
+        except Exception as e:  # noqa: BLE001 - one bad report must not stop the batch
+            results = None
+            error = f"{e.__class__.__name__}: {e}"
+        elapsed = (time.perf_counter_ns() - start) / 1_000_000_000
+        return ReportCheck(report, elapsed, results, error)
+
+    start = time.perf_counter_ns()
+    outcomes: Counter[str] = Counter()
+    summary = args.summary.open("w", encoding="utf-8") if args.summary else None
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            futures = [threads.submit(check, report) for report in reports]
+            for future in as_completed(futures):
+                checked = future.result()
+                outcome = reportOutcome(checked, args)
+                outcomes[outcome] += 1
+                if summary is not None:
+                    summary.write(json.dumps(summaryRecord(checked, outcome)) + "\n")
+                    summary.flush()
+    finally:
+        pool.close()
+        if summary is not None:
+            summary.close()
+    elapsed = (time.perf_counter_ns() - start) / 1_000_000_000
+
+    print()
+    print(
+        f"Checked {len(reports)} reports in {elapsed:,.2f} seconds"
+        f" ({len(reports) / elapsed:,.2f} reports/second,"
+        f" {elapsed * workers / len(reports):,.2f} worker seconds/report)."
+    )
+    print(
+        ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items()))
+    )
+    if args.summary:
+        print(f"Summary written to {args.summary}.")
+    raise SystemExit(1 if outcomes["invalid"] or outcomes["failed"] else 0)
+
+
+def reportOutcome(checked: ReportCheck, args: argparse.Namespace) -> str:
+    if checked.results is None:
+        outcome = "failed"
+        if not args.quiet:
+            print(f"💥 {checked.report} ({checked.seconds:,.2f}s): {checked.error}")
+        return outcome
+    match checked.results.getOverallSeverity():
+        case Severity.ERROR:
+            outcome, marker = "invalid", "❌"
+        case Severity.WARNING:
+            outcome, marker = "warnings", "⚠️"
+        case _:
+            outcome, marker = "valid", "✅"
+    if not args.quiet:
+        print(f"{marker} {checked.report} ({checked.seconds:,.2f}s)")
+        if args.verbose:
+            for message in checked.results.userMessages:
+                print(f"\t{message}")
+    return outcome
+
+
+def summaryRecord(checked: ReportCheck, outcome: str) -> dict:
+    record: dict = {
+        "report": str(checked.report),
+        "outcome": outcome,
+        "seconds": round(checked.seconds, 3),
+    }
+    if checked.results is not None:
+        record["messages"] = [m.toDict() for m in checked.results.developerMessages]
+    if checked.error is not None:
+        record["error"] = checked.error
+    return record
+
+
 def final_word_and_exit(results: ConversionResults, quiet: bool) -> None:
     print()
     match results.getOverallSeverity():
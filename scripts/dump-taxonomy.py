@@ -12,7 +12,6 @@ from rich.prompt import Prompt
 from rich.table import Table
 from rich.text import Text
 
-import mireport
 from mireport.cli import configure_rich_output
 from mireport.cli import console_print as print
 from mireport.data.disclosures import VSME_DEFAULTS
@@ -446,11 +445,9 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    with timer("Taxonomies loaded"):
-        mireport.loadBuiltInTaxonomyJSON()
-
     entry_point = pick_entry_point()
-    taxonomy = getTaxonomy(entry_point)
+    with timer("Taxonomy loaded"):
+        taxonomy = getTaxonomy(entry_point)
 
     match args.subcommand:
         case "translation-sheet":
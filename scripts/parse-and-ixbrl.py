@@ -200,7 +200,6 @@ def doConversion(args: argparse.Namespace) -> tuple[ConversionResults, list[str]
         "mireport Excel to validated Inline Report"
     ) as pc:
         pc.mark("Loading taxonomy metadata")
-        mireport.loadBuiltInTaxonomyJSON()
         allTaxonomies = mireport.taxonomy.listTaxonomies()
         pc.addDevInfoMessage(
             f"Taxonomies entry points ({len(allTaxonomies)}) available: {', '.join(allTaxonomies)}"
@@ -320,14 +319,12 @@ def doConversion(args: argparse.Namespace) -> tuple[ConversionResults, list[str]
                 workOffline=args.offline,
             )
 
-            if not args.viewer and not args.json:
-                arelleResults = arp.validateReportPackage(reportPackage)
-                resultsBuilder.addMessages(arelleResults.messages)
+            arelleResults = arp.processReportPackage(
+                reportPackage, viewer=args.viewer, xbrlJson=args.json
+            )
+            resultsBuilder.addMessages(arelleResults.messages)
 
             if args.viewer:
-                arelleResults = arp.generateInlineViewer(reportPackage)
-                resultsBuilder.addMessages(arelleResults.messages)
-
                 if arelleResults.has_viewer:
                     viewer = arelleResults.viewer
                     if not dir_specified:
@@ -338,9 +335,6 @@ def doConversion(args: argparse.Namespace) -> tuple[ConversionResults, list[str]
                     pc.addDevInfoMessage("Failed to create viewer.")
 
             if args.json:
-                arelleResults = arp.generateXBRLJson(reportPackage)
-                resultsBuilder.addMessages(arelleResults.messages)
-
                 if arelleResults.has_json:
                     json_output = arelleResults.xbrl_json
                     if not dir_specified:
@@ -0,0 +1,55 @@
+import argparse
+
+from rich import box
+from rich.table import Table
+
+from mireport.cli import configure_rich_output
+from mireport.cli import console_print as print
+from mireport.taxonomy import getInterningReport, getTaxonomy, listTaxonomies
+from mireport.taxonomy_interning import INTERNED_KINDS
+
+HEADINGS = {"strings": "Strings", "labels": "Labels", "qnames": "QNames", "utr": "UTR"}
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Load the built-in taxonomies and report the memory saved by sharing equal values between them."
+    )
+    parser.add_argument(
+        "entry_points",
+        nargs="*",
+        help="Entry points to load, in order (default: all of them).",
+    )
+    return parser
+
+
+def main() -> None:
+    args = parser().parse_args()
+    for entryPoint in args.entry_points or listTaxonomies():
+        getTaxonomy(entryPoint)
+    savedBytes, overhead = getInterningReport()
+
+    table = Table(title="Bytes saved by interning", box=box.SIMPLE)
+    table.add_column("Taxonomy", no_wrap=True)
+    for kind in INTERNED_KINDS:
+        table.add_column(HEADINGS.get(kind, kind), justify="right")
+    table.add_column("Total", justify="right")
+
+    total = 0
+    for entryPoint, saved in savedBytes.items():
+        taxonomyTotal = sum(saved.values())
+        total += taxonomyTotal
+        table.add_row(
+            entryPoint,
+            *(f"{saved[kind]:,}" for kind in INTERNED_KINDS),
+            f"{taxonomyTotal:,}",
+        )
+    print(table)
+    print(f"Saved {total:,} bytes in total.")
+    print(f"Interning pools use {overhead:,} bytes.")
+    print(f"Net saving {total - overhead:,} bytes.")
+
+
+if __name__ == "__main__":
+    configure_rich_output()
+    main()
@@ -2,14 +2,18 @@ import argparse
 import logging
 import time
 from collections import Counter
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlparse
 
 from rich.markup import escape
 from rich.table import Table
 
 from mireport.arelle.diagnostics import Diagnostic
 from mireport.arelle.support import ArelleProcessingResult
-from mireport.arelle.taxonomy_info import callArelleForTaxonomyInfo
+from mireport.arelle.taxonomy_info import (
+    TaxonomyInfoJob,
+    callArelleForTaxonomyInfoInParallel,
+)
 from mireport.cli import (
     configure_rich_output,
     get_console,
@@ -40,7 +44,7 @@ def parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "taxonomy_json_path",
         type=Path,
-        help="Path to the taxonomy JSON file to be created.",
+        help="Path to the taxonomy JSON file to be created. With more than one entry point, the directory to create the taxonomy JSON files in (named like vsme-2024-12-17.json).",
     )
     parser.add_argument(
         "taxonomy_zips",
@@ -57,12 +61,53 @@ def parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--entry-point",
         type=str,
+        action="append",
         required=True,
-        help="Entry point to the taxonomy.",
+        help="Entry point to the taxonomy. Repeat to extract several taxonomies concurrently.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of entry points to extract at once (default: all of them).",
     )
     return parser
 
 
+def jsonNameForEntryPoint(entry_point: str) -> str:
+    """Name the JSON after the entry point's last two directories, e.g.
+    https://xbrl.efrag.org/taxonomy/vsme/2024-12-17/vsme-all.xsd ->
+    vsme-2024-12-17.json"""
+    parents = PurePosixPath(urlparse(entry_point).path).parent.parts[-2:]
+    return f"{'-'.join(parents)}.json"
+
+
+def makeJobs(
+    cli: argparse.ArgumentParser, args: argparse.Namespace
+) -> list[TaxonomyInfoJob]:
+    entry_points: list[str] = args.entry_point
+    if len(entry_points) == 1:
+        return [
+            TaxonomyInfoJob(entry_points[0], args.taxonomy_json_path, args.utr_output)
+        ]
+    output_dir: Path = args.taxonomy_json_path
+    if output_dir.exists() and not output_dir.is_dir():
+        cli.error(
+            f"{output_dir} must be a directory when more than one entry point is given."
+        )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    names = [jsonNameForEntryPoint(entry_point) for entry_point in entry_points]
+    if len(set(names)) != len(names):
+        cli.error(f"Entry points do not have distinct JSON names: {names}")
+    # The UTR is the same whichever taxonomy it is extracted alongside.
+    return [
+        TaxonomyInfoJob(
+            entry_point, output_dir / name, args.utr_output if i == 0 else None
+        )
+        for i, (entry_point, name) in enumerate(zip(entry_points, names, strict=True))
+    ]
+
+
 def printMessages(results: ArelleProcessingResult) -> None:
     console = get_console()
     for message in results.messages:
@@ -117,16 +162,17 @@ def printDiagnostics(results: ArelleProcessingResult) -> None:
 def main() -> None:
     cli = parser()
     args = cli.parse_args()
-    taxonomy_json_path = args.taxonomy_json_path
     taxonomy_zips = args.taxonomy_zips
     utr_json_path = args.utr_output
-    entry_point = args.entry_point
 
     taxonomy_zips = validateTaxonomyPackages(taxonomy_zips, cli)
+    jobs = makeJobs(cli, args)
     print(
         "Using:",
-        f"Taxonomy entry point: {entry_point}",
-        f"Taxonomy JSON path: {taxonomy_json_path}",
+        *(
+            f"Taxonomy entry point: {job.entry_point}\n\t\t-> {job.taxonomy_json_path}"
+            for job in jobs
+        ),
         f"Taxonomy packages:\n\t\t{' '.join(taxonomy_zips)}",
         f"UTR JSON path: {utr_json_path}"
         if utr_json_path
@@ -137,11 +183,15 @@ def main() -> None:
     start = time.perf_counter_ns()
 
     print("Calling into Arelle")
-    results = callArelleForTaxonomyInfo(
-        entry_point, taxonomy_zips, taxonomy_json_path, utr_json_path
+    allResults = callArelleForTaxonomyInfoInParallel(
+        jobs, taxonomy_zips, workers=args.workers
     )
-    printMessages(results)
-    printDiagnostics(results)
+    for entry_point, results in allResults.items():
+        if len(allResults) > 1:
+            print()
+            print(f"[bold]{entry_point}[/bold]")
+        printMessages(results)
+        printDiagnostics(results)
 
     elapsed = (time.perf_counter_ns() - start) / 1_000_000_000
     print(f"Finished querying Arelle ({elapsed:,.2f} seconds elapsed).")
@@ -1,3 +1,4 @@
+import atexit
 import logging
 from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
@@ -27,11 +28,16 @@ from flask_session import Session  # type: ignore
 from markupsafe import Markup
 
 import mireport
-from mireport import loadBuiltInTaxonomyJSON
 from mireport.arelle.report_info import (
     ARELLE_VERSION_INFORMATION,
     ArelleReportProcessor,
 )
+from mireport.arelle.result_cache import (
+    ArelleResultCache,
+    CachingArelleReportProcessor,
+)
+from mireport.arelle.support import ArelleProcessingResult
+from mireport.arelle.worker_pool import ArelleWorkerPool
 from mireport.conversionresults import (
     ConversionResults,
     ConversionResultsBuilder,
@@ -48,7 +54,11 @@ from mireport.localise import (
 )
 from mireport.report.theme import ColourPalette, DisplayMode, ReportTheme
 from mireport.stringutil import truthy
-from mireport.taxonomy import getTaxonomy, listTaxonomies
+from mireport.taxonomy import (
+    getTaxonomySupportedLanguages,
+    listTaxonomies,
+    preloadTaxonomies,
+)
 from mireport.xlsx_template_reader.processor import XlsxProcessor
 
 from .blueprints import convert_bp
@@ -74,9 +84,6 @@ def create_app(test_config: Mapping[str, Any] | None = None) -> Flask:
     )
     logging.captureWarnings(True)
 
-    # Get taxonomy related objects loaded
-    loadBuiltInTaxonomyJSON()
-
     app = Flask(__name__, static_folder=None)
     app.config["MAX_CONTENT_LENGTH"] = MAX_FILE_SIZE
     app.config["LOCALE_JSON"] = make_locale_json()
@@ -119,6 +126,42 @@ def create_app(test_config: Mapping[str, Any] | None = None) -> Flask:
             f"Configured to use Arelle offline with {len(taxonomyPackageList)} taxonomy packages: [{', '.join(str(a) for a in sorted(taxonomyPackageList))}]"
         )
 
+    # Arelle work happens in-process, one report at a time, unless a pool of
+    # worker processes has been asked for. Either way the taxonomy packages
+    # are looked for again in TAXONOMY_PACKAGE_DIR as reports come in.
+    workers = app.config["ARELLE_WORKERS"] = int(app.config.get("ARELLE_WORKERS", 0))
+    if workers > 0:
+        maxTasks = app.config.get("ARELLE_WORKER_MAX_TASKS")
+        pool = ArelleWorkerPool(
+            workers=workers,
+            taxonomyPackageDir=app.config.get("TAXONOMY_PACKAGE_DIR"),
+            workOffline=offline,
+            maxTasksPerWorker=int(maxTasks) if maxTasks else None,
+        )
+        app.extensions["arelle_worker_pool"] = pool
+        atexit.register(pool.close)
+        L.info(f"Using a pool of {workers} Arelle worker processes.")
+    else:
+        app.extensions["arelle_processor"] = ArelleReportProcessor(
+            taxonomyPackageDir=app.config.get("TAXONOMY_PACKAGE_DIR"),
+            workOffline=offline,
+        )
+
+    # Optionally remember Arelle results on local disk so identical report
+    # packages (re-downloads, re-uploads) don't need Arelle again.
+    if cacheDir := app.config.get("ARELLE_RESULT_CACHE_DIR"):
+        cacheSize = int(app.config.get("ARELLE_RESULT_CACHE_MAX_BYTES", 512 * 2**20))
+        app.extensions["arelle_result_cache"] = ArelleResultCache(
+            cacheDir, maxBytes=cacheSize
+        )
+        L.info(f"Caching Arelle results in {cacheDir} (up to {cacheSize} bytes).")
+
+    # Taxonomies are otherwise built on first use, separately in every process
+    # serving requests. When this process forks those (gunicorn --preload) it
+    # can build them once for all of them to share instead.
+    if truthy(app.config.get("PRELOAD_TAXONOMIES", False)):
+        preloadTaxonomies()
+
     # Install enumeration classes for use in templates
     app.jinja_env.globals.update(
         {
@@ -226,11 +269,17 @@ def brokenApp() -> Flask:
     return broken
 
 
-def getArelle() -> ArelleReportProcessor:
-    return ArelleReportProcessor(
-        taxonomyPackages=current_app.config["TAXONOMY_PACKAGES"],
-        workOffline=current_app.config["ARELLE_WORK_OFFLINE"],
-    )
+def getArelle() -> (
+    ArelleReportProcessor | ArelleWorkerPool | CachingArelleReportProcessor
+):
+    processor: ArelleReportProcessor | ArelleWorkerPool
+    if (pool := current_app.extensions.get("arelle_worker_pool")) is not None:
+        processor = pool
+    else:
+        processor = current_app.extensions["arelle_processor"]
+    if (cache := current_app.extensions.get("arelle_result_cache")) is not None:
+        return CachingArelleReportProcessor(processor, cache)
+    return processor
 
 
 def format_timedelta(td: timedelta) -> str:
@@ -323,7 +372,7 @@ def add_deployment_header(response: Response) -> Response:
 
 def make_locale_json() -> list[dict[str, str]]:
     allPossibleTaxonomyLanguages: set[str] = {
-        lang for ep in listTaxonomies() for lang in getTaxonomy(ep).supportedLanguages
+        lang for ep in listTaxonomies() for lang in getTaxonomySupportedLanguages(ep)
     }
     localeMetadata = get_locale_list(
         EU_LOCALES,
@@ -548,6 +597,11 @@ def doConversion(conversion: dict, id: str) -> ConversionResults:
             )
 
             report = xl_processor.createReport()
+            # The statistics are for the whole process, not this conversion,
+            # so they are for the server log rather than the user.
+            L.debug(
+                f"Conversion {id}: concept resolution cache: {report.taxonomy.resolveConceptCacheStatistics()}"
+            )
 
             if report.hasPartialFacts and "external_values" not in conversion:
                 label_lang = report.taxonomy.getBestSupportedLanguage(report.language)
@@ -719,12 +773,10 @@ def downloadFile(id: str, ftype: str) -> Response:
         )
 
     if ftype not in session_data:
-        reportPackage = FilelikeAndFileName.from_tuple(session_data["zip"])
-        arelle = getArelle()
         if ftype == "json":
-            session_data[ftype] = arelle.generateXBRLJson(reportPackage).xbrl_json
+            session_data[ftype] = generateArelleOutputs(session_data).xbrl_json
         elif ftype == "viewer":
-            session_data[ftype] = arelle.generateInlineViewer(reportPackage).viewer
+            session_data[ftype] = generateArelleOutputs(session_data).viewer
         else:
             return make_response({"error": "No file found"}, 404)
 
@@ -740,6 +792,21 @@ def downloadFile(id: str, ftype: str) -> Response:
     )
 
 
+def generateArelleOutputs(conversion: dict[str, Any]) -> ArelleProcessingResult:
+    """Create both the viewer and the xBRL-JSON for the conversion's report
+    package in a single Arelle run and store whichever were produced in the
+    conversion, so the other download is ready without reloading the
+    report."""
+    result = getArelle().processReportPackage(
+        FilelikeAndFileName.from_tuple(conversion["zip"])
+    )
+    if result.has_viewer:
+        conversion["viewer"] = result.viewer
+    if result.has_json:
+        conversion["json"] = result.xbrl_json
+    return result
+
+
 def hasConversions() -> bool:
     return bool(getConversions())
 
@@ -791,12 +858,7 @@ def viewer(id: str) -> Response:
     if (existing := conversion.get("viewer")) is not None:
         stuff = FilelikeAndFileName.from_tuple(existing)
     else:
-        stuff = (
-            getArelle()
-            .generateInlineViewer(FilelikeAndFileName.from_tuple(conversion["zip"]))
-            .viewer
-        )
-        conversion["viewer"] = stuff
+        stuff = generateArelleOutputs(conversion).viewer
         if request.method == "HEAD":
             return Response(status=200, headers={"X-File-Ready": "true"})
 
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 import zipfile
 from importlib.metadata import PackageNotFoundError, metadata, version
 from io import BytesIO
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeAlias
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import BinaryIO
 
 from arelle import PackageManager, PluginManager
@@ -16,6 +18,7 @@ from arelle.api.Session import Session
 from arelle.CntlrCmdLine import RuntimeOptions
 
 from mireport.arelle.support import (
+    ArelleLogCollector,
     ArelleProcessingResult,
     ArelleRelatedException,
     ArelleVersionHolder,
@@ -73,19 +76,116 @@ ARELLE_VERSION_INFORMATION = _determineVersionInformation()
 ARELLE_VIEWER_URL = _determineViewerUrl()
 
 
+TaxonomyPackagesFingerprint: TypeAlias = tuple[tuple[str, int, int], ...]
+
+
+def _taxonomyPackagesFingerprint(
+    taxonomyPackages: list[Path],
+) -> TaxonomyPackagesFingerprint:
+    """Identify the current contents of the taxonomy packages by path, size
+    and modification time. Missing files are included so that their return
+    is noticed too."""
+    fingerprint = []
+    for package in taxonomyPackages:
+        try:
+            stat = package.stat()
+            fingerprint.append((str(package), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            fingerprint.append((str(package), -1, -1))
+    return tuple(fingerprint)
+
+
+def _findTaxonomyPackages(taxonomyPackageDir: Path) -> list[Path]:
+    return sorted(
+        candidate
+        for candidate in taxonomyPackageDir.rglob("*.zip")
+        if candidate.is_file()
+    )
+
+
+# How long a look at the taxonomy packages is trusted for before they're
+# looked at again.
+TAXONOMY_PACKAGE_RESCAN_SECONDS = 10.0
+
+
+class _TaxonomyPackages:
+    """The taxonomy packages to give Arelle, shared by the threads processing
+    reports: a fixed list of files or the zips in a directory.
+
+    refresh() looks for (and at) the packages again, but no more than once
+    every rescanSeconds however many requests ask. The packages and their
+    fingerprint are only ever replaced together, under the lock, so callers
+    always get a matching pair.
+    """
+
+    def __init__(
+        self,
+        taxonomyPackages: list[Path] | None,
+        taxonomyPackageDir: str | Path | None,
+        rescanSeconds: float,
+    ):
+        self.directory = (
+            Path(taxonomyPackageDir) if taxonomyPackageDir is not None else None
+        )
+        self.rescanSeconds = rescanSeconds
+        self._lock = threading.Lock()
+        self._packages: tuple[Path, ...] = tuple(taxonomyPackages or ())
+        self._fingerprint: TaxonomyPackagesFingerprint = ()
+        self._nextScan = 0.0
+        self.refresh()
+
+    def current(self) -> tuple[tuple[Path, ...], TaxonomyPackagesFingerprint]:
+        with self._lock:
+            return self._packages, self._fingerprint
+
+    def refresh(self) -> tuple[tuple[Path, ...], TaxonomyPackagesFingerprint]:
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._nextScan:
+                if self.directory is not None:
+                    self._packages = tuple(_findTaxonomyPackages(self.directory))
+                self._fingerprint = _taxonomyPackagesFingerprint(list(self._packages))
+                self._nextScan = now + self.rescanSeconds
+            return self._packages, self._fingerprint
+
+
 class ArelleReportProcessor:
-    """Wrapper around the Arelle Session() API for the various validations and plugins wanted."""
+    """Wrapper around the Arelle Session() API for the various validations and plugins wanted.
+
+    Taxonomy packages are either given as a list of files or found in
+    taxonomyPackageDir. They are looked at again as reports come in (at most
+    every taxonomyPackageRescanSeconds) so packages added to, replaced in or
+    removed from the directory are used without a new processor being needed.
+    """
 
     def __init__(
         self,
         *,
         taxonomyPackages: list[Path] | None = None,
+        taxonomyPackageDir: str | Path | None = None,
+        taxonomyPackageRescanSeconds: float = TAXONOMY_PACKAGE_RESCAN_SECONDS,
         workOffline: bool = True,
+        keepTextLog: bool = False,
     ):
         self.workOffline = bool(workOffline)
-        self.taxonomyPackages: list[Path] = []
-        if taxonomyPackages is not None:
-            self.taxonomyPackages.extend(taxonomyPackages)
+        self._taxonomyPackages = _TaxonomyPackages(
+            taxonomyPackages, taxonomyPackageDir, taxonomyPackageRescanSeconds
+        )
+        self._usedFingerprint = self._taxonomyPackages.current()[1]
+        self.keepTextLog = bool(keepTextLog)
+
+    @property
+    def taxonomyPackages(self) -> list[Path]:
+        return list(self._taxonomyPackages.current()[0])
+
+    @property
+    def taxonomyPackageDir(self) -> Path | None:
+        return self._taxonomyPackages.directory
+
+    def refreshTaxonomyPackages(self) -> TaxonomyPackagesFingerprint:
+        """Identify the current taxonomy packages, looking for them in
+        taxonomyPackageDir again if it's time to."""
+        return self._taxonomyPackages.refresh()[1]
 
     def _run(
         self,
@@ -143,13 +243,15 @@ class ArelleReportProcessor:
                     Session() as session,
                     reportPackage.fileLike() as requestZipStream,
                 ):
+                    collector = ArelleLogCollector(keepTextLog=self.keepTextLog)
                     session.run(
                         options,
                         sourceZipStream=requestZipStream,
                         responseZipStream=responseZipStream,
+                        logHandler=collector,
                         logFilters=[],
                     )
-                    result = ArelleProcessingResult.fromSession(session)
+                    result = collector.finish()
                 assert requestZipStream.closed, "Forgot to close the stream."
                 return result
             except Exception as arelle_exception:
@@ -160,20 +262,23 @@ class ArelleReportProcessor:
     def _makeOptions(
         self,
         *,
+        taxonomyPackages: Iterable[Path] | None = None,
         calcs: str = "c11r",
         plugins: str | None = None,
         pluginOptions: dict | None = None,
     ) -> RuntimeOptions:
         """RuntimeOptions shared by all report processing: validation on
         (calcs 1.1 round-to-nearest unless overridden, UTR, inconsistent
-        duplicate facts warned) and logging to buffer."""
+        duplicate facts warned). Log records go to the ArelleLogCollector
+        _run() hands to Session.run()."""
+        if taxonomyPackages is None:
+            taxonomyPackages = self.taxonomyPackages
         return RuntimeOptions(
             internetConnectivity="offline" if self.workOffline else "online",
             keepOpen=True,
-            logFile="logToBuffer",
             logFormat="%(message)s",
             logPropagate=False,
-            packages=[str(t) for t in self.taxonomyPackages],
+            packages=[str(t) for t in taxonomyPackages],
             plugins=plugins,
             pluginOptions=pluginOptions if pluginOptions is not None else {},
             validate=True,
@@ -186,18 +291,79 @@ class ArelleReportProcessor:
     def validateReportPackage(
         self, source: FilelikeAndFileName, *, disableCalculationValidation: bool = False
     ) -> ArelleProcessingResult:
-        options = self._makeOptions(
-            calcs="none" if disableCalculationValidation else "c11r",
+        return self.processReportPackage(
+            source,
+            viewer=False,
+            xbrlJson=False,
+            disableCalculationValidation=disableCalculationValidation,
         )
-        return self._run(source, options)
 
     def generateXBRLJson(self, source: FilelikeAndFileName) -> ArelleProcessingResult:
+        return self.processReportPackage(source, viewer=False, xbrlJson=True)
+
+    def generateInlineViewer(
+        self, source: FilelikeAndFileName
+    ) -> ArelleProcessingResult:
+        return self.processReportPackage(source, viewer=True, xbrlJson=False)
+
+    def processReportPackage(
+        self,
+        source: FilelikeAndFileName,
+        *,
+        viewer: bool = True,
+        xbrlJson: bool = True,
+        disableCalculationValidation: bool = False,
+    ) -> ArelleProcessingResult:
+        """Validate the report package and, in the same Arelle run, create
+        whichever of the inline viewer and xBRL-JSON are wanted. The DTS and
+        report are only loaded once however many outputs are requested."""
+        taxonomyPackages, fingerprint = self._taxonomyPackages.refresh()
+        if fingerprint != self._usedFingerprint:
+            L.info(
+                f"Taxonomy packages changed; now using {len(taxonomyPackages)} taxonomy packages."
+            )
+            self._usedFingerprint = fingerprint
+        plugins: list[str] = []
+        pluginOptions: dict = {}
+        viewerBytesIO = BytesIO()
+        if viewer:
+            plugins.append("ixbrl-viewer")
+            pluginOptions.update(
+                {
+                    "saveViewerDest": viewerBytesIO,
+                    "viewer_feature_review": False,
+                    "validationMessages": True,
+                    "viewer_feature_highlight_facts_on_startup": False,
+                    "useStubViewer": False,
+                    "viewerNoCopyScript": True,
+                    "viewerURL": ARELLE_VIEWER_URL,
+                }
+            )
+        if xbrlJson:
+            # The viewer is written to saveViewerDest so the response zip only
+            # ever holds the xBRL-JSON.
+            plugins.append("saveLoadableOIM")
+            pluginOptions["saveLoadableOIM"] = "report.json"
         options = self._makeOptions(
-            plugins="saveLoadableOIM",
-            pluginOptions={"saveLoadableOIM": "report.json"},
+            taxonomyPackages=taxonomyPackages,
+            calcs="none" if disableCalculationValidation else "c11r",
+            plugins="|".join(plugins) if plugins else None,
+            pluginOptions=pluginOptions,
         )
-        jsonBytesIO = BytesIO()
+        jsonBytesIO = BytesIO() if xbrlJson else None
         result = self._run(source, options, jsonBytesIO)
+        if jsonBytesIO is not None:
+            self._attachXBRLJson(result, source, jsonBytesIO)
+        if viewer:
+            self._attachViewer(result, source, viewerBytesIO)
+        return result
+
+    @staticmethod
+    def _attachXBRLJson(
+        result: ArelleProcessingResult,
+        source: FilelikeAndFileName,
+        jsonBytesIO: BytesIO,
+    ) -> None:
         try:
             json = _singleFileFromResponseZip(
                 jsonBytesIO, "Arelle xBRL JSON generation"
@@ -208,25 +374,13 @@ class ArelleReportProcessor:
             )
         except Exception as e:
             result.addException(e)
-        return result
 
-    def generateInlineViewer(
-        self, source: FilelikeAndFileName
-    ) -> ArelleProcessingResult:
-        viewerBytesIO = BytesIO()
-        options = self._makeOptions(
-            plugins="ixbrl-viewer",
-            pluginOptions={
-                "saveViewerDest": viewerBytesIO,
-                "viewer_feature_review": False,
-                "validationMessages": True,
-                "viewer_feature_highlight_facts_on_startup": False,
-                "useStubViewer": False,
-                "viewerNoCopyScript": True,
-                "viewerURL": ARELLE_VIEWER_URL,
-            },
-        )
-        result = self._run(source, options)
+    @staticmethod
+    def _attachViewer(
+        result: ArelleProcessingResult,
+        source: FilelikeAndFileName,
+        viewerBytesIO: BytesIO,
+    ) -> None:
         try:
             viewer = _singleFileFromResponseZip(viewerBytesIO, "Arelle & inline-viewer")
             viewerFilename = f"{PurePath(source.filename).stem}_viewer.html"
@@ -238,7 +392,6 @@ class ArelleReportProcessor:
                 e,
                 message="Exception encountered during processing of Arelle's response stream",
             )
-        return result
 
     @staticmethod
     def getTaxonomyPackagesFromDir(
@@ -247,10 +400,7 @@ class ArelleReportProcessor:
         if taxonomyPackageDir is None:
             return []
 
-        tdir = Path(taxonomyPackageDir)
-        taxonomyPackages = [
-            candidate for candidate in tdir.rglob("*.zip") if candidate.is_file()
-        ]
+        taxonomyPackages = _findTaxonomyPackages(Path(taxonomyPackageDir))
         if not taxonomyPackages:
             raise ArelleRelatedException(
                 f"Supplied {taxonomyPackageDir=} does not contain any taxonomy packages."
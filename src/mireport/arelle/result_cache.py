@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import msgpack
+
+if TYPE_CHECKING:
+    from mireport.arelle.worker_pool import ArelleWorkerPool
+
+from mireport.arelle.report_info import (
+    ARELLE_VERSION_INFORMATION,
+    ARELLE_VIEWER_URL,
+    ArelleReportProcessor,
+)
+from mireport.arelle.support import ArelleProcessingResult
+from mireport.filesupport import FilelikeAndFileName
+
+L = logging.getLogger(__name__)
+
+_CACHE_SUFFIX = ".arelle"
+
+
+class ArelleResultCache:
+    """Size-bounded, least-recently-used cache of ArelleProcessingResult
+    objects on local disk.
+
+    One file per result, named by its key. A hit refreshes the file's
+    modification time; when the total size exceeds ``maxBytes`` the files
+    used longest ago are removed. Files are written atomically so several
+    processes can share the directory.
+    """
+
+    def __init__(self, directory: str | Path, *, maxBytes: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.maxBytes = maxBytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_CACHE_SUFFIX}"
+
+    def get(self, key: str) -> ArelleProcessingResult | None:
+        path = self._path(key)
+        try:
+            packed = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        try:
+            return ArelleProcessingResult.fromDict(msgpack.unpackb(packed, raw=False))
+        except (KeyError, TypeError, ValueError, msgpack.UnpackException) as e:
+            L.warning(f"Discarding unreadable cached Arelle result {path}", exc_info=e)
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, result: ArelleProcessingResult) -> None:
+        path = self._path(key)
+        packed = msgpack.packb(result.toDict(), use_bin_type=True)
+        if len(packed) > self.maxBytes:
+            L.info(f"Arelle result too large to cache ({len(packed)} bytes).")
+            return
+        temp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            temp.write_bytes(packed)
+            os.replace(temp, path)
+        finally:
+            # Only still there if writing or replacing failed (a full disk,
+            # say). Eviction would never find it.
+            temp.unlink(missing_ok=True)
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for candidate in self.directory.glob(f"*{_CACHE_SUFFIX}"):
+                try:
+                    stat = candidate.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, candidate))
+            total = sum(size for _, size, _ in entries)
+            for _, size, candidate in sorted(entries):
+                if total <= self.maxBytes:
+                    break
+                candidate.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for candidate in self.directory.glob(f"*{_CACHE_SUFFIX}"):
+                candidate.unlink(missing_ok=True)
+
+
+class CachingArelleReportProcessor:
+    """Puts an ArelleResultCache in front of an ArelleReportProcessor (or an
+    ArelleWorkerPool) so identical report packages, processed with the same
+    Arelle version, taxonomy packages and options, skip Arelle entirely.
+
+    Results that recorded exceptions are never cached.
+    """
+
+    def __init__(
+        self,
+        processor: ArelleReportProcessor | ArelleWorkerPool,
+        cache: ArelleResultCache,
+    ):
+        self.processor = processor
+        self.cache = cache
+
+    def _makeKey(
+        self,
+        source: FilelikeAndFileName,
+        *,
+        viewer: bool,
+        xbrlJson: bool,
+        disableCalculationValidation: bool,
+    ) -> str:
+        h = hashlib.sha256()
+        h.update(source.fileContent)
+        context = (
+            source.filename,
+            str(ARELLE_VERSION_INFORMATION),
+            ARELLE_VIEWER_URL,
+            self.processor.workOffline,
+            self.processor.keepTextLog,
+            self.processor.refreshTaxonomyPackages(),
+            viewer,
+            xbrlJson,
+            disableCalculationValidation,
+        )
+        h.update(repr(context).encode("utf-8"))
+        return h.hexdigest()
+
+    def processReportPackage(
+        self,
+        source: FilelikeAndFileName,
+        *,
+        viewer: bool = True,
+        xbrlJson: bool = True,
+        disableCalculationValidation: bool = False,
+    ) -> ArelleProcessingResult:
+        key = self._makeKey(
+            source,
+            viewer=viewer,
+            xbrlJson=xbrlJson,
+            disableCalculationValidation=disableCalculationValidation,
+        )
+        if (cached := self.cache.get(key)) is not None:
+            L.debug(f"Using cached Arelle result for {source}")
+            return cached
+        result = self.processor.processReportPackage(
+            source,
+            viewer=viewer,
+            xbrlJson=xbrlJson,
+            disableCalculationValidation=disableCalculationValidation,
+        )
+        if not result.has_exceptions:
+            try:
+                self.cache.put(key, result)
+            except OSError as e:
+                L.warning("Failed to cache Arelle result", exc_info=e)
+        return result
+
+    def validateReportPackage(
+        self, source: FilelikeAndFileName, *, disableCalculationValidation: bool = False
+    ) -> ArelleProcessingResult:
+        return self.processReportPackage(
+            source,
+            viewer=False,
+            xbrlJson=False,
+            disableCalculationValidation=disableCalculationValidation,
+        )
+
+    def generateXBRLJson(self, source: FilelikeAndFileName) -> ArelleProcessingResult:
+        return self.processReportPackage(source, viewer=False, xbrlJson=True)
+
+    def generateInlineViewer(
+        self, source: FilelikeAndFileName
+    ) -> ArelleProcessingResult:
+        return self.processReportPackage(source, viewer=True, xbrlJson=False)
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Any, ClassVar, Self
 
-from arelle.api.Session import Session
+from arelle.logging.formatters.LogFormatter import LogFormatter
 from arelle.ModelValue import QName
 from arelle.ModelXbrl import ModelXbrl
 
@@ -72,66 +72,52 @@ class ArelleProcessingResult:
         self._exceptions: list[Exception] = []
         self._diagnostics: list[Diagnostic] = []
 
-    @classmethod
-    def fromSession(cls, session: Session) -> Self:
-        jsonLog = session.get_logs("json", clear_logs=False)
-        textLog = session.get_logs("text", clear_logs=True)
-        return cls.fromArelleLogs(jsonLog, textLog.split("\n"))
-
-    @classmethod
-    def fromArelleLogs(cls, jsonMessages: str, textLogLines: list[str]) -> Self:
-        result = cls()
-        result._textLogLines = list(textLogLines)
-        result._importArelleMessages(jsonMessages)
-        return result
-
-    def _importArelleMessages(self, json_str: str) -> None:
-        wantDebug = L.isEnabledFor(logging.DEBUG)
-        records: list[dict] = json.loads(json_str)["log"]
-        for r in records:
-            code: str = r.get("code", "")
-            level: str = r.get("level", "")
-            text: str = r.get("message", {}).get("text", "")
-            fact: str | None = r.get("message", {}).get("fact")
-
-            if wantDebug:
-                L.debug(f"Record: {r=}")
-
-            if code not in ("", "info"):
-                # A coded record is an XBRL validation message. Its severity
-                # is the worse of the log level and any level embedded in the
-                # code itself.
-                level_severity = Severity.fromLogLevelString(
-                    level, default=Severity.WARNING
-                )
-                code_severity = Severity.fromLogLevelString(code, default=Severity.INFO)
-                self._validationMessages.append(
-                    Message(
-                        messageText=f"[{code}] {text}",
-                        severity=max(level_severity, code_severity, key=Severity.key),
-                        messageType=MessageType.XbrlValidation,
-                        conceptQName=fact,
-                    )
+    @staticmethod
+    def _isValidationCode(code: str) -> bool:
+        return code not in ("", "info")
+
+    @staticmethod
+    def _validationSeverity(code: str, level: str) -> Severity:
+        """A coded record is an XBRL validation message. Its severity is the
+        worse of the log level and any level embedded in the code itself."""
+        level_severity = Severity.fromLogLevelString(level, default=Severity.WARNING)
+        code_severity = Severity.fromLogLevelString(code, default=Severity.INFO)
+        return max(level_severity, code_severity, key=Severity.key)
+
+    def _importRecord(
+        self, *, code: str, level: str, text: str, fact: str | None = None
+    ) -> None:
+        if L.isEnabledFor(logging.DEBUG):
+            L.debug(f"Record: {code=} {level=} {text=} {fact=}")
+
+        if self._isValidationCode(code):
+            self._validationMessages.append(
+                Message(
+                    messageText=f"[{code}] {text}",
+                    severity=self._validationSeverity(code, level),
+                    messageType=MessageType.XbrlValidation,
+                    conceptQName=fact,
                 )
-            elif code == "" or any(
-                fragment in text for fragment in self._INTERESTING_LOG_MESSAGE_FRAGMENTS
-            ):
-                self._validationMessages.append(
-                    Message(
-                        messageText=text,
-                        severity=Severity.INFO,
-                        messageType=MessageType.DevInfo,
-                    )
+            )
+        elif code == "" or any(
+            fragment in text for fragment in self._INTERESTING_LOG_MESSAGE_FRAGMENTS
+        ):
+            self._validationMessages.append(
+                Message(
+                    messageText=text,
+                    severity=Severity.INFO,
+                    messageType=MessageType.DevInfo,
                 )
-            elif text.startswith(self._UNINTERESTING_LOG_MESSAGE_PREFIXES):
-                if wantDebug:
-                    L.debug(
-                        f"Ignoring uninteresting Arelle log message: {code=} {level=} {text=} {fact=}"
-                    )
-            else:
-                L.warning(
-                    f"Unexpected Arelle log message: {code=} {level=} {text=} {fact=}"
+            )
+        elif text.startswith(self._UNINTERESTING_LOG_MESSAGE_PREFIXES):
+            if L.isEnabledFor(logging.DEBUG):
+                L.debug(
+                    f"Ignoring uninteresting Arelle log message: {code=} {level=} {text=} {fact=}"
                 )
+        else:
+            L.warning(
+                f"Unexpected Arelle log message: {code=} {level=} {text=} {fact=}"
+            )
 
     @property
     def viewer(self) -> FilelikeAndFileName:
@@ -165,6 +151,27 @@ class ArelleProcessingResult:
     def log_lines(self) -> list[str]:
         return list(self._textLogLines)
 
+    def toDict(self) -> dict:
+        """Serialisable form of the messages, log lines and outputs. Exceptions
+        and diagnostics are not included."""
+        return {
+            "m": [m.toDict() for m in self._validationMessages],
+            "l": list(self._textLogLines),
+            "v": tuple(self._viewer) if self._viewer is not None else None,
+            "j": tuple(self._xbrlJson) if self._xbrlJson is not None else None,
+        }
+
+    @classmethod
+    def fromDict(cls, stuff: dict) -> Self:
+        result = cls()
+        result._validationMessages = [Message.fromDict(m) for m in stuff["m"]]
+        result._textLogLines = list(stuff["l"])
+        if (viewer := stuff["v"]) is not None:
+            result._viewer = FilelikeAndFileName.from_tuple(viewer)
+        if (xbrlJson := stuff["j"]) is not None:
+            result._xbrlJson = FilelikeAndFileName.from_tuple(xbrlJson)
+        return result
+
     def addDiagnostics(self, diagnostics: Iterable[Diagnostic]) -> None:
         self._diagnostics.extend(diagnostics)
 
@@ -186,6 +193,72 @@ class ArelleProcessingResult:
         )
 
 
+class ArelleLogCollector(logging.Handler):
+    """Log handler, passed to Session.run(), that turns Arelle's log records
+    into an ArelleProcessingResult's messages as they are emitted. This
+    avoids Arelle buffering every record and rendering the buffer as JSON
+    and text for us to parse afterwards.
+
+    Text log lines are only kept if asked for. At most
+    ``maxMessagesPerCode`` validation messages are kept for any one code;
+    the rest are counted and summarised by finish().
+    """
+
+    DEFAULT_MAX_MESSAGES_PER_CODE: ClassVar[int] = 100
+
+    def __init__(
+        self,
+        *,
+        keepTextLog: bool = False,
+        maxMessagesPerCode: int | None = DEFAULT_MAX_MESSAGES_PER_CODE,
+    ):
+        super().__init__()
+        self.setFormatter(LogFormatter("%(message)s"))
+        self.keepTextLog = keepTextLog
+        self.maxMessagesPerCode = maxMessagesPerCode
+        self._result = ArelleProcessingResult()
+        self._messagesPerCode: Counter[str] = Counter()
+        self._suppressed: dict[str, tuple[int, Severity]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            code: str = getattr(record, "messageCode", "") or ""
+            level = record.levelname.lower()
+            if (
+                self.maxMessagesPerCode is not None
+                and ArelleProcessingResult._isValidationCode(code)
+            ):
+                self._messagesPerCode[code] += 1
+                if self._messagesPerCode[code] > self.maxMessagesPerCode:
+                    self._suppress(code, level)
+                    return
+            text = self.format(record)
+            if self.keepTextLog:
+                self._result._textLogLines.append(text)
+            self._result._importRecord(code=code, level=level, text=text)
+        except Exception:  # noqa: BLE001 - logging handlers must not raise
+            self.handleError(record)
+
+    def _suppress(self, code: str, level: str) -> None:
+        severity = ArelleProcessingResult._validationSeverity(code, level)
+        count, worst = self._suppressed.get(code, (0, severity))
+        self._suppressed[code] = (count + 1, max(worst, severity, key=Severity.key))
+
+    def finish(self) -> ArelleProcessingResult:
+        """Return the result, with a summary message for each code that
+        produced more messages than were kept."""
+        for code, (count, worst) in self._suppressed.items():
+            self._result._validationMessages.append(
+                Message(
+                    messageText=f"[{code}] +{count:,} more message{'s' if count != 1 else ''} with this code not shown.",
+                    severity=worst,
+                    messageType=MessageType.XbrlValidation,
+                )
+            )
+        self._suppressed.clear()
+        return self._result
+
+
 class ArelleObjectJSONEncoder(json.JSONEncoder):
     """Serialises Arelle QName *values* as strings. QName mapping *keys* are
     not handled (json.dump raises TypeError): the Taxonomy payload has its
@@ -12,8 +12,10 @@ plugin decides where to put it.
 from __future__ import annotations
 
 import json
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
 from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple, TypeVar
 
@@ -41,6 +43,7 @@ from mireport.arelle.support import (
     ArelleQNameCanonicaliser,
     ArelleRelatedException,
 )
+from mireport.stringutil import format_time_ns
 
 T = TypeVar("T")
 
@@ -140,6 +143,15 @@ class UTRInfoExtractor:
 
 
 class TaxonomyInfoExtractor:
+    EXTRACTION_PHASES = (
+        "presentation",
+        "dimensions",
+        "concepts",
+        "labels",
+        "references",
+        "namespaces",
+    )
+
     def __init__(self, cntlr: Cntlr, options: RuntimeOptions, modelXbrl: ModelXbrl):
         self.cntlr: Cntlr = cntlr
         self.options: RuntimeOptions = options
@@ -154,20 +166,44 @@ class TaxonomyInfoExtractor:
         )
         self.dimensionDefaults: dict[ModelConcept, ModelConcept] = {}
         self.elr_hypercube_dimension_seen: set[str] = set()
+        # Nanoseconds spent in each phase of extract().
+        self.phaseTimings: Counter[str] = Counter(
+            dict.fromkeys(self.EXTRACTION_PHASES, 0)
+        )
+
+    @contextmanager
+    def timedPhase(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.phaseTimings[phase] += time.perf_counter_ns() - start
 
     def extract(self) -> dict[str, Any]:
         """Extract the taxonomy information and return it as a JSON-ready
         dict with all QNames canonicalised to strings."""
         self.taxonomyJson["entryPoint"] = self.options.entrypointFile
 
-        self.extractPresentation()
-        self.extractDimensionDefaults()
-        self.extractDimensionDefinitions()
+        with self.timedPhase("presentation"):
+            self.extractPresentation()
+        with self.timedPhase("dimensions"):
+            self.extractDimensionDefaults()
+            self.extractDimensionDefinitions()
         self.extractConceptsAndMetadata()
 
-        self.cntlr.addToLog("Processing namespaces and namespace prefixes")
-        self.taxonomyJson = self.qnameConverter.convertRecursive(self.taxonomyJson)
-        self.taxonomyJson["namespaces"] = self.qnameConverter.getNamespacePrefixMap()
+        with self.timedPhase("namespaces"):
+            self.cntlr.addToLog("Processing namespaces and namespace prefixes")
+            self.taxonomyJson = self.qnameConverter.convertRecursive(self.taxonomyJson)
+            self.taxonomyJson["namespaces"] = (
+                self.qnameConverter.getNamespacePrefixMap()
+            )
+        self.cntlr.addToLog(
+            "Extraction phase timings: "
+            + ", ".join(
+                f"{phase} {format_time_ns(ns)}"
+                for phase, ns in self.phaseTimings.items()
+            )
+        )
         return self.taxonomyJson
 
     def walkDefinitionChildren(
@@ -576,6 +612,12 @@ class TaxonomyInfoExtractor:
 
     def extractConceptsAndMetadata(self) -> None:
         self.cntlr.addToLog("Processing concepts (including labels and references)")
+        start = time.perf_counter_ns()
+        # Labels and references are timed on their own; the "concepts" phase
+        # is whatever is left over.
+        labelsAndReferencesBefore = (
+            self.phaseTimings["labels"] + self.phaseTimings["references"]
+        )
         for qname, concept in self.model.itemConcepts():
             dataType, baseDataType = self.model.typeQNamesOf(concept)
             jconcept: dict[str, Any] = {
@@ -584,8 +626,10 @@ class TaxonomyInfoExtractor:
                 "periodType": concept.periodType,
             }
             self.addConceptMetadata(concept, jconcept)
-            self.addLabels(concept, jconcept)
-            self.addReferences(concept, jconcept)
+            with self.timedPhase("labels"):
+                self.addLabels(concept, jconcept)
+            with self.timedPhase("references"):
+                self.addReferences(concept, jconcept)
 
             if concept.isEnumeration and not concept.isEnumeration2Item:
                 self.diagnostics.emit(
@@ -617,6 +661,14 @@ class TaxonomyInfoExtractor:
                     self.model.typedDomainQNameOf(concept)
                 )
             self.taxonomyJson["concepts"][qname] = jconcept
+        labelsAndReferences = (
+            self.phaseTimings["labels"]
+            + self.phaseTimings["references"]
+            - labelsAndReferencesBefore
+        )
+        self.phaseTimings["concepts"] += (
+            time.perf_counter_ns() - start - labelsAndReferences
+        )
 
     def extractDimensionDefinitions(self) -> None:
         self.cntlr.addToLog("Processing dimensions")
@@ -13,9 +13,12 @@ Session API, or pass this file to ``arelleCmdLine --plugins``.
 
 from __future__ import annotations
 
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 from arelle.api.Session import Session
 from arelle.Cntlr import Cntlr
@@ -26,6 +29,7 @@ from arelle.utils.PluginData import PluginData
 import mireport
 from mireport.arelle.diagnostics import DiagnosticCollector
 from mireport.arelle.support import (
+    ArelleLogCollector,
     ArelleProcessingResult,
     ArelleRelatedException,
 )
@@ -37,7 +41,6 @@ from mireport.arelle.taxonomy_extraction import (
 from mireport.version import VersionInformationTuple
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from typing import Any
 
 
@@ -71,7 +74,6 @@ def callArelleForTaxonomyInfo(
         internetConnectivity="offline",
         formulaAction="none",
         keepOpen=False,
-        logFile="logToBuffer",
         logFormat="%(message)s",
         logPropagate=False,
         packages=taxonomy_zips,
@@ -81,18 +83,68 @@ def callArelleForTaxonomyInfo(
         utrValidate=utrValidation,
     )
     try:
+        # Extraction is a developer task: keep every message and the text log.
+        collector = ArelleLogCollector(keepTextLog=True, maxMessagesPerCode=None)
         with Session() as session:
             session.run(
                 options,
+                logHandler=collector,
                 logFilters=[],
             )
-            results = ArelleProcessingResult.fromSession(session)
+        results = collector.finish()
     finally:
         diagnostics = DiagnosticCollector.close(diagnosticsToken)
     results.addDiagnostics(diagnostics)
     return results
 
 
+class TaxonomyInfoJob(NamedTuple):
+    """One entry point to extract and where to write the results."""
+
+    entry_point: str
+    taxonomy_json_path: Path | str
+    utr_json_path: Path | str | None = None
+
+
+def callArelleForTaxonomyInfoInParallel(
+    jobs: list[TaxonomyInfoJob],
+    taxonomy_zips: list[str],
+    *,
+    workers: int | None = None,
+) -> dict[str, ArelleProcessingResult]:
+    """Run callArelleForTaxonomyInfo() for each job concurrently, each in its
+    own process (Arelle allows only one Session per process). All jobs read
+    the same taxonomy packages. Returns the results keyed by entry point, in
+    job order."""
+    if not jobs:
+        return {}
+    if len(jobs) == 1:
+        [job] = jobs
+        return {
+            job.entry_point: callArelleForTaxonomyInfo(
+                job.entry_point,
+                taxonomy_zips,
+                job.taxonomy_json_path,
+                job.utr_json_path,
+            )
+        }
+    workers = max(1, min(workers or len(jobs), len(jobs)))
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = {
+            job.entry_point: pool.submit(
+                callArelleForTaxonomyInfo,
+                job.entry_point,
+                taxonomy_zips,
+                str(job.taxonomy_json_path),
+                str(job.utr_json_path) if job.utr_json_path is not None else None,
+            )
+            for job in jobs
+        }
+        return {entry_point: future.result() for entry_point, future in futures.items()}
+
+
 @dataclass
 class TaxonomyInfoPluginData(PluginData):
     Taxonomy: dict = field(default_factory=dict)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+from mireport.arelle.report_info import (
+    TAXONOMY_PACKAGE_RESCAN_SECONDS,
+    ArelleReportProcessor,
+    TaxonomyPackagesFingerprint,
+    _TaxonomyPackages,
+)
+from mireport.arelle.support import ArelleProcessingResult, ArelleRelatedException
+from mireport.filesupport import FilelikeAndFileName
+
+L = logging.getLogger(__name__)
+
+# The processor owned by a worker process. Set once by _initialiseWorker() and
+# then reused for every task the worker runs.
+_WORKER_PROCESSOR: ArelleReportProcessor | None = None
+
+
+def _initialiseWorker(
+    taxonomyPackages: list[Path], workOffline: bool, keepTextLog: bool
+) -> None:
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = ArelleReportProcessor(
+        taxonomyPackages=taxonomyPackages,
+        workOffline=workOffline,
+        keepTextLog=keepTextLog,
+    )
+
+
+def _runInWorker(
+    methodName: str, source: FilelikeAndFileName, kwargs: dict[str, Any]
+) -> ArelleProcessingResult:
+    if _WORKER_PROCESSOR is None:
+        raise ArelleRelatedException("Arelle worker process was not initialised.")
+    method = getattr(_WORKER_PROCESSOR, methodName)
+    return method(source, **kwargs)
+
+
+class ArelleWorkerPool:
+    """Pool of long-lived Arelle worker processes.
+
+    Arelle is not thread safe so, in-process, ArelleReportProcessor serialises
+    every call behind the BIG_ARELLE_LOCK. Each worker here is a separate
+    process with its own Arelle state (and so its own Session) meaning up to
+    ``workers`` reports are processed concurrently. Report packages are sent
+    to the workers and ArelleProcessingResult objects sent back, both by
+    pickling.
+
+    Workers stay warm between requests (Arelle, its plugins and lxml are
+    imported once per worker, not per report) for as long as the taxonomy
+    package files are unchanged. If any of them is replaced, added back or
+    removed, or (given a taxonomyPackageDir) a package is added to the
+    directory, the workers are retired, finishing any requests in flight, and
+    new ones started with the current packages. The packages are looked at
+    again at most every taxonomyPackageRescanSeconds.
+
+    Offers the same processing methods as ArelleReportProcessor so either can
+    be used by callers. A worker that dies (crash, OOM kill) breaks the
+    executor; the request in flight fails and the pool is replaced so later
+    requests are unaffected.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        taxonomyPackages: list[Path] | None = None,
+        taxonomyPackageDir: str | Path | None = None,
+        taxonomyPackageRescanSeconds: float = TAXONOMY_PACKAGE_RESCAN_SECONDS,
+        workOffline: bool = True,
+        keepTextLog: bool = False,
+        maxTasksPerWorker: int | None = None,
+    ):
+        if workers < 1:
+            raise ArelleRelatedException(
+                f"An Arelle worker pool needs at least one worker ({workers=})."
+            )
+        if maxTasksPerWorker is not None and maxTasksPerWorker < 1:
+            raise ArelleRelatedException(
+                f"Workers must be allowed to run at least one task ({maxTasksPerWorker=})."
+            )
+        self.workers = workers
+        self.maxTasksPerWorker = maxTasksPerWorker
+        self.workOffline = bool(workOffline)
+        self.keepTextLog = bool(keepTextLog)
+        self._taxonomyPackages = _TaxonomyPackages(
+            taxonomyPackages, taxonomyPackageDir, taxonomyPackageRescanSeconds
+        )
+        self._executorLock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._executorFingerprint: TaxonomyPackagesFingerprint | None = None
+
+    @property
+    def taxonomyPackages(self) -> list[Path]:
+        return list(self._taxonomyPackages.current()[0])
+
+    @property
+    def taxonomyPackageDir(self) -> Path | None:
+        return self._taxonomyPackages.directory
+
+    def refreshTaxonomyPackages(self) -> TaxonomyPackagesFingerprint:
+        """Identify the current taxonomy packages, looking for them in
+        taxonomyPackageDir again if it's time to."""
+        return self._taxonomyPackages.refresh()[1]
+
+    def _makeExecutor(self, taxonomyPackages: list[Path]) -> ProcessPoolExecutor:
+        # Always spawn: forking a multi-threaded webapp process (and Arelle's
+        # module level state) is not safe.
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialiseWorker,
+            initargs=(taxonomyPackages, self.workOffline, self.keepTextLog),
+            max_tasks_per_child=self.maxTasksPerWorker,
+        )
+
+    def _getExecutor(self) -> ProcessPoolExecutor:
+        taxonomyPackages, fingerprint = self._taxonomyPackages.refresh()
+        retired: ProcessPoolExecutor | None = None
+        with self._executorLock:
+            if self._executor is not None and fingerprint != self._executorFingerprint:
+                L.info("Taxonomy packages changed; replacing Arelle worker processes.")
+                retired, self._executor = self._executor, None
+            if self._executor is None:
+                self._executor = self._makeExecutor(list(taxonomyPackages))
+                self._executorFingerprint = fingerprint
+            executor = self._executor
+        if retired is not None:
+            retired.shutdown(wait=False)
+        return executor
+
+    def _discardExecutor(self, broken: ProcessPoolExecutor) -> None:
+        with self._executorLock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(
+        self, methodName: str, source: FilelikeAndFileName, **kwargs: Any
+    ) -> ArelleProcessingResult:
+        executor = self._getExecutor()
+        try:
+            return executor.submit(_runInWorker, methodName, source, kwargs).result()
+        except BrokenProcessPool as broken:
+            L.error(
+                f"Arelle worker pool broken during {methodName}; replacing it.",
+                exc_info=broken,
+            )
+            self._discardExecutor(executor)
+            raise ArelleRelatedException(
+                "Arelle worker process died while processing the report."
+            ) from broken
+
+    def validateReportPackage(
+        self, source: FilelikeAndFileName, *, disableCalculationValidation: bool = False
+    ) -> ArelleProcessingResult:
+        return self._submit(
+            "validateReportPackage",
+            source,
+            disableCalculationValidation=disableCalculationValidation,
+        )
+
+    def generateXBRLJson(self, source: FilelikeAndFileName) -> ArelleProcessingResult:
+        return self._submit("generateXBRLJson", source)
+
+    def generateInlineViewer(
+        self, source: FilelikeAndFileName
+    ) -> ArelleProcessingResult:
+        return self._submit("generateInlineViewer", source)
+
+    def processReportPackage(
+        self,
+        source: FilelikeAndFileName,
+        *,
+        viewer: bool = True,
+        xbrlJson: bool = True,
+        disableCalculationValidation: bool = False,
+    ) -> ArelleProcessingResult:
+        return self._submit(
+            "processReportPackage",
+            source,
+            viewer=viewer,
+            xbrlJson=xbrlJson,
+            disableCalculationValidation=disableCalculationValidation,
+        )
+
+    def close(self) -> None:
+        """Shut down the worker processes. The pool starts new ones if used
+        again."""
+        with self._executorLock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -9,7 +9,7 @@ from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Iterator, Mapping
     from collections.abc import Set as AbstractSet
     from types import TracebackType
     from typing import Self
@@ -160,6 +160,74 @@ class Message:
         return d
 
 
+class CellSet:
+    """A set of (sheetName, row, column) cells, such as the cells a conversion
+    has read.
+
+    Held as a bitmap of columns for each row of each sheet, so that adding a
+    whole range costs a step per row rather than a tuple per cell, and kept
+    count of as it grows, so len() is O(1).
+    """
+
+    __slots__ = ("_count", "_sheets")
+
+    def __init__(self, cells: Iterable[tuple[str, int, int]] = ()) -> None:
+        self._sheets: dict[str, dict[int, int]] = {}
+        self._count = 0
+        self.update(cells)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, cell: object) -> bool:
+        if not isinstance(cell, tuple) or len(cell) != 3:
+            return False
+        sheetName, row, column = cell
+        return bool(self._sheets.get(sheetName, {}).get(row, 0) >> column & 1)
+
+    def __iter__(self) -> Iterator[tuple[str, int, int]]:
+        """Every cell, sheet by sheet (in the order first added), then row by
+        row and column by column."""
+        for sheetName, rows in self._sheets.items():
+            for row in sorted(rows):
+                columns = rows[row]
+                while columns:
+                    lowest = columns & -columns
+                    yield sheetName, row, lowest.bit_length() - 1
+                    columns ^= lowest
+
+    def add(self, sheetName: str, row: int, column: int) -> None:
+        self._addToRow(self._sheets.setdefault(sheetName, {}), row, 1 << column)
+
+    def addRange(
+        self, sheetName: str, minRow: int, minCol: int, maxRow: int, maxCol: int
+    ) -> None:
+        """Add every cell from (minRow, minCol) to (maxRow, maxCol) inclusive."""
+        if maxRow < minRow or maxCol < minCol:
+            return
+        rows = self._sheets.setdefault(sheetName, {})
+        columns = ((1 << (maxCol - minCol + 1)) - 1) << minCol
+        for row in range(minRow, maxRow + 1):
+            self._addToRow(rows, row, columns)
+
+    def update(self, cells: Iterable[tuple[str, int, int]]) -> None:
+        """Add cells, which can be another CellSet."""
+        if isinstance(cells, CellSet):
+            for sheetName, otherRows in cells._sheets.items():
+                rows = self._sheets.setdefault(sheetName, {})
+                for row, columns in otherRows.items():
+                    self._addToRow(rows, row, columns)
+            return
+        for sheetName, row, column in cells:
+            self.add(sheetName, row, column)
+
+    def _addToRow(self, rows: dict[int, int], row: int, columns: int) -> None:
+        existing = rows.get(row, 0)
+        if added := columns & ~existing:
+            rows[row] = existing | added
+            self._count += added.bit_count()
+
+
 class ConversionResults:
     def __init__(
         self,
@@ -305,8 +373,8 @@ class ConversionResultsBuilder(ConversionResults):
         else:
             self.conversionId = str(uuid.uuid4())
         self.messages: list[Message] = []
-        self.cellsQueriedBuilder: set[tuple[str, int, int]] = set()
-        self.cellsPopulatedBuilder: set[tuple[str, int, int]] = set()
+        self.cellsQueriedBuilder = CellSet()
+        self.cellsPopulatedBuilder = CellSet()
         self.consoleOutput = consoleOutput
 
     def addCellQueries(self, delta: Iterable[tuple[str, int, int]]) -> Self:
@@ -51,5 +51,9 @@ class OpenPyXlRelatedException(MIReportException):
     """Exception raised when dealing with an issue in OpenPyXL"""
 
 
+class SpreadsheetMLException(MIReportException):
+    """Exception raised when an Excel file can't be read directly as SpreadsheetML."""
+
+
 class EarlyAbortException(MIReportException):
     """Exception raised when a required field is missing in the report."""
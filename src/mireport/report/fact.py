@@ -255,14 +255,14 @@ class Fact:
         return symbol
 
     def hasTaxonomyDimensions(self) -> bool:
-        for name in self.aspects:
+        for name in self._aspects:
             if isinstance(name, QName):
                 return True
         return False
 
     def getTaxonomyDimensions(self) -> dict[QName, QName]:
         dims: dict[QName, QName] = {}
-        for name, value in self.aspects.items():
+        for name, value in self._aspects.items():
             if isinstance(name, QName):
                 if not isinstance(value, QName):
                     raise InlineReportException(
@@ -276,18 +276,28 @@ class FactBuilder:
             raise InlineReportException(
                 "Concept must be set before validating a FactBuilder.", self
             )
-        neededTds = taxonomy.getTypedDimensionsForPrimaryItem(self._concept)
-        setTds = frozenset(typedDims)
-        neededButNotSet = neededTds - setTds
-        setButNotNeeded = setTds - neededTds
-        if setButNotNeeded:
-            dim_list = ", ".join(str(a.qname) for a in setButNotNeeded)
+        # Dimensions from outside the taxonomy have no bit, so would otherwise
+        # go unnoticed.
+        if unknown := [d for d in typedDims if not taxonomy.conceptBit(d)]:
+            dim_list = ", ".join(str(a.qname) for a in unknown)
             raise InlineReportException(
                 f"Unexpected typed dimension(s) [{dim_list}] set on FactBuilder for {self._concept}",
                 self,
             )
-        if neededButNotSet:
-            dim_list = ", ".join(str(a.qname) for a in neededButNotSet)
+        neededTds = taxonomy.getDimensionalValidity(self._concept).typedDimensions
+        setTds = taxonomy.conceptBits(typedDims)
+        if setButNotNeeded := setTds & ~neededTds:
+            dim_list = ", ".join(
+                str(a.qname) for a in taxonomy.conceptsFromBits(setButNotNeeded)
+            )
+            raise InlineReportException(
+                f"Unexpected typed dimension(s) [{dim_list}] set on FactBuilder for {self._concept}",
+                self,
+            )
+        if neededButNotSet := neededTds & ~setTds:
+            dim_list = ", ".join(
+                str(a.qname) for a in taxonomy.conceptsFromBits(neededButNotSet)
+            )
             raise InlineReportException(
                 f"Missing required typed dimension(s) [{dim_list}] not set on FactBuilder for {self._concept}",
                 self,
@@ -299,45 +309,48 @@ class FactBuilder:
         """Easy checks for XBRL validity to avoid mistakes. Still possible to create invalid facts."""
         if self._concept is None:
             raise InlineReportException("Concept must be set before validating a Fact.")
-        neededEds = set(taxonomy.getExplicitDimensionsForPrimaryItem(self._concept))
-
-        # Take defaulted dimensions out of both neededEds and self._aspects iff they match
-        for dimName in neededEds.copy():
-            defaultValue = taxonomy.getDimensionDefault(dimName)
-            if defaultValue is None:
-                continue
-            chosenValue = explicitDims.get(dimName)
-            if chosenValue is None or chosenValue == defaultValue:
-                neededEds.remove(dimName)
-                if chosenValue is not None:
-                    explicitDims.pop(dimName)
-                    self._aspects.pop(dimName.qname)
-
-        # At this point we have no defaulted dimensions or values to worry about.
-        chosenEds = frozenset(explicitDims.keys())
-        neededButNotChosen = neededEds - chosenEds
-        chosenButNotWanted = chosenEds - neededEds
-        if chosenButNotWanted:
-            dim_list = ", ".join(str(a.qname) for a in chosenButNotWanted)
+        validity = taxonomy.getDimensionalValidity(self._concept)
+
+        # Take defaulted dimensions out of self._aspects iff they match. Those
+        # left are needed as much as the ones without a default.
+        for dimension, defaultValue in validity.defaults.items():
+            if explicitDims.get(dimension) == defaultValue:
+                explicitDims.pop(dimension)
+                self._aspects.pop(dimension.qname)
+
+        # Dimensions from outside the taxonomy have no bit, so would otherwise
+        # go unnoticed (and have no permitted members).
+        if unknown := [
+            d
+            for d in explicitDims
+            if not taxonomy.conceptBit(d) or d not in validity.permittedMembers
+        ]:
+            dim_list = ", ".join(str(a.qname) for a in unknown)
             raise InlineReportException(
                 f"Unexpected explicit dimension(s) [{dim_list}] set on FactBuilder for {self._concept}",
                 self,
             )
-        if neededButNotChosen:
-            dim_list = ", ".join(str(a.qname) for a in neededButNotChosen)
+        chosenEds = taxonomy.conceptBits(explicitDims)
+        if chosenButNotWanted := chosenEds & ~validity.explicitDimensions:
+            dim_list = ", ".join(
+                str(a.qname) for a in taxonomy.conceptsFromBits(chosenButNotWanted)
+            )
             raise InlineReportException(
-                f"Missing explicit dimension(s) [{dim_list}] not set on FactBuilder for {self._concept}",
+                f"Unexpected explicit dimension(s) [{dim_list}] set on FactBuilder for {self._concept}",
                 self,
             )
-        validMembersForDims = {
-            explicitDimension: taxonomy.getDomainMembersForExplicitDimension(
-                explicitDimension
+        if neededButNotChosen := validity.requiredExplicitDimensions & ~chosenEds:
+            dim_list = ", ".join(
+                str(a.qname) for a in taxonomy.conceptsFromBits(neededButNotChosen)
+            )
+            raise InlineReportException(
+                f"Missing explicit dimension(s) [{dim_list}] not set on FactBuilder for {self._concept}",
+                self,
             )
-            for explicitDimension in neededEds
-        }
         for dimension, chosenMember in explicitDims.items():
-            validMembers = validMembersForDims[dimension]
-            if chosenMember not in validMembers:
+            if not validity.permittedMembers[dimension] & taxonomy.conceptBit(
+                chosenMember
+            ):
                 raise InlineReportException(
                     f"Explicit dimension {dimension} cannot be set to {chosenMember} on FactBuilder for {self._concept}",
                     self,
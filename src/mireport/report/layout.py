@@ -17,6 +17,7 @@ from mireport.taxonomy import (
     Relationship,
     Taxonomy,
 )
+from mireport.xml import QName
 
 if TYPE_CHECKING:
     from mireport.report.disclosure_layout import DisclosureLayoutStrategy
@@ -512,6 +513,32 @@ class ReportLayoutOrganiser:
             ),
         )
 
+    def _facts_by_member(
+        self,
+        roleUri: str,
+        style: TableStyle,
+        concept: Concept,
+        explicitDim: Concept,
+        defaultMember: Concept | None,
+    ) -> dict[QName | str, Fact]:
+        """The fact for concept with each member of explicitDim (facts without
+        the dimension count as having defaultMember). If there are several, the
+        last one is kept."""
+        dimension = explicitDim.qname
+        byMember: dict[QName | str, Fact] = {}
+        for fact in self.report.getFacts(concept):
+            member = fact.aspects.get(dimension)
+            if member is None:
+                if defaultMember is None:
+                    continue
+                member = defaultMember.qname
+            if (found := byMember.get(member)) is not None:
+                L.debug(
+                    f"Multiple facts found (handle this better) {roleUri=} style={style.name}\n{found=}\n{fact=}"
+                )
+            byMember[member] = fact
+        return byMember
+
     def _assemble_explicit_dim_as_columns(
         self,
         roleUri: str,
@@ -520,32 +547,19 @@ class ReportLayoutOrganiser:
         domain: list[Concept],
         defaultMember: Concept | None,
     ) -> _FactGrid:
+        style = TableStyle.SingleExplicitDimensionColumn
         data: list[list[Fact | None]] = []
         row_labels: list[Concept | str] = []
         for r in reportable:
-            row: list[Fact | None] = []
-            for c in domain:
-                found: Fact | None = None
-                for fact in self.report.getFacts(r):
-                    eValue = fact.aspects.get(explicitDim.qname)
-                    if (eValue is None and c == defaultMember) or (
-                        eValue is not None and eValue == c.qname
-                    ):
-                        if found is not None:
-                            L.debug(
-                                f"Multiple facts found (handle this better) {roleUri=} style=SingleExplicitDimensionColumn\n{found=}\n{fact=}"
-                            )
-                        found = fact
-                row.append(found)
-            if len(row) != len(domain):
-                raise InlineReportException(
-                    f"Failed to fill row correctly {r}, with {domain}"
-                )
+            byMember = self._facts_by_member(
+                roleUri, style, r, explicitDim, defaultMember
+            )
+            row: list[Fact | None] = [byMember.get(c.qname) for c in domain]
             if not all(c is None for c in row):
                 data.append(row)
                 row_labels.append(r)
         return _FactGrid(
-            style=TableStyle.SingleExplicitDimensionColumn,
+            style=style,
             data=data,
             row_labels=row_labels,
             row_heading_label=None,
@@ -560,32 +574,20 @@ class ReportLayoutOrganiser:
         domain: list[Concept],
         defaultMember: Concept | None,
     ) -> _FactGrid:
+        style = TableStyle.SingleExplicitDimensionRow
+        byConcept = [
+            self._facts_by_member(roleUri, style, c, explicitDim, defaultMember)
+            for c in reportable
+        ]
         data: list[list[Fact | None]] = []
         row_labels: list[Concept | str] = []
         for r in domain:
-            row: list[Fact | None] = []
-            for c in reportable:
-                found: Fact | None = None
-                for fact in self.report.getFacts(c):
-                    eValue = fact.aspects.get(explicitDim.qname)
-                    if (eValue is None and r == defaultMember) or (
-                        eValue is not None and eValue == r.qname
-                    ):
-                        if found is not None:
-                            L.debug(
-                                f"Multiple facts found (handle this better) {roleUri=} style=SingleExplicitDimensionRow\n{found=}\n{fact=}"
-                            )
-                        found = fact
-                row.append(found)
-            if len(row) != len(reportable):
-                raise InlineReportException(
-                    f"Failed to fill row correctly {r}, with {reportable}"
-                )
+            row: list[Fact | None] = [byMember.get(r.qname) for byMember in byConcept]
             if not all(c is None for c in row):
                 data.append(row)
                 row_labels.append(r)
         return _FactGrid(
-            style=TableStyle.SingleExplicitDimensionRow,
+            style=style,
             data=data,
             row_labels=row_labels,
             row_heading_label=explicitDim,
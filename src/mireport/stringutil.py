@@ -1,3 +1,8 @@
+import difflib
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
+
 from markupsafe import Markup
 
 _Unicode_Dash_Translation = str.maketrans(
@@ -11,7 +16,10 @@ _Unicode_Dash_Translation = str.maketrans(
 def unicodeDashNormalization(label: str) -> str:
     """Clean up a label by replacing dashes with hyphens and removing all
     leading and trailing whitespace (as defined by Unicode)."""
-    return label.translate(_Unicode_Dash_Translation).strip()
+    # translate() with a dict is slow; ASCII text has nothing to translate.
+    if not label.isascii():
+        label = label.translate(_Unicode_Dash_Translation)
+    return label.strip()
 
 
 _Unicode_Category_Zs = (
@@ -44,6 +52,8 @@ def unicodeSpaceNormalize(text: str) -> str:
     regular space.
 
     See https://gitlab.xbrl.org/base-spec/trr/-/issues/16 for details."""
+    if text.isascii():
+        return text
     return text.translate(_unicodeSpaceNormalize_Translation_Table)
 
 
@@ -55,7 +65,8 @@ def normalizeLabelText(text: str) -> str:
     # ascii, with a single space. Used this way, strip() is also done by the
     # no-args split().
     out = " ".join(text.split())
-    out = unicodeDashNormalization(out)
+    if not out.isascii():
+        out = out.translate(_Unicode_Dash_Translation)
     return out
 
 
@@ -67,6 +78,27 @@ def stripLabelSuffix(text: str) -> str:
     return stripped if sep and (stripped := before.rstrip()) else text
 
 
+# Distinct labels remembered by labelLookupVariants(): more than all the
+# standard labels of the built-in taxonomies put together.
+LABEL_VARIANTS_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=LABEL_VARIANTS_CACHE_SIZE)
+def labelLookupVariants(label: str) -> tuple[str, str, str]:
+    """The forms of label that concepts are looked up by, besides the label
+    itself: normalizeLabelText(label), that without any [suffix] and that in
+    lower case.
+
+    Remembered, as the taxonomies share most of their labels and templates
+    repeat theirs."""
+    normalised = normalizeLabelText(label)
+    if normalised == label:
+        normalised = label
+    noSuffix = stripLabelSuffix(normalised)
+    lowered = noSuffix.lower()
+    return normalised, noSuffix, noSuffix if lowered == noSuffix else lowered
+
+
 def stripLabelPrefix(text: str) -> str:
     """Strip any [asdf] prefix from label text."""
     if not text.lstrip().startswith("["):
@@ -75,6 +107,72 @@ def stripLabelPrefix(text: str) -> str:
     return stripped if sep and (stripped := after.lstrip()) else text
 
 
+class CloseMatchIndex:
+    """The difflib.get_close_matches(text, labels, n=1, cutoff) answer for a
+    fixed set of labels, found without scoring most of them.
+
+    get_close_matches() scores every label whose characters could match well
+    enough, which for similar labels (NACE codes, say) is nearly all of them.
+    The characters the text and a label have in common bound the similarity
+    of the two from above, so here labels are scored in descending order of
+    that bound (taken from an index of the labels by character) and scoring
+    stops once no remaining label can beat the best so far."""
+
+    def __init__(self, labels: Iterable[str], *, cutoff: float = 0.6) -> None:
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError(f"cutoff must be in [0.0, 1.0]: {cutoff!r}")
+        self.cutoff = cutoff
+        self._labels = tuple(dict.fromkeys(labels))
+        self._lengths = tuple(len(label) for label in self._labels)
+        # character -> ((label position, times it occurs in the label), ...)
+        postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for position, label in enumerate(self._labels):
+            for char, count in Counter(label).items():
+                postings[char].append((position, count))
+        self._postings = {char: tuple(found) for char, found in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def closest(self, text: str) -> str | None:
+        """The label get_close_matches() would return first, if any."""
+        lengthOfText = len(text)
+        common = [0] * len(self._labels)
+        for char, countInText in Counter(text).items():
+            for position, count in self._postings.get(char, ()):
+                common[position] += min(count, countInText)
+        # Same as SequenceMatcher.quick_ratio(), which ratio() never exceeds.
+        bounds = sorted(
+            (
+                (bound, position)
+                for position, (inCommon, length) in enumerate(
+                    zip(common, self._lengths, strict=True)
+                )
+                if (bound := _ratio(inCommon, length + lengthOfText)) >= self.cutoff
+            ),
+            reverse=True,
+        )
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(text)
+        best: tuple[float, str] | None = None
+        for bound, position in bounds:
+            if best is not None and bound < best[0]:
+                break
+            label = self._labels[position]
+            matcher.set_seq1(label)
+            # get_close_matches() breaks ties by preferring the greater label.
+            if (score := matcher.ratio()) >= self.cutoff and (
+                best is None or (score, label) > best
+            ):
+                best = (score, label)
+        return None if best is None else best[1]
+
+
+def _ratio(matches: int, length: int) -> float:
+    # As difflib computes it, so that bounds compare exactly with scores.
+    return 2.0 * matches / length if length else 1.0
+
+
 NumberGroupingApostrophes = frozenset("'`´’′")
 
 
@@ -5,15 +5,27 @@ concept details and presentation networks.
 
 from __future__ import annotations
 
+import gc
+import hashlib
+import json
 import logging
+import os
 import re
+import sys
+import threading
 import warnings
+from array import array
 from collections import Counter, defaultdict
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from enum import Enum, StrEnum, auto
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
+from importlib.resources import files
+from importlib.resources.abc import Traversable
+from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple, overload
 
+import msgpack
+
 from mireport.data import registries, taxonomies
 from mireport.exceptions import (
     AmbiguousComponentException,
@@ -23,7 +35,8 @@ from mireport.exceptions import (
 )
 from mireport.json import getJsonFiles, getObject, getResource
 from mireport.localise import getBestSupportedLanguage
-from mireport.stringutil import normalizeLabelText, stripLabelSuffix
+from mireport.stringutil import labelLookupVariants
+from mireport.taxonomy_interning import InterningSavings, TaxonomyInterner
 from mireport.typealiases import LabelsByLang
 from mireport.utr import UTR
 from mireport.xml import (
@@ -60,6 +73,32 @@ MEASUREMENT_GUIDANCE_LABEL_ROLE = "http://www.xbrl.org/2003/role/measurementGuid
 LABEL_SUFFIX_PATTERN = re.compile(r"\s*\[[A-Z]?[a-z ]+\]\s*$")
 
 ConceptPredicate = Callable[["Concept"], bool]
+# Label text to the positions (in taxonomy order) of the concepts with that
+# label. See Taxonomy._indexLabels().
+LabelLookupTables = Mapping[str, Mapping[str, Sequence[int]]]
+# Concept QName string -> the QName strings of the units it requires, for the
+# concepts that require any.
+RequiredUnitsTable = Mapping[str, Sequence[str]]
+# Distinct texts (with strategies) remembered by each Taxonomy.resolveConcept().
+RESOLVE_CONCEPT_CACHE_SIZE = 8192
+
+
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxSize: int | None
+
+    @property
+    def hitRate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits:,} hits, {self.misses:,} misses ({self.hitRate:.1%} hit rate),"
+            f" {self.size:,} of {self.maxSize or 'unlimited'} entries used"
+        )
 
 
 class PeriodType(StrEnum):
@@ -102,23 +141,27 @@ class Concept:
     __slots__ = (
         "_eeDomainMemberStrings",
         "_eeDomainMembers",
+        "_hash",
         "_isAbstract",
         "_isDimension",
         "_isHypercube",
         "_isNillable",
         "_isNumeric",
         "_labels",
+        "_position",
         "_qnameMaker",
         "_taxonomy",
         "baseDataType",
         "dataType",
         "periodType",
         "qname",
+        "requiredUnitQNames",
         "typedElement",
     )
 
     def __init__(self, qnameMaker: QNameMaker, s_qname: str, details: dict):
         self.qname: QName = qnameMaker.fromString(s_qname)
+        self._hash = hash(self.qname)
         self._qnameMaker = qnameMaker
 
         self._labels: LabelsByLang = details["labels"]
@@ -128,6 +171,8 @@ class Concept:
         self._isNillable: bool = details.get("nillable", False)
         self._isNumeric: bool = details.get("numeric", False)
         self._taxonomy: Taxonomy
+        # Set by the Taxonomy (see Taxonomy._findRequiredUnits()).
+        self.requiredUnitQNames: frozenset[QName] | None = None
 
         if (period_type := details.get("periodType")) is not None:
             self.periodType = PeriodType(period_type)
@@ -161,6 +206,18 @@ class Concept:
         if (eeDom := other.get("ee20DomainMembers")) is not None:
             self._eeDomainMemberStrings = eeDom
 
+    def _shareValues(
+        self, interner: TaxonomyInterner, savings: InterningSavings
+    ) -> None:
+        """Swap this concept's QNames and labels for ones shared with other
+        taxonomies."""
+        self.qname = interner.qname(self.qname, savings)
+        self.dataType = interner.qname(self.dataType, savings)
+        self.baseDataType = interner.qname(self.baseDataType, savings)
+        if self.typedElement is not None:
+            self.typedElement = interner.qname(self.typedElement, savings)
+        self._labels = interner.labels(self._labels, savings)
+
     def __repr__(self) -> str:
         return f"Concept(qname={self.qname})"
 
@@ -180,15 +237,23 @@ class Concept:
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.qname)
+        return self._hash
+
+    def __reduce__(self) -> tuple[Callable[[str, QName], Concept], tuple[str, QName]]:
+        # A concept is pickled as a reference into its taxonomy and looked up
+        # again when unpickled, rather than taking the whole taxonomy along.
+        # That also works its hash out afresh in the unpickling process.
+        return (_getTaxonomyConcept, (self._taxonomy.entryPoint, self.qname))
 
-    def _reifyUsingTaxonomy(self, taxonomy: Taxonomy) -> None:
-        """Reify any bits of the concept that need the rest of the taxonomy."""
+    def _reifyUsingTaxonomy(self, taxonomy: Taxonomy, position: int) -> None:
+        """Reify any bits of the concept that need the rest of the taxonomy.
+        position is the concept's place in the taxonomy's tables."""
         if getattr(self, "_taxonomy", None) is not None:
             raise TaxonomyException(
                 f"Already reified with {self._taxonomy=}. New attempt using {taxonomy=}."
             )
         self._taxonomy = taxonomy
+        self._position = position
         if self._eeDomainMemberStrings is not None:
             self._eeDomainMembers = tuple(
                 taxonomy.getConcept(member) for member in self._eeDomainMemberStrings
@@ -208,19 +273,46 @@ class Concept:
         if (defaultLanguage := self._taxonomy.defaultLanguage) is None:
             return None
 
-        if not requestedLanguage:
-            requestedLanguage = defaultLanguage
+        desired_label = self._taxonomy._getLabelTable(
+            roleUri,
+            requestedLanguage or defaultLanguage,
+            fallbackToAnyLang,
+            removeSuffix,
+        )[self._position]
+        if desired_label is not None:
+            return desired_label
 
-        requestedLanguage = requestedLanguage.lower()
+        if fallbackLabel is not None:
+            desired_label = fallbackLabel
+        elif fallbackToQName:
+            desired_label = str(self.qname)
+        else:
+            return None
+
+        if not desired_label or not removeSuffix:
+            return desired_label
+
+        return LABEL_SUFFIX_PATTERN.sub("", desired_label)
+
+    def _resolveLabel(
+        self,
+        roleUri: str,
+        language: str,
+        fallbackToAnyLang: bool,
+        defaultLanguage: str,
+    ) -> str | None:
+        """The label for roleUri in language (lower case), or in another
+        language if there is none and fallbackToAnyLang. Used to fill
+        Taxonomy._getLabelTable()."""
         labels_for_lang: Mapping[str, str]
         desired_label = None
 
-        if requestedLanguage in self._labels:
-            labels_for_lang = self._labels[requestedLanguage]
+        if language in self._labels:
+            labels_for_lang = self._labels[language]
             desired_label = labels_for_lang.get(roleUri)
         else:
             label_langs = self._labels.keys()
-            wanted_lang = requestedLanguage.partition("-")[0]
+            wanted_lang = language.partition("-")[0]
             for p in label_langs:
                 if p.partition("-")[0] == wanted_lang:
                     labels_for_lang = self._labels[p]
@@ -231,7 +323,7 @@ class Concept:
         if not desired_label and fallbackToAnyLang:
             langBuckets = list(self._labels.values())
             if (
-                requestedLanguage != defaultLanguage
+                language != defaultLanguage
                 and (defaultBucket := self._labels.get(defaultLanguage)) is not None
             ):
                 # prioritise default language
@@ -242,16 +334,7 @@ class Concept:
                     desired_label = wrongLangRightRole
                     break
 
-        if desired_label is None and fallbackLabel is not None:
-            desired_label = fallbackLabel
-
-        if desired_label is None and fallbackToQName:
-            desired_label = str(self.qname)
-
-        if not desired_label or not removeSuffix:
-            return desired_label
-
-        return LABEL_SUFFIX_PATTERN.sub("", desired_label)
+        return desired_label
 
     @overload
     def getStandardLabel(
@@ -359,14 +442,16 @@ class Concept:
             for role_uri in lang_labels
         )
 
-    # N.B. B019 (cache keeps `self` alive) is not a concern: Concepts belong to a
-    # Taxonomy which is kept in a module level registry for the life of the process.
-    @cache  # noqa: B019
     def getRequiredUnitQNames(self) -> frozenset[QName] | None:
         """If there is a valid UTR unitId or a valid unit QName in the
         measurement guidance label of the concept, return the first one found.
         Otherwise return None.
         """
+        return self.requiredUnitQNames
+
+    def _findRequiredUnitQNames(self) -> frozenset[QName] | None:
+        """Work out getRequiredUnitQNames() from the measurement guidance label.
+        Done once per taxonomy, when it is built or its snapshot is written."""
         if not self.isNumeric:
             return None
 
@@ -590,25 +675,27 @@ class PresentationGroup(NamedTuple):
 
     @classmethod
     def fromJSON(cls, taxonomy: Taxonomy, roleUri: str, metaData: Mapping) -> Self:
-        relationships: list[Relationship] = []
-        for row in metaData["rows"]:
-            if len(row) == 2:
-                indent, concept_qname = row
-                preferredLabel = None
-            else:
-                indent, concept_qname, preferredLabel = row
-            relationships.append(
-                Relationship(
-                    roleUri, indent, taxonomy.getConcept(concept_qname), preferredLabel
-                )
+        return cls.fromNetwork(
+            taxonomy, PresentationNetwork.fromJSON(taxonomy, roleUri, metaData)
+        )
+
+    @classmethod
+    def fromNetwork(cls, taxonomy: Taxonomy, network: PresentationNetwork) -> Self:
+        concepts = taxonomy._conceptOrder
+        preferredLabels = network.preferredLabels or (None,) * len(network.concepts)
+        relationships = tuple(
+            Relationship(network.roleUri, depth, concepts[position], preferredLabel)
+            for position, depth, preferredLabel in zip(
+                network.concepts, network.depths, preferredLabels, strict=True
             )
+        )
         return cls(
             taxonomy,
             cls._identifyPresentationStyle(relationships),
-            roleUri,
-            str(metaData.get("definition", "")).strip(),
-            metaData.get("labels", {}),
-            tuple(relationships),
+            network.roleUri,
+            network.definition,
+            network.labels,
+            relationships,
         )
 
     @classmethod
@@ -651,11 +738,64 @@ class PresentationGroup(NamedTuple):
                 return PresentationStyle.Empty
 
 
+class PresentationNetwork(NamedTuple):
+    """A presentation group as the taxonomy keeps it until it is needed: the
+    concepts (by position in the taxonomy), depths and preferred label roles
+    of its relationships in parallel arrays."""
+
+    roleUri: str
+    definition: str
+    labels: Mapping[str, str]
+    concepts: array[int]
+    depths: array[int]
+    # None when no relationship has a preferred label.
+    preferredLabels: tuple[str | None, ...] | None
+
+    @classmethod
+    def fromJSON(cls, taxonomy: Taxonomy, roleUri: str, metaData: Mapping) -> Self:
+        concepts = array("I")
+        depths = array("H")
+        preferredLabels: list[str | None] = []
+        for row in metaData["rows"]:
+            if len(row) == 2:
+                indent, concept_qname = row
+                preferredLabel = None
+            else:
+                indent, concept_qname, preferredLabel = row
+                preferredLabel = sys.intern(preferredLabel)
+            concepts.append(taxonomy.getConcept(concept_qname)._position)
+            depths.append(indent)
+            preferredLabels.append(preferredLabel)
+        return cls(
+            roleUri,
+            str(metaData.get("definition", "")).strip(),
+            metaData.get("labels", {}),
+            concepts,
+            depths,
+            tuple(preferredLabels) if any(preferredLabels) else None,
+        )
+
+
 class BaseSet(NamedTuple):
     roleUri: str
     hyperCubes: frozenset[Concept]
 
 
+class DimensionalValidity(NamedTuple):
+    """The dimensions facts for a primary item may and must have. Sets of
+    concepts are bitsets of their positions in the taxonomy (see
+    Taxonomy.conceptBits())."""
+
+    explicitDimensions: int
+    requiredExplicitDimensions: int
+    """Explicit dimensions without a default, so always needed."""
+    defaults: Mapping[Concept, Concept]
+    """Default member of each of the explicitDimensions that has one."""
+    permittedMembers: Mapping[Concept, int]
+    """Members each of the explicitDimensions may be set to."""
+    typedDimensions: int
+
+
 class Taxonomy:
     def __init__(
         self,
@@ -665,6 +805,8 @@ class Taxonomy:
         dimensions: dict[str, dict],
         qnameMaker: QNameMaker,
         utr: UTR,
+        labelLookups: LabelLookupTables | None = None,
+        requiredUnits: RequiredUnitsTable | None = None,
     ) -> None:
         self._entryPoint = entryPoint
         self._dimensions = dimensions
@@ -677,49 +819,79 @@ class Taxonomy:
         self._dimensionContainer = DimensionContainerType.Scenario
 
         self._concepts = {concept.qname: concept for concept in concepts.values()}
-        for concept in concepts.values():
-            concept._reifyUsingTaxonomy(self)
-
-        self._groups: tuple[PresentationGroup, ...] = tuple(
-            PresentationGroup.fromJSON(self, roleUri, bits)
+        # Keyed by the QName strings the taxonomy itself uses so that the common
+        # getConcept("prefix:name") case does not need to parse a QName.
+        self._conceptsByString: dict[str, Concept] = dict(concepts)
+        for position, concept in enumerate(concepts.values()):
+            concept._reifyUsingTaxonomy(self, position)
+
+        # The PresentationGroups (and their styles) are only made if something
+        # lays out a report. See presentation.
+        self._presentationNetworks: tuple[PresentationNetwork, ...] = tuple(
+            PresentationNetwork.fromJSON(self, roleUri, bits)
             for roleUri, bits in presentation.items()
         )
 
-        self._lookupConceptsByName: dict[str, list[Concept]] = defaultdict(list)
+        byName: dict[str, list[Concept]] = defaultdict(list)
         for concept in concepts.values():
-            self._lookupConceptsByName[concept.qname.localName].append(concept)
-
-        cByStdLbl: dict[str, list[Concept]] = defaultdict(list)
-        cByPretend: dict[str, list[Concept]] = defaultdict(list)
-        for concept in concepts.values():
-            for actual_label in concept.getAllStandardLabels():
-                cByStdLbl[actual_label].append(concept)
-
-                norm_label = normalizeLabelText(actual_label)
-                norm_label_no_suffix = stripLabelSuffix(norm_label)
-                norm_label_no_suffix_all_lc = norm_label_no_suffix.lower()
+            byName[concept.qname.localName].append(concept)
+        self._lookupConceptsByName: Mapping[str, tuple[Concept, ...]] = {
+            name: tuple(named) for name, named in byName.items()
+        }
 
-                cByPretend[norm_label].append(concept)
-                cByPretend[norm_label_no_suffix].append(concept)
-                cByPretend[norm_label_no_suffix_all_lc].append(concept)
+        conceptOrder = self._conceptOrder = tuple(concepts.values())
+        # Concept labels as getLabelForRole() resolves them, by concept position
+        # and keyed by (role, language, fallbackToAnyLang, removeSuffix). Each
+        # is built the first time it is needed.
+        self._labelTables: dict[tuple[str, str, bool, bool], tuple[str | None, ...]]
+        self._labelTables = {}
+        if labelLookups is None:
+            labelLookups = self._indexLabels(conceptOrder)
+        # Most labels belong to a single concept, and each concept is under
+        # several keys, so share the frozensets rather than build (and hash the
+        # concepts for) one per key.
+        shared: dict[tuple[int, ...], frozenset[Concept]] = {}
+
+        def conceptSet(positions: Sequence[int]) -> frozenset[Concept]:
+            key = tuple(positions)
+            if (found := shared.get(key)) is None:
+                found = shared[key] = frozenset(conceptOrder[i] for i in key)
+            return found
 
         self._lookupConceptsByStandardLabel: dict[str, frozenset[Concept]] = {
-            k: frozenset(v) for k, v in cByStdLbl.items()
+            k: conceptSet(v) for k, v in labelLookups["standard"].items()
         }
         self._lookupConceptsByPretendLabel: dict[str, frozenset[Concept]] = {
-            k: frozenset(v) for k, v in cByPretend.items()
+            k: conceptSet(v) for k, v in labelLookups["pretend"].items()
         }
 
+        if requiredUnits is None:
+            requiredUnits = self._findRequiredUnits()
+        unitSets: dict[tuple[str, ...], frozenset[QName]] = {}
+        for name, units in requiredUnits.items():
+            key = tuple(units)
+            if (found := unitSets.get(key)) is None:
+                found = unitSets[key] = frozenset(
+                    qnameMaker.fromString(unit) for unit in key
+                )
+            self._conceptsByString[name].requiredUnitQNames = found
+
+        # Workbooks of one template version ask for the same names and labels
+        # over and over, so remember what each text finds (or that it finds
+        # nothing). Filtering the candidates is left to resolveConcept() as
+        # callers' predicates are usually made afresh for every call.
+        self._resolutionCandidates = lru_cache(maxsize=RESOLVE_CONCEPT_CACHE_SIZE)(
+            self._findResolutionCandidates
+        )
+
         self._dimensionDefaults: Mapping[Concept, Concept] = {
             self.getConcept(dimension): self.getConcept(domainMember)
             for dimension, domainMember in dimensions.pop("_defaults", {}).items()
         }
 
         self._baseSets: dict[BaseSet, list[dict]] = defaultdict(list)
-        self._lookupBaseSetByCube: dict[Concept, list[BaseSet]] = defaultdict(list)
-        self._lookupBaseSetByPrimaryItem: dict[Concept, list[BaseSet]] = defaultdict(
-            list
-        )
+        baseSetsByCube: dict[Concept, list[BaseSet]] = defaultdict(list)
+        baseSetsByPrimaryItem: dict[Concept, list[BaseSet]] = defaultdict(list)
         desired_containers: set[DimensionContainerType] = set()
         open_hcs: set[Relationship] = set()
         domainByDimension: dict[Concept, list[Concept]] = defaultdict(list)
@@ -746,7 +918,7 @@ class Taxonomy:
                     for depth, qname in cubeDetails.pop("primaryItems", [])
                 ]
                 for r in d["primaryItems"]:
-                    self._lookupBaseSetByPrimaryItem[r.concept].append(baseSet)
+                    baseSetsByPrimaryItem[r.concept].append(baseSet)
 
                 d["explicitDimensions"] = {
                     concepts[dimQname]: frozenset(
@@ -764,13 +936,22 @@ class Taxonomy:
                     for dimQname in cubeDetails.pop("typedDimensions", [])
                 ]
 
-                self._lookupBaseSetByCube[hc_concept].append(baseSet)
+                baseSetsByCube[hc_concept].append(baseSet)
                 self._baseSets[baseSet].append(d)
 
+        # Plain dictionaries of tuples: nothing can add to them by accident and
+        # they are smaller (see also preloadTaxonomies()).
+        self._lookupBaseSetByCube: Mapping[Concept, tuple[BaseSet, ...]] = {
+            cube: tuple(sets) for cube, sets in baseSetsByCube.items()
+        }
+        self._lookupBaseSetByPrimaryItem: Mapping[Concept, tuple[BaseSet, ...]] = {
+            item: tuple(sets) for item, sets in baseSetsByPrimaryItem.items()
+        }
         self._lookupDomainByDimension: Mapping[Concept, frozenset[Concept]] = {
             dimension: frozenset(domainlist)
             for dimension, domainlist in domainByDimension.items()
         }
+        self._explicitDimensionByMember = self._indexExplicitDimensionsByMember()
         self._hypercubes = frozenset(c for x in self._baseSets for c in x.hyperCubes)
 
         if open_hcs:
@@ -798,8 +979,77 @@ class Taxonomy:
                     f"Multiple dimension containers specified {desired_containers}. Not currently supported"
                 )
 
+    @staticmethod
+    def _indexLabels(concepts: Sequence[Concept]) -> dict[str, dict[str, list[int]]]:
+        """Build the label text to concept tables used by resolveConcept.
+
+        "standard" is keyed by the exact standard labels and "pretend" by their
+        normalised, suffix stripped and lower cased forms. Concepts are given
+        by position in ``concepts`` so that the tables can be stored in a
+        taxonomy snapshot."""
+        byStandard: dict[str, list[int]] = defaultdict(list)
+        byPretend: dict[str, list[int]] = defaultdict(list)
+
+        def add(table: dict[str, list[int]], label: str, position: int) -> None:
+            # Each concept's labels are added together, so a repeat is last.
+            positions = table[label]
+            if not positions or positions[-1] != position:
+                positions.append(position)
+
+        for position, concept in enumerate(concepts):
+            for actual_label in concept.getAllStandardLabels():
+                add(byStandard, actual_label, position)
+                for variant in labelLookupVariants(actual_label):
+                    add(byPretend, variant, position)
+        return {"standard": dict(byStandard), "pretend": dict(byPretend)}
+
+    def _findRequiredUnits(self) -> dict[str, list[str]]:
+        """Work out the units each concept requires (from its measurement
+        guidance label). The result is stored in a taxonomy snapshot so that
+        the labels need not be parsed again."""
+        return {
+            name: sorted(str(unit) for unit in units)
+            for name, concept in self._conceptsByString.items()
+            if (units := concept._findRequiredUnitQNames()) is not None
+        }
+
+    def _computeLazyValues(self) -> None:
+        """Compute now the values otherwise computed (and cached) on first
+        use."""
+        for name in (
+            "concepts",
+            "presentation",
+            "emptyHypercubes",
+            "defaultedDimensions",
+            "dimensionContainer",
+            "entryPoint",
+            "defaultLanguage",
+        ):
+            getattr(self, name)
+        _ = self._utr._currencies
+        for hypercube in self._hypercubes:
+            self.getDimensionsForHypercube(hypercube)
+        for primaryItem in self._lookupBaseSetByPrimaryItem:
+            self.getDimensionalValidity(primaryItem)
+
+    def _shareValues(
+        self, interner: TaxonomyInterner, savings: InterningSavings
+    ) -> None:
+        """Swap the (mostly normalised) label text keying the label lookups for
+        text shared with other taxonomies."""
+        self._lookupConceptsByStandardLabel = {
+            interner.string(label, savings): concepts
+            for label, concepts in self._lookupConceptsByStandardLabel.items()
+        }
+        self._lookupConceptsByPretendLabel = {
+            interner.string(label, savings): concepts
+            for label, concepts in self._lookupConceptsByPretendLabel.items()
+        }
+
     def getConcept(self, qname: QName | str) -> Concept:
         if isinstance(qname, str):
+            if (concept := self._conceptsByString.get(qname)) is not None:
+                return concept
             qname = self._qnameMaker.fromString(qname)
         return self._concepts[qname]
 
@@ -837,64 +1087,82 @@ class Taxonomy:
                 predicate is None or predicate(c)
             )
 
+        byQName, candidates = self._resolutionCandidates(
+            text, by_label, by_name, by_qname
+        )
+        if byQName is not None and passes(byQName):
+            return byQName
+
+        matching = {c for c in candidates if passes(c)}
+
+        match len(matching):
+            case 0:
+                return None
+            case 1:
+                return next(iter(matching))
+            case _:
+                ordered = sorted(matching)
+                raise AmbiguousComponentException(
+                    f"Ambiguous concept specified. Candidate concepts: "
+                    f"{', '.join(str(c.qname) for c in ordered)}",
+                    candidates=ordered,
+                )
+
+    def _findResolutionCandidates(
+        self, text: str, by_label: bool, by_name: bool, by_qname: bool
+    ) -> tuple[Concept | None, frozenset[Concept]]:
+        """The concept text is the QName of and the concepts it is the name or
+        label of, for resolveConcept() to filter."""
+        byQName: Concept | None = None
         if by_qname:
             try:
-                concept = self.getConcept(text)
+                byQName = self.getConcept(text)
             except (BrokenQNameException, KeyError):
                 pass  # not a valid QName format or concept not present
-            else:
-                if passes(concept):
-                    return concept
 
         candidates: set[Concept] = set()
 
         if by_name:
-            candidates.update(self._lookupConceptsByName.get(text, []))
+            candidates.update(self._lookupConceptsByName.get(text, ()))
 
         if by_label:
             possible: frozenset[Concept] = self._lookupConceptsByStandardLabel.get(
                 text, frozenset()
             )
             if not possible:
-                normalized = normalizeLabelText(text)
+                normalized, no_suffix, lowered = labelLookupVariants(text)
                 possible = self._lookupConceptsByPretendLabel.get(
                     normalized, frozenset()
                 )
                 if not possible:
-                    no_suffix = stripLabelSuffix(normalized)
                     if no_suffix != normalized:
                         possible = self._lookupConceptsByPretendLabel.get(
                             no_suffix, frozenset()
                         )
                     if not possible:
                         possible = self._lookupConceptsByPretendLabel.get(
-                            no_suffix.lower(), frozenset()
+                            lowered, frozenset()
                         )
             candidates.update(possible)
 
-        candidates = {c for c in candidates if passes(c)}
+        return byQName, frozenset(candidates)
 
-        match len(candidates):
-            case 0:
-                return None
-            case 1:
-                return next(iter(candidates))
-            case _:
-                ordered = sorted(candidates)
-                raise AmbiguousComponentException(
-                    f"Ambiguous concept specified. Candidate concepts: "
-                    f"{', '.join(str(c.qname) for c in ordered)}",
-                    candidates=ordered,
-                )
+    def resolveConceptCacheStatistics(self) -> CacheStatistics:
+        """How often resolveConcept() has found its answer already known."""
+        info = self._resolutionCandidates.cache_info()
+        return CacheStatistics(info.hits, info.misses, info.currsize, info.maxsize)
 
     @cached_property
     def concepts(self) -> frozenset[Concept]:
         """All concepts in the taxonomy."""
         return frozenset(self._concepts.values())
 
-    @property
+    @cached_property
     def presentation(self) -> tuple[PresentationGroup, ...]:
-        return self._groups
+        return tuple(
+            PresentationGroup.fromNetwork(self, network)
+            for network in self._presentationNetworks
+        )
 
     @property
     def hypercubes(self) -> frozenset[Concept]:
@@ -980,31 +1248,97 @@ class Taxonomy:
         tds = {td for hc in hcs for td in self.getTypedDimensionsForHypercube(hc)}
         return frozenset(tds)
 
-    @cache  # noqa: B019 - Taxonomy lives for the life of the process. See above.
+    def _indexExplicitDimensionsByMember(
+        self,
+    ) -> Mapping[Concept, Mapping[Concept, Concept | tuple[Concept, ...]]]:
+        """primary item -> domain member -> the explicit dimension it belongs
+        to, or the (sorted) candidate dimensions when there is more than one.
+        Primary items in the same base sets share one member table."""
+        tables: dict[
+            tuple[BaseSet, ...], dict[Concept, Concept | tuple[Concept, ...]]
+        ] = {}
+        for baseSets in self._lookupBaseSetByPrimaryItem.values():
+            if baseSets in tables:
+                continue
+            possible: dict[Concept, set[Concept]] = defaultdict(set)
+            for b in baseSets:
+                for cube in self._baseSets[b]:
+                    for ed, domain in cube["explicitDimensions"].items():
+                        for member in domain:
+                            possible[member].add(ed)
+            tables[baseSets] = {
+                member: next(iter(dims)) if len(dims) == 1 else tuple(sorted(dims))
+                for member, dims in possible.items()
+            }
+        return {
+            item: tables[baseSets]
+            for item, baseSets in self._lookupBaseSetByPrimaryItem.items()
+        }
+
     def getExplicitDimensionForDomainMember(
         self, primaryItem: Concept, dimensionValue: Concept
     ) -> Concept | None:
-        baseSets = self._lookupBaseSetByPrimaryItem.get(primaryItem)
-        if baseSets is None:
+        members = self._explicitDimensionByMember.get(primaryItem)
+        if members is None:
             return None
-        possible: set = set()
-        for b in baseSets:
-            for cube in self._baseSets[b]:
-                for ed, domain in cube["explicitDimensions"].items():
-                    if dimensionValue in domain:
-                        possible.add(ed)
-        match len(possible):
-            case 0:
-                return None
-            case 1:
-                return next(iter(possible))
-            case _:
-                ordered = sorted(possible)
+        match members.get(dimensionValue):
+            case tuple() as ordered:
                 raise AmbiguousComponentException(
                     f"Ambiguous domain member specified. Candidate dimensions: "
                     f"{', '.join(str(concept.qname) for concept in ordered)}",
                     candidates=ordered,
                 )
+            case found:
+                return found
+
+    @cache  # noqa: B019 - Taxonomy lives for the life of the process. See above.
+    def getDimensionalValidity(self, primaryItem: Concept) -> DimensionalValidity:
+        explicit = self.getExplicitDimensionsForPrimaryItem(primaryItem)
+        defaults = {
+            dimension: default
+            for dimension in explicit
+            if (default := self.getDimensionDefault(dimension)) is not None
+        }
+        return DimensionalValidity(
+            explicitDimensions=self.conceptBits(explicit),
+            requiredExplicitDimensions=self.conceptBits(
+                d for d in explicit if d not in defaults
+            ),
+            defaults=defaults,
+            permittedMembers={
+                dimension: self.conceptBits(
+                    self.getDomainMembersForExplicitDimension(dimension)
+                )
+                for dimension in explicit
+            },
+            typedDimensions=self.conceptBits(
+                self.getTypedDimensionsForPrimaryItem(primaryItem)
+            ),
+        )
+
+    def conceptBit(self, concept: Concept) -> int:
+        """concept as a bitset, or 0 if it is not in the taxonomy."""
+        if concept._taxonomy is not self:
+            # Equal (same QName) concepts from another taxonomy are allowed.
+            found = self._concepts.get(concept.qname)
+            return 0 if found is None else 1 << found._position
+        return 1 << concept._position
+
+    def conceptBits(self, concepts: Iterable[Concept]) -> int:
+        """concepts as a bitset, for use with DimensionalValidity."""
+        bits = 0
+        for concept in concepts:
+            bits |= self.conceptBit(concept)
+        return bits
+
+    def conceptsFromBits(self, bits: int) -> list[Concept]:
+        """The concepts in a bitset, in taxonomy order."""
+        concepts = []
+        while bits:
+            lowest = bits & -bits
+            concepts.append(self._conceptOrder[lowest.bit_length() - 1])
+            bits ^= lowest
+        return concepts
 
     def getDomainMembersForExplicitDimension(
         self, dimension: Concept
@@ -1038,7 +1372,9 @@ class Taxonomy:
         The values are based on the total number of labels in the taxonomy for
         each language."""
         counts = Counter(
-            lang.lower() for group in self._groups for lang in group.labels
+            lang.lower()
+            for network in self._presentationNetworks
+            for lang in network.labels
         )
         counts.update(
             lang.lower()
@@ -1047,6 +1383,54 @@ class Taxonomy:
         )
         return counts
 
+    @cached_property
+    def _conceptLabelLanguages(self) -> frozenset[str]:
+        """Languages concept labels are in."""
+        return frozenset(lang for c in self._conceptOrder for lang in c._labels)
+
+    @cached_property
+    def _conceptLabelPrimaryLanguages(self) -> frozenset[str]:
+        """Primary language subtags (en for en-gb, say) of the languages
+        concept labels are in."""
+        return frozenset(lang.partition("-")[0] for lang in self._conceptLabelLanguages)
+
+    def _getLabelTable(
+        self, roleUri: str, language: str, fallbackToAnyLang: bool, removeSuffix: bool
+    ) -> tuple[str | None, ...]:
+        """Labels for roleUri in language for every concept, by position, as
+        Concept.getLabelForRole() finds them (before any fallbackLabel or QName
+        fallback)."""
+        language = language.lower()
+        # Tables are shared between the languages that resolve the same way,
+        # so however many languages are asked for there are only ever as many
+        # tables as label languages and primary language subtags.
+        if language in self._conceptLabelLanguages:
+            resolvedLanguage = language
+        elif (primary := language.partition("-")[0]) in (
+            self._conceptLabelPrimaryLanguages
+        ):
+            # No concept has labels in exactly the language so any label in
+            # the same primary language will do.
+            resolvedLanguage = f"{primary}-*"
+        else:
+            # No concept has labels in the language at all.
+            resolvedLanguage = language = ""
+        key = (roleUri, resolvedLanguage, fallbackToAnyLang, removeSuffix)
+        if (table := self._labelTables.get(key)) is None:
+            defaultLanguage = self.defaultLanguage or ""
+            labels = [
+                c._resolveLabel(roleUri, language, fallbackToAnyLang, defaultLanguage)
+                for c in self._conceptOrder
+            ]
+            if removeSuffix:
+                labels = [
+                    LABEL_SUFFIX_PATTERN.sub("", label) if label else label
+                    for label in labels
+                ]
+            # Building twice in a race is harmless: the tables are equal.
+            table = self._labelTables[key] = tuple(labels)
+        return table
+
     @cached_property
     def defaultLanguage(self) -> str | None:
         """Return the most used language in the taxonomy."""
@@ -1078,54 +1462,310 @@ class Taxonomy:
         return self._qnameMaker
 
 
+class TaxonomyManifestEntry(NamedTuple):
+    """What is known about a built-in taxonomy without building it."""
+
+    entryPoint: str
+    file: str
+    supportedLanguages: frozenset[str]
+
+
+TAXONOMY_MANIFEST_NAME = "manifest.json"
+TAXONOMY_SNAPSHOT_SUFFIX = ".msgpack"
+# Bump whenever the layout of the snapshot, or what Taxonomy precomputes into
+# it (such as the label normalisation), changes.
+TAXONOMY_SNAPSHOT_FORMAT = 3
+
+# Taxonomies are built on first use by getTaxonomy(). The lock serialises
+# building them (and reading the manifest); lookups of already built taxonomies
+# do not take it.
 _TAXONOMIES: dict[str, Taxonomy] = {}
+_MANIFEST: dict[str, TaxonomyManifestEntry] | None = None
+_LOAD_LOCK = threading.Lock()
+# Shares labels, QNames and the UTR between the taxonomies (see
+# taxonomy_interning.py).
+_INTERNER = TaxonomyInterner()
 
 
 def getTaxonomy(entryPoint: str) -> Taxonomy:
+    """Get the taxonomy for the entry point, building it if this is the first
+    time it has been asked for."""
     taxonomy = _TAXONOMIES.get(entryPoint)
-    if taxonomy is None:
+    if taxonomy is not None:
+        return taxonomy
+    entry = _getManifest().get(entryPoint)
+    if entry is None:
         raise UnknownTaxonomyException(
             f'No knowledge of taxonomy entry point "{entryPoint}"'
         )
+    with _LOAD_LOCK:
+        taxonomy = _TAXONOMIES.get(entryPoint)
+        if taxonomy is None:
+            taxonomy = _TAXONOMIES[entryPoint] = _loadTaxonomy(entry)
     return taxonomy
 
 
+def _getTaxonomyConcept(entryPoint: str, qname: QName) -> Concept:
+    """Unpickle a Concept (see Concept.__reduce__)."""
+    return getTaxonomy(entryPoint).getConcept(qname)
+
+
 def listTaxonomies() -> tuple[str, ...]:
-    return tuple(_TAXONOMIES.keys())
+    """Entry points of all the built-in taxonomies, built or not."""
+    return tuple(_getManifest())
+
+
+def getTaxonomySupportedLanguages(entryPoint: str) -> frozenset[str]:
+    """Taxonomy.supportedLanguages for the entry point, without building the
+    taxonomy."""
+    entry = _getManifest().get(entryPoint)
+    if entry is None:
+        raise UnknownTaxonomyException(
+            f'No knowledge of taxonomy entry point "{entryPoint}"'
+        )
+    return entry.supportedLanguages
 
 
 def loadBuiltInTaxonomyJSON() -> None:
-    """Loads the taxonomies, unit registry and other models."""
-    for f in getJsonFiles(taxonomies):
+    """Loads all the taxonomies now rather than as getTaxonomy() needs them."""
+    for entryPoint in listTaxonomies():
+        try:
+            getTaxonomy(entryPoint)
+        except Exception as e:  # noqa: BLE001 - one bad file must not lose the rest
+            L.error(f"Error loading taxonomy {entryPoint}", exc_info=e)
+
+
+def preloadTaxonomies() -> None:
+    """Load all the taxonomies, and the values they otherwise compute on first
+    use, in a process that is about to fork workers (for example gunicorn with
+    --preload).
+
+    Forked workers share the parent's memory until either writes to a page.
+    Loading first means each worker no longer builds its own copies, and
+    freezing the garbage collector keeps later collections (which write to
+    every object they examine) from copying the pages the taxonomies are on.
+    The taxonomies are never freed so nothing is lost by the collector
+    ignoring them."""
+    loadBuiltInTaxonomyJSON()
+    for taxonomy in _TAXONOMIES.values():
+        taxonomy._computeLazyValues()
+    gc.collect()
+    gc.freeze()
+    L.info(
+        f"Preloaded {len(_TAXONOMIES)} taxonomies; {gc.get_freeze_count()} objects frozen."
+    )
+
+
+def _taxonomyJsonFiles() -> list[Traversable]:
+    return sorted(
+        (f for f in getJsonFiles(taxonomies) if f.name != TAXONOMY_MANIFEST_NAME),
+        key=lambda f: f.name,
+    )
+
+
+@cache
+def _getUTRJSON() -> dict:
+    return getObject(getResource(registries, "utr.json"))
+
+
+def _getManifest() -> Mapping[str, TaxonomyManifestEntry]:
+    global _MANIFEST
+    if (manifest := _MANIFEST) is not None:
+        return manifest
+    with _LOAD_LOCK:
+        if _MANIFEST is None:
+            _MANIFEST = _readManifest()
+        return _MANIFEST
+
+
+def _readManifest() -> dict[str, TaxonomyManifestEntry]:
+    """Read the manifest written by buildTaxonomyManifest().
+
+    Taxonomy JSON files the manifest does not know about are built straight
+    away, as that is the only way to find out their entry point."""
+    source = getResource(taxonomies, TAXONOMY_MANIFEST_NAME)
+    listed = getObject(source) if source.is_file() else {}
+    available = {f.name: f for f in _taxonomyJsonFiles()}
+    manifest: dict[str, TaxonomyManifestEntry] = {}
+    for entryPoint, details in listed.items():
+        if details["file"] not in available:
+            L.warning(f"Taxonomy manifest lists missing file {details['file']}.")
+            continue
+        manifest[entryPoint] = TaxonomyManifestEntry(
+            entryPoint, details["file"], frozenset(details["supportedLanguages"])
+        )
+    known = {entry.file for entry in manifest.values()}
+    for name, f in available.items():
+        if name in known:
+            continue
+        L.warning(
+            f"Taxonomy {name} is not in the manifest; rebuild it with"
+            " scripts/build-taxonomy-snapshot.py."
+        )
         try:
-            _createTaxonomyFromJSON(getObject(f))
+            taxonomy = _createTaxonomyFromJSON(getObject(f), _getUTRJSON())
         except Exception as e:  # noqa: BLE001 - one bad file must not lose the rest
-            L.error(f"Error loading taxonomy from {f.name}", exc_info=e)
+            L.error(f"Error loading taxonomy from {name}", exc_info=e)
+            continue
+        _TAXONOMIES[taxonomy.entryPoint] = taxonomy
+        manifest[taxonomy.entryPoint] = TaxonomyManifestEntry(
+            taxonomy.entryPoint, name, taxonomy.supportedLanguages
+        )
+    return manifest
 
 
-def _createTaxonomyFromJSON(bits: dict) -> None:
-    entryPoint = bits["entryPoint"]
-    if _TAXONOMIES.get(entryPoint) is not None:
+def _loadTaxonomy(entry: TaxonomyManifestEntry) -> Taxonomy:
+    source = getResource(taxonomies, entry.file)
+    snapshot = getResource(
+        taxonomies, entry.file.removesuffix(".json") + TAXONOMY_SNAPSHOT_SUFFIX
+    )
+    taxonomy = None
+    if snapshot.is_file():
+        taxonomy = _restoreTaxonomySnapshot(snapshot, source)
+    if taxonomy is None:
+        taxonomy = _createTaxonomyFromJSON(getObject(source), _getUTRJSON())
+    if taxonomy.entryPoint != entry.entryPoint:
         raise TaxonomyException(
-            f"Already loaded taxonomy. Taxonomies loaded: {' '.join(_TAXONOMIES.keys())}"
+            f"Taxonomy manifest is out of date: {entry.file} is for"
+            f" {taxonomy.entryPoint} not {entry.entryPoint}."
         )
+    return taxonomy
 
+
+def _createTaxonomyFromJSON(
+    bits: dict,
+    utr: dict,
+    labelLookups: LabelLookupTables | None = None,
+    requiredUnits: RequiredUnitsTable | None = None,
+) -> Taxonomy:
     qnameMaker = getBootstrapQNameMaker()
     for prefix, namespace in bits["namespaces"].items():
         qnameMaker.addNamespacePrefix(prefix, namespace)
 
-    concepts: dict[str, Concept] = {
-        str_qname: Concept(qnameMaker, str_qname, jconcept)
-        for str_qname, jconcept in bits["concepts"].items()
-    }
+    savings = _INTERNER.startTaxonomy(bits["entryPoint"])
+    concepts: dict[str, Concept] = {}
+    for str_qname, jconcept in bits["concepts"].items():
+        concept = Concept(qnameMaker, str_qname, jconcept)
+        concept._shareValues(_INTERNER, savings)
+        concepts[_INTERNER.string(str_qname, savings)] = concept
 
-    _TAXONOMIES[entryPoint] = Taxonomy(
+    taxonomy = Taxonomy(
         concepts,
-        entryPoint=entryPoint,
+        entryPoint=bits["entryPoint"],
         presentation=bits["presentation"],
         dimensions=bits["dimensions"],
         qnameMaker=qnameMaker,
-        utr=UTR.fromDict(
-            getObject(getResource(registries, "utr.json")), qnameMaker=qnameMaker
-        ),
+        utr=_INTERNER.utr(utr, qnameMaker, savings),
+        labelLookups=labelLookups,
+        requiredUnits=requiredUnits,
+    )
+    taxonomy._shareValues(_INTERNER, savings)
+    qnameMaker.forgetValidatedStrings()
+    return taxonomy
+
+
+def getInterningReport() -> tuple[Mapping[str, Counter[str]], int]:
+    """Bytes saved, by kind of value, in each loaded taxonomy by sharing values
+    with the taxonomies loaded before it (and within itself), and the bytes used
+    to do that sharing."""
+    return (
+        {ep: Counter(saved) for ep, saved in _INTERNER.savedBytes.items()},
+        _INTERNER.overheadBytes(),
+    )
+
+
+def _writeAtomically(destination: Path, content: bytes) -> None:
+    temp = destination.with_name(f"{destination.name}.tmp")
+    temp.write_bytes(content)
+    os.replace(temp, destination)
+
+
+def _snapshotSources(source: Traversable) -> dict[str, str]:
+    """SHA-256 of the JSON files a snapshot is built from, by file name."""
+    return {
+        f.name: hashlib.sha256(f.read_bytes()).hexdigest()
+        for f in (source, getResource(registries, "utr.json"))
+    }
+
+
+def buildTaxonomyManifest(directory: Path | None = None) -> Path:
+    """Write the manifest that lets listTaxonomies() and
+    getTaxonomySupportedLanguages() work without building any taxonomy.
+
+    The manifest is checked in; rebuild it whenever taxonomy JSON is added or
+    updated. By default it is written alongside the taxonomy JSON."""
+    if directory is None:
+        directory = Path(str(files(taxonomies)))
+    manifest = {}
+    for f in _taxonomyJsonFiles():
+        taxonomy = _createTaxonomyFromJSON(getObject(f), _getUTRJSON())
+        manifest[taxonomy.entryPoint] = {
+            "file": f.name,
+            "supportedLanguages": sorted(taxonomy.supportedLanguages),
+        }
+    destination = directory / TAXONOMY_MANIFEST_NAME
+    _writeAtomically(
+        destination, (json.dumps(manifest, indent=2) + "\n").encode("utf-8")
     )
+    return destination
+
+
+def buildTaxonomySnapshots(directory: Path | None = None) -> list[Path]:
+    """Write a snapshot of each built-in taxonomy for getTaxonomy() to restore
+    instead of parsing and indexing the JSON.
+
+    A snapshot is MessagePack holding the taxonomy's JSON along with the label
+    lookup tables and the units each concept requires, which Taxonomy would
+    otherwise compute. It records the SHA-256 of the JSON used so that it is
+    ignored once that changes. By default they are written alongside the
+    taxonomy JSON, as vsme-2024-12-17.msgpack for vsme-2024-12-17.json and so
+    on."""
+    if directory is None:
+        directory = Path(str(files(taxonomies)))
+    written = []
+    for f in _taxonomyJsonFiles():
+        raw = f.read_bytes()
+        # Taxonomy consumes parts of the JSON it is given, so index a copy.
+        taxonomy = _createTaxonomyFromJSON(json.loads(raw), _getUTRJSON())
+        snapshot = {
+            "format": TAXONOMY_SNAPSHOT_FORMAT,
+            "sources": _snapshotSources(f),
+            "taxonomy": json.loads(raw),
+            "labelLookups": Taxonomy._indexLabels(
+                tuple(taxonomy._conceptsByString.values())
+            ),
+            "requiredUnits": taxonomy._findRequiredUnits(),
+        }
+        destination = directory / (
+            f.name.removesuffix(".json") + TAXONOMY_SNAPSHOT_SUFFIX
+        )
+        _writeAtomically(destination, msgpack.packb(snapshot, use_bin_type=True))
+        written.append(destination)
+    return written
+
+
+def _restoreTaxonomySnapshot(
+    snapshot: Traversable, source: Traversable
+) -> Taxonomy | None:
+    """Rebuild the taxonomy held in a snapshot, or None if the snapshot is
+    unreadable or out of date with respect to the JSON it was built from."""
+    try:
+        bits = msgpack.unpackb(snapshot.read_bytes(), raw=False)
+        if bits["format"] != TAXONOMY_SNAPSHOT_FORMAT:
+            L.info(f"Ignoring taxonomy snapshot with format {bits['format']}.")
+            return None
+        if bits["sources"] != _snapshotSources(source):
+            L.warning(
+                f"Ignoring stale taxonomy snapshot {snapshot.name}; rebuild it"
+                " with scripts/build-taxonomy-snapshot.py."
+            )
+            return None
+        return _createTaxonomyFromJSON(
+            bits["taxonomy"],
+            _getUTRJSON(),
+            bits["labelLookups"],
+            bits["requiredUnits"],
+        )
+    except (KeyError, TypeError, ValueError, msgpack.UnpackException) as e:
+        L.warning(f"Ignoring unreadable taxonomy snapshot {snapshot.name}", exc_info=e)
+        return None
@@ -0,0 +1,170 @@
+"""
+Sharing of equal values between the loaded taxonomies.
+
+The built-in taxonomies are successive versions of the same taxonomy, so most
+of their label text, label dictionaries and the QNames of everything outside
+the versioned namespaces are equal. Each taxonomy is built from its own JSON
+though, giving every one of them its own copies. The TaxonomyInterner hands
+back one shared instance of each distinct value instead and keeps count of the
+bytes that saves.
+
+Shared values are not copied so must never be modified.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from mireport.typealiases import LabelsByLang, LabelsByRole
+from mireport.utr import UTR
+from mireport.xml import QName, QNameMaker
+
+if TYPE_CHECKING:
+    from typing import Any
+
+INTERNED_KINDS = ("strings", "labels", "qnames", "utr")
+
+
+def deepSizeOf(obj: Any) -> int:
+    """Approximate number of bytes used by obj and everything it refers to
+    (through containers and __slots__), counting each object once."""
+    visited: set[int] = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, Mapping):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            for slot in getattr(type(current), "__slots__", ()):
+                if (value := getattr(current, slot, None)) is not None:
+                    stack.append(value)
+    return size
+
+
+class InterningSavings:
+    """Bytes saved by sharing while one taxonomy is loaded.
+
+    JSON parsing already shares some objects (dictionary keys, for example) so
+    the same duplicate can be handed to the interner many times. Each is
+    counted once, and kept alive until loading is done so that its id() is not
+    reused by another object that then goes uncounted."""
+
+    def __init__(self, savedBytes: Counter[str]) -> None:
+        self.savedBytes = savedBytes
+        self._counted: dict[int, Any] = {}
+
+    def discard(self, kind: str, duplicate: Any) -> None:
+        """Count duplicate itself. Anything it refers to that is also freed is
+        counted by its own discard()."""
+        if id(duplicate) not in self._counted:
+            self._counted[id(duplicate)] = duplicate
+            self.savedBytes[kind] += sys.getsizeof(duplicate)
+
+
+class TaxonomyInterner:
+    """Pools of the values shared between taxonomies.
+
+    Each method returns the pooled value equal to the one given, pooling it if
+    it is the first, and counts the duplicate that can now be thrown away. The
+    pools live as long as the interner so that taxonomies loaded later still
+    share with earlier ones."""
+
+    def __init__(self) -> None:
+        # Keys are flat (role, text, role, text, ...) tuples: a tuple of pairs
+        # would cost more than many of the dictionaries it saves.
+        self._labelsByRole: dict[tuple[str, ...], LabelsByRole] = {}
+        self._labelsByLang: dict[tuple[str | int, ...], LabelsByLang] = {}
+        self._qnames: dict[QName, QName] = {}
+        self._utr: UTR | None = None
+        self._utrTablesSize = 0
+        self.savedBytes: dict[str, Counter[str]] = {}
+
+    def startTaxonomy(self, entryPoint: str) -> InterningSavings:
+        """Start counting the bytes saved for entryPoint (from zero, if it has
+        been loaded before)."""
+        self.savedBytes[entryPoint] = Counter()
+        return InterningSavings(self.savedBytes[entryPoint])
+
+    def string(self, text: str, savings: InterningSavings) -> str:
+        shared = sys.intern(text)
+        if shared is not text:
+            savings.discard("strings", text)
+        return shared
+
+    def labels(self, labels: LabelsByLang, savings: InterningSavings) -> LabelsByLang:
+        byLang = {
+            self.string(lang, savings): self._labelsForLang(byRole, savings)
+            for lang, byRole in labels.items()
+        }
+        # The inner dictionaries are pooled already so their identity will do.
+        key = tuple(x for lang, byRole in byLang.items() for x in (lang, id(byRole)))
+        if (shared := self._labelsByLang.get(key)) is None:
+            shared = self._labelsByLang[key] = byLang
+        else:
+            savings.discard("labels", labels)
+        return shared
+
+    def _labelsForLang(
+        self, labels: LabelsByRole, savings: InterningSavings
+    ) -> LabelsByRole:
+        byRole = {
+            self.string(role, savings): self.string(text, savings)
+            for role, text in labels.items()
+        }
+        key = tuple(x for item in byRole.items() for x in item)
+        if (shared := self._labelsByRole.get(key)) is None:
+            shared = self._labelsByRole[key] = byRole
+        else:
+            savings.discard("labels", labels)
+        return shared
+
+    def qname(self, qname: QName, savings: InterningSavings) -> QName:
+        shared = self._qnames.setdefault(qname, qname)
+        if shared is not qname:
+            savings.discard("qnames", qname)
+        return shared
+
+    def utr(self, utr: dict, qnameMaker: QNameMaker, savings: InterningSavings) -> UTR:
+        """A UTR for qnameMaker, sharing the lookup tables of the first one made
+        where the namespace prefixes allow it."""
+        if self._utr is not None:
+            shared = self._utr.sharedWith(qnameMaker)
+            if shared is not None:
+                savings.savedBytes["utr"] += self._utrTablesSize
+                return shared
+        made = UTR.fromDict(utr, qnameMaker=qnameMaker)
+        if self._utr is None:
+            self._utr = made
+            self._utrTablesSize = deepSizeOf(
+                (
+                    made._lookupNamespacesByUnitId,
+                    made._lookupUnitIdByDataType,
+                    made._lookupUnitEntriesByQName,
+                )
+            )
+        return made
+
+    def overheadBytes(self) -> int:
+        """Bytes used by the pools themselves (not the values pooled)."""
+        size = sum(
+            sys.getsizeof(pool)
+            for pool in (self._labelsByRole, self._labelsByLang, self._qnames)
+        )
+        # Only the key tuples (and ids), the strings in them are shared values.
+        size += sum(sys.getsizeof(key) for key in self._labelsByRole)
+        size += sum(
+            sys.getsizeof(key) + sum(sys.getsizeof(x) for x in key if type(x) is int)
+            for key in self._labelsByLang
+        )
+        return size
@@ -57,6 +57,25 @@ class UTR:
 
         return cls(unitToNamespaces, dataTypeToUnit, unitQNamesToEntries, qnameMaker)
 
+    def sharedWith(self, qnameMaker: QNameMaker) -> Self | None:
+        """Another UTR using this one's (read only) lookup tables but resolving
+        unit identifiers with qnameMaker.
+
+        Returns None if qnameMaker binds any namespace the tables use to a
+        different prefix, as the tables' QNames would then not match the ones
+        qnameMaker makes."""
+        qnames = [q for q in self._lookupUnitIdByDataType if isinstance(q, QName)]
+        qnames.extend(self._lookupUnitEntriesByQName)
+        for prefix, namespace in {(q.prefix, q.namespace) for q in qnames}:
+            if qnameMaker.getPrefixForNamespace(namespace) != prefix:
+                return None
+        return type(self)(
+            self._lookupNamespacesByUnitId,
+            self._lookupUnitIdByDataType,
+            self._lookupUnitEntriesByQName,
+            qnameMaker,
+        )
+
     # N.B. B019 (cache keeps `self` alive) is not a concern: a UTR belongs to a
     # Taxonomy which is kept in a module level registry for the life of the process.
     @cache  # noqa: B019
@@ -13,9 +13,9 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from openpyxl.workbook.defined_name import DefinedName
-    from openpyxl.worksheet.worksheet import Worksheet
 
     from mireport.taxonomy import Concept, Taxonomy
+    from mireport.xlsx_template_reader._grid import WorksheetGrid
     from mireport.xlsx_template_reader._reader import WorkbookReader
 
 from mireport.conversionresults import ConversionResultsBuilder, MessageType
@@ -159,16 +159,16 @@ class WorkbookBinder:
     ) -> tuple[
         list[XbrlConceptCellRangeMetadata],
         frozenset[Concept],
-        dict[Worksheet, list[XbrlConceptCellRangeMetadata]],
+        dict[WorksheetGrid, list[XbrlConceptCellRangeMetadata]],
     ]:
         """Single pass over concept_map: the hypercube table ranges, every concept
         present, and a worksheet-keyed index of reportable/dimension candidate ranges."""
         hypercubes = self._taxonomy.hypercubes
         hypercube_ranges: list[XbrlConceptCellRangeMetadata] = []
         concepts_in_excel: list[Concept] = []
-        candidates_by_ws: defaultdict[Worksheet, list[XbrlConceptCellRangeMetadata]] = (
-            defaultdict(list)
-        )
+        candidates_by_ws: defaultdict[
+            WorksheetGrid, list[XbrlConceptCellRangeMetadata]
+        ] = defaultdict(list)
         for crm in concept_map.values():
             concept = crm.concept
             concepts_in_excel.append(concept)
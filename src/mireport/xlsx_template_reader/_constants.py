@@ -8,7 +8,9 @@ from typing import (
 from openpyxl.cell import Cell, MergedCell, ReadOnlyCell
 from openpyxl.cell.cell import ERROR_CODES
 
-CellType: TypeAlias = ReadOnlyCell | MergedCell | Cell
+from mireport.xlsx_template_reader._grid import GridCell
+
+CellType: TypeAlias = GridCell | ReadOnlyCell | MergedCell | Cell
 CellValueType: TypeAlias = bool | float | int | str | datetime | date | time | None
 
 # Placeholders a user types to mean "nothing to report here". Excel error
@@ -16,6 +18,10 @@ CellValueType: TypeAlias = bool | float | int | str | datetime | date | time | N
 # reported (see is_error_value) rather than skipped.
 EXCEL_VALUES_TO_BE_TREATED_AS_NONE_VALUE = frozenset({"-"})
 IGNORED_DEFINED_NAME_PREFIXES = ("enum_", "template_")
+# Defined names that only give a data validation its list of choices. Nothing
+# reads them, so neither are the sheets they point at (unless some other
+# defined name points there too).
+LOOKUP_LIST_DEFINED_NAME_PREFIXES = ("enum_",)
 
 # TODO FIXME Temporary workarounds for the VSME taxonomy.
 # Template named ranges whose name doesn't match the taxonomy concept local
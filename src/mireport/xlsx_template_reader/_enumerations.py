@@ -17,7 +17,6 @@ report).
 
 from __future__ import annotations
 
-import difflib
 from functools import lru_cache
 from typing import TYPE_CHECKING, NamedTuple
 
@@ -25,7 +24,7 @@ if TYPE_CHECKING:
     from mireport.taxonomy import Concept, Taxonomy
     from mireport.xlsx_template_reader._config import ConverterConfig
 
-from mireport.stringutil import stripLabelSuffix
+from mireport.stringutil import CloseMatchIndex, stripLabelSuffix
 
 
 @lru_cache(maxsize=100)
@@ -42,21 +41,25 @@ def eeDomainByLabel(eeConcept: Concept) -> dict[str, tuple[Concept, str]]:
             result = (eeMember, actual_label)
             eeDomainLabels[actual_label] = result
 
-            # difflib matching works better if we strip the [member] suffix
+            # closest matching works better if we strip the [member] suffix
             label_no_suffix = stripLabelSuffix(actual_label)
             eeDomainLabels[label_no_suffix] = result
     return eeDomainLabels
 
 
+@lru_cache(maxsize=100)
+def eeDomainMatchIndex(eeConcept: Concept) -> CloseMatchIndex:
+    return CloseMatchIndex(eeDomainByLabel(eeConcept))
+
+
 def getClosestEEMemberMatch(
     eeConcept: Concept, text: str
 ) -> tuple[Concept, str] | None:
-    eeDomainLabels = eeDomainByLabel(eeConcept)
-    closest_matches = difflib.get_close_matches(
-        text, eeDomainLabels.keys(), n=1, cutoff=0.6
-    )
-    if closest_matches:
-        return eeDomainLabels[closest_matches[0]]
+    """The domain member with the label difflib.get_close_matches() finds
+    closest to text (cutoff 0.6), and that label."""
+    closest = eeDomainMatchIndex(eeConcept).closest(text)
+    if closest is not None:
+        return eeDomainByLabel(eeConcept)[closest]
     return None
 
 
@@ -26,6 +26,7 @@ from mireport.conversionresults import MessageType
 from mireport.exceptions import AmbiguousComponentException
 from mireport.stringutil import str_to_markupsafe
 from mireport.taxonomy import QName
+from mireport.xlsx_template_reader._grid import MergedGridCell
 from mireport.xlsx_template_reader._reader import CellValue
 
 L = logging.getLogger(__name__)
@@ -231,7 +232,7 @@ def _readFootnoteRow(
     is_boundary = False
     text: str | None = None
     cell = row_cells[text_col]
-    if not isinstance(cell, MergedCell):
+    if not isinstance(cell, MergedCell | MergedGridCell):
         is_boundary = True
         if not (value := read(cell)).isBlank:
             text = value.as_str_stripped()
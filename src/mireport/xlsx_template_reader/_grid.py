@@ -0,0 +1,203 @@
+"""Worksheet cell grids: the cells the reader needs, read in one sweep.
+
+Named ranges on a template overlap heavily (a table's range contains the
+ranges of its columns, and so on), so walking each one through openpyxl reads
+the same cells many times over. Instead, the first time WorkbookReader needs a
+worksheet, every named range on it is read into a WorksheetGrid in a single
+pass over the worksheet's cells, and from then on all range walks and single
+cell lookups are answered from the grid.
+
+A grid holds just the cells with a value (with their number format) and the
+continuation cells of merged ranges; any other position reads as an empty
+GridCell.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from openpyxl.cell import MergedCell
+from openpyxl.utils.cell import get_column_letter
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.worksheet import Worksheet
+
+if TYPE_CHECKING:
+    from mireport.xlsx_template_reader._spreadsheetml import SpreadsheetMLWorksheet
+
+
+class GridCell(NamedTuple):
+    """The parts of an Excel cell that a conversion reads."""
+
+    row: int
+    column: int
+    value: Any = None
+    number_format: str = "General"
+
+    @property
+    def coordinate(self) -> str:
+        return f"{get_column_letter(self.column)}{self.row}"
+
+
+class MergedGridCell(GridCell):
+    """A cell covered by a merged range (other than its top-left cell). Like
+    openpyxl's MergedCell it never holds a value."""
+
+    __slots__ = ()
+
+
+class WorksheetGrid:
+    """The cells of a worksheet within the ranges read from it so far.
+
+    Offers the cell() and iter_rows() of an openpyxl Worksheet (just the
+    keyword arguments the reader uses), so range helpers work with either.
+    """
+
+    __slots__ = ("_fetched", "_rowNumbers", "_rows", "title")
+
+    def __init__(self, title: str) -> None:
+        self.title = title
+        self._rows: dict[int, dict[int, GridCell]] = {}
+        self._fetched: set[tuple[int, int, int, int]] = set()
+        # The keys of _rows in order, worked out when first needed.
+        self._rowNumbers: list[int] | None = None
+
+    def fetch(
+        self,
+        worksheet: Worksheet | ReadOnlyWorksheet | SpreadsheetMLWorksheet,
+        ranges: Iterable[CellRange],
+    ) -> None:
+        """Read the cells of worksheet within any of ranges (that haven't
+        already been read) in one sweep over the worksheet."""
+        spans: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        for cr in ranges:
+            bounds = cr.bounds
+            if None in bounds or bounds in self._fetched:
+                continue
+            self._fetched.add(bounds)
+            for row in range(cr.min_row, cr.max_row + 1):
+                spans[row].append((cr.min_col, cr.max_col))
+        if not spans:
+            return
+        for row, rowSpans in spans.items():
+            spans[row] = _mergeSpans(rowSpans)
+
+        for cell in _sweep(worksheet, spans):
+            merged = isinstance(cell, MergedCell | MergedGridCell)
+            if not merged and cell.value is None:
+                continue
+            row, column = cell.row, cell.column
+            if (covering := spans.get(row)) is None or not any(
+                first <= column <= last for first, last in covering
+            ):
+                continue
+            if not isinstance(cell, GridCell):
+                cell = (
+                    MergedGridCell(row, column)
+                    if merged
+                    else GridCell(row, column, cell.value, cell.number_format)
+                )
+            self._rows.setdefault(row, {})[column] = cell
+        self._rowNumbers = None
+
+    def cell(self, row: int, column: int) -> GridCell:
+        if (cells := self._rows.get(row)) is not None and (
+            cell := cells.get(column)
+        ) is not None:
+            return cell
+        return GridCell(row, column)
+
+    def iter_rows(
+        self, *, min_row: int, min_col: int, max_row: int, max_col: int
+    ) -> Iterator[tuple[GridCell, ...]]:
+        columns = range(min_col, max_col + 1)
+        for row in range(min_row, max_row + 1):
+            if (cells := self._rows.get(row)) is None:
+                yield tuple(GridCell(row, column) for column in columns)
+            else:
+                yield tuple(
+                    cells.get(column) or GridCell(row, column) for column in columns
+                )
+
+    def iterPopulatedRows(
+        self, *, min_row: int, min_col: int, max_row: int, max_col: int
+    ) -> Iterator[tuple[int, tuple[GridCell, ...]]]:
+        """Yield (row_number, cells) for just the rows with a value in them,
+        cells being only the cells (in column order) with a value. Rows with
+        nothing in them are skipped without being looked at, so a mostly
+        empty range costs no more than its values."""
+        if self._rowNumbers is None:
+            self._rowNumbers = sorted(self._rows)
+        rowNumbers = self._rowNumbers
+        width = max_col - min_col + 1
+        for row in rowNumbers[
+            bisect_left(rowNumbers, min_row) : bisect_right(rowNumbers, max_row)
+        ]:
+            cells = self._rows[row]
+            if len(cells) < width:
+                columns: Iterable[int] = sorted(
+                    column for column in cells if min_col <= column <= max_col
+                )
+            else:
+                columns = range(min_col, max_col + 1)
+            populated = tuple(
+                cell
+                for column in columns
+                if (cell := cells.get(column)) is not None and cell.value is not None
+            )
+            if populated:
+                yield row, populated
+
+
+def _mergeSpans(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Overlapping or adjacent column spans joined together."""
+    merged: list[tuple[int, int]] = []
+    for first, last in sorted(spans):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def _sweep(
+    worksheet: Worksheet | ReadOnlyWorksheet | SpreadsheetMLWorksheet,
+    spans: dict[int, list[tuple[int, int]]],
+) -> Iterator[Any]:
+    """Every cell of worksheet that might lie within spans, each visited once.
+
+    A normal (or SpreadsheetML) worksheet keeps only the cells that exist in
+    the file (or that have been used since), so either those are looked
+    through or, when spans cover fewer cells than that, their positions are
+    looked up. A read-only worksheet can only be read from the start, so a
+    single streaming pass is made over the rows and columns spans covers.
+    """
+    if not isinstance(worksheet, ReadOnlyWorksheet):
+        cells = worksheet._cells
+        area = sum(last - first + 1 for s in spans.values() for first, last in s)
+        if area >= len(cells):
+            return iter(cells.values())
+        return (
+            cell
+            for row, rowSpans in spans.items()
+            for first, last in rowSpans
+            for column in range(first, last + 1)
+            if (cell := cells.get((row, column))) is not None
+        )
+    columns = [
+        column for rowSpans in spans.values() for span in rowSpans for column in span
+    ]
+    return (
+        cell
+        for row in worksheet.iter_rows(
+            min_row=min(spans),
+            max_row=max(spans),
+            min_col=min(columns),
+            max_col=max(columns),
+        )
+        for cell in row
+    )
@@ -7,9 +7,12 @@ XbrlConceptCellRangeMetadata additionally ties the range to a taxonomy concept.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, NamedTuple
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from typing import Self
@@ -20,15 +23,17 @@ from openpyxl.workbook.defined_name import DefinedName
 from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
+from mireport.conversionresults import CellSet
 from mireport.exceptions import OpenPyXlRelatedException
 from mireport.xlsx_template_reader._constants import CellType
+from mireport.xlsx_template_reader._grid import WorksheetGrid
 from mireport.xlsx_template_reader.util import excelCellRangeRef, excelCellRef
 
 
 @dataclass(slots=True, eq=True, frozen=True)
 class CellRangeMetadata:
     definedName: DefinedName
-    worksheet: Worksheet
+    worksheet: WorksheetGrid
     cellRange: CellRange
     populated_width: int
     populated_height: int
@@ -69,6 +74,11 @@ class CellRangeMetadata:
         """Yield (row_number, cells) for each row of the range."""
         return iterRows(self.worksheet, self.cellRange)
 
+    def populatedRows(self) -> Iterator[tuple[int, tuple[CellType, ...]]]:
+        """Yield (row_number, cells) for just the rows of the range with a
+        value, cells being just the cells with a value."""
+        return iterPopulatedRows(self.worksheet, self.cellRange)
+
     def cells(self) -> Iterator[CellType]:
         """Yield every cell of the range, row by row."""
         return iterCells(self.worksheet, self.cellRange)
@@ -113,7 +123,7 @@ class XbrlConceptCellRangeMetadata(CellRangeMetadata):
 
 
 def iterRows(
-    ws: Worksheet, cr: CellRange
+    ws: WorksheetGrid | Worksheet, cr: CellRange
 ) -> Iterator[tuple[int, tuple[CellType, ...]]]:
     """Yield (row_number, cells) for each row of the range."""
     if cr.min_row is None or cr.min_col is None:
@@ -131,14 +141,82 @@ def iterRows(
     )
 
 
-def iterCells(ws: Worksheet, cr: CellRange) -> Iterator[CellType]:
+def iterPopulatedRows(
+    ws: WorksheetGrid | Worksheet, cr: CellRange
+) -> Iterator[tuple[int, tuple[CellType, ...]]]:
+    """Yield (row_number, cells) for just the rows of the range with a value,
+    cells being just the cells with a value.
+
+    Only the cells the worksheet holds are looked at (and, unlike iterRows, no
+    empty cells are made along the way), so the cost follows the number of
+    values rather than the size of the range. An openpyxl Worksheet's cells
+    are indexed by row once and the index shared by all its ranges.
+    """
+    if cr.min_row is None or cr.min_col is None:
+        raise OpenPyXlRelatedException(
+            f"Cell range bounds expected to be int but actually None {cr=}"
+        )
+    if isinstance(ws, WorksheetGrid):
+        yield from ws.iterPopulatedRows(
+            min_row=cr.min_row,
+            min_col=cr.min_col,
+            max_row=cr.max_row,
+            max_col=cr.max_col,
+        )
+        return
+    index = _WORKSHEET_ROW_INDEXES.get(ws)
+    if index is None or index.cellCount != len(ws._cells):
+        index = _WORKSHEET_ROW_INDEXES[ws] = _RowIndex.build(ws)
+    rowNumbers = index.rowNumbers
+    for row in rowNumbers[
+        bisect_left(rowNumbers, cr.min_row) : bisect_right(rowNumbers, cr.max_row)
+    ]:
+        columns, rowCells = index.rows[row]
+        if cells := tuple(
+            cell
+            for cell in rowCells[
+                bisect_left(columns, cr.min_col) : bisect_right(columns, cr.max_col)
+            ]
+            if cell.value is not None
+        ):
+            yield row, cells
+
+
+class _RowIndex(NamedTuple):
+    """An openpyxl Worksheet's cells by row, as WorksheetGrid keeps its own:
+    the row numbers in order and, for each row, its column numbers in order
+    with their cells."""
+
+    cellCount: int
+    rowNumbers: list[int]
+    rows: dict[int, tuple[list[int], list[CellType]]]
+
+    @classmethod
+    def build(cls, ws: Worksheet) -> Self:
+        rows: defaultdict[int, tuple[list[int], list[CellType]]] = defaultdict(
+            lambda: ([], [])
+        )
+        for (row, column), cell in sorted(ws._cells.items()):
+            columns, cells = rows[row]
+            columns.append(column)
+            cells.append(cell)
+        return cls(len(ws._cells), sorted(rows), dict(rows))
+
+
+# Built the first time a worksheet's populated rows are wanted and reused for
+# all its ranges. Rebuilt if cells have been added to (or removed from) it
+# since; cell values are looked at afresh each time.
+_WORKSHEET_ROW_INDEXES: WeakKeyDictionary[Worksheet, _RowIndex] = WeakKeyDictionary()
+
+
+def iterCells(ws: WorksheetGrid | Worksheet, cr: CellRange) -> Iterator[CellType]:
     """Yield every cell of the range, row by row."""
     for _, row in iterRows(ws, cr):
         yield from row
 
 
 def iterCellsWithCoords(
-    ws: Worksheet, cr: CellRange
+    ws: WorksheetGrid | Worksheet, cr: CellRange
 ) -> Iterator[tuple[int, int, CellType]]:
     """Yield (row_number, column_number, cell) for every cell of the range."""
     for rnum, row in iterRows(ws, cr):
@@ -147,8 +225,8 @@ def iterCellsWithCoords(
 
 
 class _CellRangeDimensions(NamedTuple):
-    cellsAccessed: set[tuple[str, int, int]]
-    cellsPopulated: set[tuple[str, int, int]]
+    cellsAccessed: CellSet
+    cellsPopulated: CellSet
     populated_width: int
     populated_height: int
     populated_min_col: int
@@ -164,46 +242,34 @@ class _CellRangeDimensions(NamedTuple):
 
 
 def getEffectiveCellRangeDimensions(
-    ws: Worksheet, cell_range: CellRange
+    ws: WorksheetGrid | Worksheet, cell_range: CellRange
 ) -> _CellRangeDimensions:
+    sheetName = ws.title
+    populated_rows: list[int] = []
     cols_not_empty: set[int] = set()
-    cols_with_none: set[int] = set()
-    populated_rows: set[int] = set()
-    populatedCellCount: set[tuple[str, int, int]] = set()
-    cellCount: set[tuple[str, int, int]] = set()
+    populatedCells = CellSet()
+    for rnum, cells in iterPopulatedRows(ws, cell_range):
+        populated_rows.append(rnum)
+        for cell in cells:
+            cols_not_empty.add(cell.column)
+            populatedCells.add(sheetName, rnum, cell.column)
+    cellsAccessed = CellSet()
+    cellsAccessed.addRange(
+        sheetName,
+        cell_range.min_row,
+        cell_range.min_col,
+        cell_range.max_row,
+        cell_range.max_col,
+    )
 
-    last_rnum = None
-    empty_row = True
-    sheetName = ws.title
-    for rnum, cnum, cell in iterCellsWithCoords(ws, cell_range):
-        cellCount.add((sheetName, rnum, cnum))
-        if last_rnum is None:
-            last_rnum = rnum
-
-        if rnum != last_rnum:
-            if not empty_row:
-                populated_rows.add(last_rnum)
-            last_rnum = rnum
-            empty_row = True
-
-        if cell.value is not None:
-            populatedCellCount.add((sheetName, rnum, cnum))
-            empty_row = False
-            cols_not_empty.add(cnum)
-        else:
-            cols_with_none.add(cnum)
-    if last_rnum is not None and not empty_row:
-        populated_rows.add(last_rnum)
-
-    definitely_empty_cols = cols_with_none - cols_not_empty
-    total_cols = len(cols_not_empty.union(cols_with_none))
-    populated_width = max(1, total_cols - len(definitely_empty_cols))
+    # Every column of the range without a value in it is left out.
+    populated_width = max(1, len(cols_not_empty))
     populated_height = max(1, len(populated_rows))
     populated_min_col = min(cols_not_empty, default=None) or cell_range.min_col
     populated_min_row = min(populated_rows, default=None) or cell_range.min_row
     return _CellRangeDimensions(
-        cellsAccessed=cellCount,
-        cellsPopulated=populatedCellCount,
+        cellsAccessed=cellsAccessed,
+        cellsPopulated=populatedCells,
         populated_width=populated_width,
         populated_height=populated_height,
         populated_min_col=populated_min_col,
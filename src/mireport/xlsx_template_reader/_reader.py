@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
+from typing import TypeAlias
 
 from openpyxl import Workbook
 from openpyxl.workbook.defined_name import DefinedName
@@ -16,11 +18,13 @@ from mireport.xlsx_template_reader._constants import (
     CellValueType,
     is_error_value,
 )
+from mireport.xlsx_template_reader._grid import WorksheetGrid
 from mireport.xlsx_template_reader._messages import Messenger
 from mireport.xlsx_template_reader._ranges import (
     CellRangeMetadata,
     getEffectiveCellRangeDimensions,
 )
+from mireport.xlsx_template_reader._spreadsheetml import SpreadsheetMLWorkbook
 from mireport.xlsx_template_reader.util import (
     excelDefinedNameRef,
     getDateFromValue,
@@ -28,6 +32,10 @@ from mireport.xlsx_template_reader.util import (
 
 L = logging.getLogger(__name__)
 
+# What WorkbookReader reads from: an openpyxl Workbook or, skipping openpyxl's
+# object model, one read straight from the file's SpreadsheetML.
+TemplateWorkbook: TypeAlias = Workbook | SpreadsheetMLWorkbook
+
 
 @dataclass(frozen=True, slots=True)
 class CellValue:
@@ -88,15 +96,17 @@ class CellValue:
 
 
 class WorkbookReader:
-    """Ergonomic cell-level access to an openpyxl Workbook.
+    """Ergonomic cell-level access to an openpyxl (or SpreadsheetML) workbook.
 
     Carries the workbook and results builder, with internal tracking of
-    unused named ranges.
+    unused named ranges. Cells are read through a WorksheetGrid per worksheet,
+    filled with all of the worksheet's named ranges the first time any of
+    them is asked for.
     """
 
     def __init__(
         self,
-        workbook: Workbook,
+        workbook: TemplateWorkbook,
         results: ConversionResultsBuilder,
     ) -> None:
         self._workbook = workbook
@@ -107,6 +117,10 @@ class WorkbookReader:
         }
         self._results = results
         self._msg = Messenger(results)
+        self._grids: dict[str, WorksheetGrid] = {}
+        self._rangesBySheet: dict[str, list[CellRange]] | None = None
+        self._destinationsByRef: dict[str, list[tuple[str, str]]] = {}
+        self._cellRanges: dict[str, CellRange] = {}
 
     def close(self) -> None:
         self._workbook.close()
@@ -129,7 +143,7 @@ class WorkbookReader:
         damaged (unreadable, zero or multiple destinations, broken reference).
         """
         try:
-            all_destinations = list(dn.destinations)
+            all_destinations = self._destinations(dn)
         except AttributeError:
             self._msg.error(
                 f"Named range {dn.name} has an unreadable destination: {dn.attr_text!r}. \nSomething has modified the digital template's structure. \nPlease try a fresh copy of the template and check that it has not been modified in unsupported ways.",
@@ -163,8 +177,8 @@ class WorkbookReader:
             )
             return None
         try:
-            ws = self._workbook[sheetName]
-            cr = CellRange(cell_range)
+            cr = self._cellRange(cell_range)
+            ws = self._worksheetGrid(sheetName, cr)
         except Exception as e:
             L.debug(
                 f"OpenPyXL error processing cell range. {dn.name=} {sheetName=} {cell_range=}",
@@ -184,6 +198,46 @@ class WorkbookReader:
             populated_min_row=dims.populated_min_row,
         )
 
+    def _worksheetGrid(self, sheetName: str, cellRange: CellRange) -> WorksheetGrid:
+        """The grid for a worksheet, holding (at least) cellRange."""
+        worksheet = self._workbook[sheetName]
+        if (grid := self._grids.get(sheetName)) is None:
+            grid = self._grids[sheetName] = WorksheetGrid(worksheet.title)
+            grid.fetch(worksheet, self._namedRangesBySheet().get(sheetName, ()))
+        # Only needed for a name added after the worksheet was first read.
+        grid.fetch(worksheet, (cellRange,))
+        return grid
+
+    def _namedRangesBySheet(self) -> dict[str, list[CellRange]]:
+        """The ranges of the names the conversion binds, by worksheet. Other
+        names (template_ ones, say) are read as and when they're asked for."""
+        if self._rangesBySheet is None:
+            self._rangesBySheet = defaultdict(list)
+            for dn in self._workbook.defined_names.values():
+                if not dn.name or dn.name.startswith(IGNORED_DEFINED_NAME_PREFIXES):
+                    continue
+                try:
+                    for sheetName, cellRange in self._destinations(dn):
+                        self._rangesBySheet[sheetName].append(
+                            self._cellRange(cellRange)
+                        )
+                except (AttributeError, TypeError, ValueError):
+                    # Damaged; peekRange reports it if the name is used.
+                    continue
+        return self._rangesBySheet
+
+    def _destinations(self, dn: DefinedName) -> list[tuple[str, str]]:
+        """dn.destinations, which openpyxl works out by tokenising the
+        reference afresh each time, tokenised just once."""
+        if (destinations := self._destinationsByRef.get(dn.attr_text)) is None:
+            destinations = self._destinationsByRef[dn.attr_text] = list(dn.destinations)
+        return destinations
+
+    def _cellRange(self, reference: str) -> CellRange:
+        if (cr := self._cellRanges.get(reference)) is None:
+            cr = self._cellRanges[reference] = CellRange(reference)
+        return cr
+
     def resolveRange(
         self,
         definedName: DefinedName | str | CellRangeMetadata,
@@ -20,9 +20,8 @@ from itertools import combinations
 from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
-    from openpyxl.worksheet.worksheet import Worksheet
-
     from mireport.taxonomy import Concept, Taxonomy
+    from mireport.xlsx_template_reader._grid import WorksheetGrid
     from mireport.xlsx_template_reader._reader import WorkbookReader
 
 from mireport.conversionresults import MessageType
@@ -236,7 +235,7 @@ class XBRLTableResolver:
         self,
         ctx: ExcelCellBindingContext,
         unit_map: dict[Concept, XbrlConceptCellRangeMetadata],
-        candidates_by_ws: dict[Worksheet, list[XbrlConceptCellRangeMetadata]],
+        candidates_by_ws: dict[WorksheetGrid, list[XbrlConceptCellRangeMetadata]],
         concepts_in_excel: frozenset[Concept],
     ) -> None:
         self._ctx = ctx
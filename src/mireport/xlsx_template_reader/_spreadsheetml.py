@@ -0,0 +1,324 @@
+"""Reading a template straight from its SpreadsheetML parts.
+
+openpyxl builds a full object model of the workbook (styles, every sheet, data
+validations, drawings and so on) when all a conversion needs is the defined
+names and the values and number formats of the cells on the worksheets those
+names point at. SpreadsheetMLWorkbook reads just that: workbook.xml, the shared
+strings, the number formats from styles.xml and the referenced sheetN.xml
+parts, each with a single incremental lxml parse.
+
+Cell values come out as openpyxl's own reader (with data_only and rich_text)
+would give them, so WorkbookReader can use either.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import zipfile
+from typing import TYPE_CHECKING, Any
+
+from lxml import etree
+from openpyxl.cell.rich_text import CellRichText
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    builtin_format_code,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_excel,
+    from_ISO8601,
+)
+from openpyxl.workbook.defined_name import DefinedName, DefinedNameDict
+from openpyxl.worksheet._reader import parse_richtext_string
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.xml.constants import PKG_REL_NS, REL_NS, SHEET_MAIN_NS
+
+from mireport.exceptions import SpreadsheetMLException
+from mireport.xlsx_template_reader._grid import GridCell, MergedGridCell
+from mireport.xlsx_template_reader.util import referencedSheetNames
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+
+_MAIN = f"{{{SHEET_MAIN_NS}}}"
+_RELATIONSHIP = f"{{{PKG_REL_NS}}}Relationship"
+_RELATIONSHIP_ID = f"{{{REL_NS}}}id"
+_OFFICE_DOCUMENT = f"{REL_NS}/officeDocument"
+_WORKSHEET = f"{REL_NS}/worksheet"
+_SHARED_STRINGS = f"{REL_NS}/sharedStrings"
+_STYLES = f"{REL_NS}/styles"
+# Sheet scoped print settings openpyxl also leaves out of defined_names.
+_RESERVED_NAMES = ("_xlnm.Print_Titles", "_xlnm.Print_Area", "_xlnm._FilterDatabase")
+# The file may well have been uploaded by anyone, so entities are never expanded.
+_PARSER = etree.XMLParser(resolve_entities=False)
+
+
+class SpreadsheetMLWorksheet:
+    """The cells with a value, and the continuation cells of merged ranges, of
+    a worksheet, by (row, column)."""
+
+    __slots__ = ("_cells", "title")
+
+    def __init__(self, title: str, cells: dict[tuple[int, int], GridCell]) -> None:
+        self.title = title
+        self._cells = cells
+
+
+class SpreadsheetMLWorkbook:
+    """The parts of an Excel workbook a conversion reads, in place of an
+    openpyxl Workbook: its (workbook scoped) defined_names and, by title, the
+    worksheets they point at (other than lookup lists)."""
+
+    def __init__(
+        self,
+        defined_names: DefinedNameDict,
+        worksheets: dict[str, SpreadsheetMLWorksheet],
+    ) -> None:
+        self.defined_names = defined_names
+        self._worksheets = worksheets
+
+    def __getitem__(self, title: str) -> SpreadsheetMLWorksheet:
+        if (worksheet := self._worksheets.get(title)) is None:
+            raise KeyError(f"Worksheet {title} does not exist.")
+        return worksheet
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self._worksheets)
+
+    def close(self) -> None:
+        """Nothing to do: the file is closed once it has been read."""
+
+
+def loadSpreadsheetMLFromPathOrFileLike(
+    pathOrFile: Path | BinaryIO,
+) -> SpreadsheetMLWorkbook:
+    """Read a workbook straight from its SpreadsheetML parts.
+
+    Raises SpreadsheetMLException if the file isn't an Excel workbook this can
+    read, in which case openpyxl should be tried instead.
+    """
+    try:
+        with zipfile.ZipFile(pathOrFile) as archive:
+            return _Package(archive).read()
+    except SpreadsheetMLException:
+        raise
+    except (
+        zipfile.BadZipFile,
+        KeyError,
+        ValueError,
+        TypeError,
+        IndexError,
+        etree.LxmlError,
+    ) as e:
+        raise SpreadsheetMLException(
+            f"Unable to read the Excel file as SpreadsheetML. {e}"
+        ) from e
+
+
+class _Package:
+    """Reads the parts of an Excel file's package that a conversion needs."""
+
+    def __init__(self, archive: zipfile.ZipFile) -> None:
+        self._archive = archive
+        self._epoch = CALENDAR_WINDOWS_1900
+        self._strings: list[str | CellRichText] = []
+        self._numberFormats: list[str] = []
+        self._dateStyles: set[int] = set()
+        self._timedeltaStyles: set[int] = set()
+
+    def read(self) -> SpreadsheetMLWorkbook:
+        workbookPart = self._part(self._relationships(""), _OFFICE_DOCUMENT)
+        if workbookPart is None:
+            raise SpreadsheetMLException("The file contains no workbook part.")
+        workbookRels = self._relationships(workbookPart)
+
+        root = etree.fromstring(self._archive.read(workbookPart), _PARSER)
+        if root.tag != f"{_MAIN}workbook":
+            raise SpreadsheetMLException(f"Unsupported workbook element {root.tag}.")
+        properties = root.find(f"{_MAIN}workbookPr")
+        if properties is not None and properties.get("date1904") in ("1", "true"):
+            self._epoch = CALENDAR_MAC_1904
+        definedNames = DefinedNameDict()
+        for element in root.iterfind(f"{_MAIN}definedNames/{_MAIN}definedName"):
+            dn = DefinedName.from_tree(element)
+            if dn.localSheetId is None and dn.name not in _RESERVED_NAMES:
+                definedNames.add(dn)
+
+        worksheets: dict[str, SpreadsheetMLWorksheet] = {}
+        wanted = referencedSheetNames(definedNames.values())
+        if wanted:
+            self._readSharedStrings(self._part(workbookRels, _SHARED_STRINGS))
+            self._readNumberFormats(self._part(workbookRels, _STYLES))
+            for element in root.iterfind(f"{_MAIN}sheets/{_MAIN}sheet"):
+                title = element.get("name")
+                relType, part = workbookRels[element.get(_RELATIONSHIP_ID, "")]
+                if title in wanted and relType == _WORKSHEET:
+                    worksheets[title] = SpreadsheetMLWorksheet(
+                        title, self._readCells(part)
+                    )
+        return SpreadsheetMLWorkbook(definedNames, worksheets)
+
+    def _relationships(self, sourcePart: str) -> dict[str, tuple[str, str]]:
+        """The (type, part name) of sourcePart's relationships, by id."""
+        folder, name = posixpath.split(sourcePart)
+        relsPart = posixpath.join(folder, "_rels", f"{name}.rels")
+        if relsPart not in self._archive.NameToInfo:
+            return {}
+        relationships = {}
+        for element in etree.fromstring(self._archive.read(relsPart), _PARSER).iter(
+            _RELATIONSHIP
+        ):
+            if element.get("TargetMode") == "External":
+                continue
+            target = element.get("Target", "")
+            if target.startswith("/"):
+                part = target[1:]
+            else:
+                part = posixpath.normpath(posixpath.join(folder, target))
+            relationships[element.get("Id", "")] = (element.get("Type", ""), part)
+        return relationships
+
+    @staticmethod
+    def _part(relationships: dict[str, tuple[str, str]], relType: str) -> str | None:
+        return next((part for t, part in relationships.values() if t == relType), None)
+
+    def _readSharedStrings(self, part: str | None) -> None:
+        """The shared string table, as openpyxl's read_rich_text() reads it,
+        less the rich text handling for strings that are a single run."""
+        if part is None:
+            return
+        t = f"{_MAIN}t"
+        with self._archive.open(part) as source:
+            for _, si in etree.iterparse(
+                source, tag=f"{_MAIN}si", resolve_entities=False
+            ):
+                text: str | CellRichText
+                if len(si) == 1 and si[0].tag == t:
+                    text = (si[0].text or "").replace("x005F_", "")
+                else:
+                    text = CellRichText.from_tree(si)
+                    if len(text) == 0:
+                        text = ""
+                    elif len(text) == 1 and isinstance(text[0], str):
+                        text = text[0]
+                self._strings.append(text)
+                si.clear()
+
+    def _readNumberFormats(self, part: str | None) -> None:
+        """The number format of each cell style, noting those for dates and
+        durations, as openpyxl's Stylesheet works them out."""
+        if part is None:
+            return
+        numFmtTag, cellXfsTag = f"{_MAIN}numFmt", f"{_MAIN}cellXfs"
+        custom: dict[int, str] = {}
+        with self._archive.open(part) as source:
+            for _, element in etree.iterparse(
+                source, tag=(numFmtTag, cellXfsTag), resolve_entities=False
+            ):
+                if element.tag == numFmtTag:
+                    # (Differential formats, later on, have numFmts of their own.)
+                    custom[int(element.get("numFmtId", ""))] = element.get(
+                        "formatCode", ""
+                    )
+                    continue
+                for index, xf in enumerate(element.iterchildren(f"{_MAIN}xf")):
+                    numFmtId = int(xf.get("numFmtId", 0))
+                    code: str | None
+                    if numFmtId in custom:
+                        code = custom[numFmtId]
+                        self._numberFormats.append(code)
+                    else:
+                        code = builtin_format_code(numFmtId)
+                        self._numberFormats.append(
+                            BUILTIN_FORMATS.get(numFmtId, "General")
+                        )
+                    if is_date_format(code):
+                        self._dateStyles.add(index)
+                    if is_timedelta_format(code):
+                        self._timedeltaStyles.add(index)
+                break
+
+    def _readCells(self, part: str) -> dict[tuple[int, int], GridCell]:
+        """The cells with a value, and the continuation cells of merged
+        ranges, of a worksheet part."""
+        cells: dict[tuple[int, int], GridCell] = {}
+        merges: list[str] = []
+        rowTag, mergeTag = f"{_MAIN}row", f"{_MAIN}mergeCell"
+        with self._archive.open(part) as source:
+            row = 0
+            for _, element in etree.iterparse(
+                source, tag=(rowTag, mergeTag), resolve_entities=False
+            ):
+                if element.tag == mergeTag:
+                    merges.append(element.get("ref", ""))
+                    continue
+                r = element.get("r")
+                row = int(float(r)) if r else row + 1
+                for cell in self._parseRow(element, row):
+                    cells[(cell.row, cell.column)] = cell
+                element.clear()
+        for ref in merges:
+            minCol, minRow, maxCol, maxRow = CellRange(ref).bounds
+            for row in range(minRow, maxRow + 1):
+                for column in range(minCol, maxCol + 1):
+                    if row != minRow or column != minCol:
+                        cells[(row, column)] = MergedGridCell(row, column)
+        return cells
+
+    def _parseRow(self, element: Any, row: int) -> Iterator[GridCell]:
+        """The cells with a value in a row, valued as openpyxl's
+        WorkSheetParser.parse_cell() values them (ignoring formulae)."""
+        cTag, vTag, isTag = f"{_MAIN}c", f"{_MAIN}v", f"{_MAIN}is"
+        column = 0
+        for c in element.iterchildren(cTag):
+            if (coordinate := c.get("r")) is not None:
+                row, column = coordinate_to_tuple(coordinate)
+            else:
+                column += 1
+            dataType = c.get("t", "n")
+            value: Any
+            if dataType == "inlineStr":
+                if (child := c.find(isTag)) is None:
+                    continue
+                value = parse_richtext_string(child)
+            elif not (value := c.findtext(vTag)):
+                continue
+            styleId = int(c.get("s", 0))
+            if dataType == "n":
+                value = _castNumber(value)
+                if styleId in self._dateStyles:
+                    try:
+                        value = from_excel(
+                            value,
+                            self._epoch,
+                            timedelta=styleId in self._timedeltaStyles,
+                        )
+                    except (OverflowError, ValueError):
+                        value = "#VALUE!"
+            elif dataType == "s":
+                value = self._strings[int(value)]
+            elif dataType == "b":
+                value = bool(int(value))
+            elif dataType == "d":
+                value = from_ISO8601(value)
+            yield GridCell(
+                row,
+                column,
+                value,
+                self._numberFormats[styleId]
+                if styleId < len(self._numberFormats)
+                else "General",
+            )
+
+
+def _castNumber(value: str) -> int | float:
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
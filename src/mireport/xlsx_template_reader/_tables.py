@@ -75,7 +75,8 @@ class TableFactCreator:
 
             for priItem in table_binding.primaryItems:
                 unitHolder, sharedRange = self._unitHolderFor(priItem, table_binding)
-                for rnum, row in priItem.rows():
+                # Rows with nothing in them make no fact, so aren't looked at.
+                for rnum, row in priItem.populatedRows():
                     if not self._processRow(
                         table_binding, priItem, rnum, row, unitHolder, sharedRange
                     ):
@@ -19,7 +19,7 @@ from mireport.conversionresults import (
     MessageType,
 )
 from mireport.data.disclosures import VSME_DEFAULTS
-from mireport.exceptions import EarlyAbortException
+from mireport.exceptions import EarlyAbortException, SpreadsheetMLException
 from mireport.localise import as_xmllang, get_locale_from_str
 from mireport.report import InlineReport
 from mireport.taxonomy import (
@@ -35,10 +35,15 @@ from mireport.xlsx_template_reader._constants import (
 )
 from mireport.xlsx_template_reader._fact_creator import FactCreator
 from mireport.xlsx_template_reader._messages import Messenger
-from mireport.xlsx_template_reader._reader import WorkbookReader
+from mireport.xlsx_template_reader._reader import TemplateWorkbook, WorkbookReader
+from mireport.xlsx_template_reader._spreadsheetml import (
+    SpreadsheetMLWorkbook,
+    loadSpreadsheetMLFromPathOrFileLike,
+)
 from mireport.xlsx_template_reader.util import (
     excelDefinedNameRef,
     loadExcelFromPathOrFileLike,
+    loadReferencedSheetsFromPathOrFileLike,
 )
 
 L = logging.getLogger(__name__)
@@ -52,18 +57,30 @@ class TemplateCheckResult(NamedTuple):
     migration_status: bool | None
 
 
+def _loadWorkbook(pathOrFile: Path | BinaryIO) -> TemplateWorkbook:
+    """Read the workbook straight from its SpreadsheetML, falling back to
+    openpyxl (and so its error reporting) for anything that can't be."""
+    try:
+        return loadSpreadsheetMLFromPathOrFileLike(pathOrFile)
+    except SpreadsheetMLException:
+        L.debug("Falling back to openpyxl to load the workbook.", exc_info=True)
+        if not isinstance(pathOrFile, Path):
+            pathOrFile.seek(0)
+        return loadReferencedSheetsFromPathOrFileLike(pathOrFile)
+
+
 class XlsxProcessor:
     def __init__(
         self,
-        workbook: Workbook,
+        workbook: TemplateWorkbook,
         results: ConversionResultsBuilder,
         defaults: Mapping[str, Any],
         /,
         outputLocale: Locale | None = None,
     ):
-        if not isinstance(workbook, Workbook):
+        if not isinstance(workbook, Workbook | SpreadsheetMLWorkbook):
             raise TypeError(
-                f"workbook must be an openpyxl Workbook, got {type(workbook).__name__}. "
+                f"workbook must be an openpyxl Workbook or a SpreadsheetMLWorkbook, got {type(workbook).__name__}. "
                 "Use XlsxProcessor.from_file() or XlsxProcessor.from_bytes() to load from a file."
             )
         self._results = results
@@ -88,7 +105,7 @@ class XlsxProcessor:
     ) -> Self:
         from io import BytesIO
 
-        wb = loadExcelFromPathOrFileLike(BytesIO(data))
+        wb = _loadWorkbook(BytesIO(data))
         return cls(wb, results, defaults, outputLocale=outputLocale)
 
     @classmethod
@@ -100,7 +117,7 @@ class XlsxProcessor:
         /,
         outputLocale: Locale | None = None,
     ) -> Self:
-        wb = loadExcelFromPathOrFileLike(path_or_filelike)
+        wb = _loadWorkbook(path_or_filelike)
         return cls(wb, results, defaults, outputLocale=outputLocale)
 
     @property
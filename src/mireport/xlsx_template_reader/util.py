@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 import warnings
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
 from typing import (
@@ -15,13 +16,22 @@ if TYPE_CHECKING:
 
 from dateutil.parser import parse as parse_datetime
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import Cell, MergedCell, ReadOnlyCell
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.utils.cell import absolute_coordinate, quote_sheetname
 from openpyxl.workbook.defined_name import DefinedName
-from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._reader import WorkSheetParser
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from openpyxl.worksheet.merge import MergedCellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
 from mireport.typealiases import DecimalPlaces
-from mireport.xlsx_template_reader._constants import CellType
+from mireport.xlsx_template_reader._constants import (
+    LOOKUP_LIST_DEFINED_NAME_PREFIXES,
+    CellType,
+)
+from mireport.xlsx_template_reader._grid import WorksheetGrid
 
 
 def conceptsToText(concepts: Iterable[Concept]) -> str:
@@ -35,9 +45,8 @@ def checkExcelFilePath(path: Path) -> None:
         raise ValueError(f'"{path}" is not a supported (.xlsx) Excel file')
 
 
-def loadExcelFromPathOrFileLike(
-    pathOrFile: Path | BinaryIO, read_only: bool = False
-) -> Workbook:
+@contextmanager
+def _unsupportedExtensionWarningsSuppressed() -> Iterator[None]:
     # We can safely suppress these warnings as our use-case is **just**
     # extracting data from the Excel file.
     with warnings.catch_warnings():
@@ -47,19 +56,112 @@ def loadExcelFromPathOrFileLike(
             category=UserWarning,
             module=r"openpyxl\.worksheet\._reader",
         )
+        yield
+
+
+def loadExcelFromPathOrFileLike(
+    pathOrFile: Path | BinaryIO, read_only: bool = False
+) -> Workbook:
+    with _unsupportedExtensionWarningsSuppressed():
         wb = load_workbook(
             filename=pathOrFile, read_only=read_only, data_only=True, rich_text=True
         )
     return wb
 
 
-def excelCellRef(worksheet: Worksheet, cell: CellType) -> str:
+def loadReferencedSheetsFromPathOrFileLike(pathOrFile: Path | BinaryIO) -> Workbook:
+    """Load just what a conversion reads from the Excel file.
+
+    The file is opened with openpyxl's streaming (read-only) reader and only
+    the worksheets that defined names point at are read, each in a single
+    pass. Of those, only cells with a value are kept, along with their number
+    format, plus the merged ranges. Help, converter and lookup-list sheets,
+    and the styles, conditional formats and data validations of every sheet,
+    are never loaded.
+    """
+    source = loadExcelFromPathOrFileLike(pathOrFile, read_only=True)
+    try:
+        wanted = referencedSheetNames(source.defined_names.values())
+        wb = Workbook()
+        wb.remove(wb.active)
+        wb.epoch = source.epoch
+        for sourceWs in source.worksheets:
+            if sourceWs.title in wanted and isinstance(sourceWs, ReadOnlyWorksheet):
+                _copyValuesAndMerges(sourceWs, wb.create_sheet(sourceWs.title))
+        for dn in source.defined_names.values():
+            wb.defined_names.add(dn)
+    finally:
+        source.close()
+    return wb
+
+
+def referencedSheetNames(definedNames: Iterable[DefinedName]) -> set[str]:
+    """Names of the worksheets the defined names point at, ignoring the ones
+    that only name a lookup list."""
+    names: set[str] = set()
+    for dn in definedNames:
+        if not dn.name or dn.name.startswith(LOOKUP_LIST_DEFINED_NAME_PREFIXES):
+            continue
+        try:
+            names.update(sheetName for sheetName, _ in dn.destinations)
+        except AttributeError:
+            # Damaged; WorkbookReader reports it if anything asks for it.
+            continue
+    return names
+
+
+def _copyValuesAndMerges(source: ReadOnlyWorksheet, ws: Worksheet) -> None:
+    """Copy the cells with a value, and the merged ranges, of a streamed
+    worksheet, as openpyxl's own (non read-only) reader would have, less the
+    styling other than number formats."""
+    wb = source.parent
+    styles: dict[int, StyleArray] = {}
+    with _unsupportedExtensionWarningsSuppressed(), source._get_source() as src:
+        parser = WorkSheetParser(
+            src,
+            source._shared_strings,
+            data_only=True,
+            epoch=wb.epoch,
+            date_formats=wb._date_formats,
+            timedelta_formats=wb._timedelta_formats,
+            rich_text=True,
+        )
+        for _, row in parser.parse():
+            for details in row:
+                if details["value"] is None:
+                    continue
+                cell = Cell(
+                    ws,
+                    row=details["row"],
+                    column=details["column"],
+                    style_array=styles.get(details["style_id"]),
+                )
+                cell._value = details["value"]
+                cell.data_type = details["data_type"]
+                if details["style_id"] not in styles:
+                    cell.number_format = ReadOnlyCell(source, **details).number_format
+                    styles[details["style_id"]] = cell._style
+                ws._cells[(cell.row, cell.column)] = cell
+    if parser.merged_cells is None:
+        return
+    merged = [MergedCellRange(ws, mcr.ref) for mcr in parser.merged_cells.mergeCell]
+    for mcr in merged:
+        cells = mcr.cells
+        next(cells)  # The top-left cell keeps its value.
+        for row, column in cells:
+            ws._cells[(row, column)] = MergedCell(ws, row, column)
+    ws.merged_cells = MultiCellRange(merged)
+
+
+def excelCellRef(worksheet: WorksheetGrid | Worksheet, cell: CellType) -> str:
     """Make an Excel cell reference such as 'Example sheet'!$A$5"""
     ref = f"{quote_sheetname(worksheet.title)}!{absolute_coordinate(cell.coordinate)}"
     return ref
 
 
-def excelCellRangeRef(worksheet: Worksheet, cellRange: CellRange) -> str:
+def excelCellRangeRef(
+    worksheet: WorksheetGrid | Worksheet, cellRange: CellRange
+) -> str:
     """Make an Excel cell reference such as 'Example sheet'!$A$5"""
     ref = f"{quote_sheetname(worksheet.title)}!{absolute_coordinate(cellRange.coord)}"
     return ref
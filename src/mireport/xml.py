@@ -110,7 +110,7 @@ class QName:
     :meth:`myQnameMaker.fromString(qname_string)`.
     """
 
-    __slots__ = ("localName", "namespace", "prefix")
+    __slots__ = ("_hash", "localName", "namespace", "prefix")
 
     def __init__(
         self,
@@ -119,6 +119,9 @@ class QName:
         self.namespace = sys.intern(q.namespace)
         self.prefix = sys.intern(q.prefix)
         self.localName = q.localName
+        # QNames are hashed and compared constantly (concepts, dimensions and
+        # units all key dicts and sets by them) so work the hash out once.
+        self._hash = hash(self.__key())
 
     def __key(self) -> tuple[str, str, str]:
         # compare on localname first for speed
@@ -128,14 +131,31 @@ class QName:
         # compare as a human would expect (prefixA:localB comes after prefixA:localA)
         return (self.prefix, self.localName, self.namespace)
 
+    def __getstate__(self) -> tuple[str, str, str]:
+        # str hashes differ from one process to the next, so the cached hash
+        # must never travel with a pickled QName.
+        return (self.namespace, self.prefix, self.localName)
+
+    def __setstate__(self, state: tuple[str, str, str]) -> None:
+        namespace, prefix, localName = state
+        self.namespace = sys.intern(namespace)
+        self.prefix = sys.intern(prefix)
+        self.localName = localName
+        self._hash = hash(self.__key())
+
     def __hash__(self) -> int:
-        return hash(self.__key())
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if self is other:
             return True
         if isinstance(other, QName):
-            return self.__key() == other.__key()
+            return (
+                self._hash == other._hash
+                and self.localName == other.localName
+                and self.prefix == other.prefix
+                and self.namespace == other.namespace
+            )
         return NotImplemented
 
     def __lt__(self, other: object) -> bool:
@@ -153,8 +173,14 @@ class QName:
 class QNameMaker:
     def __init__(self, nsManager: NamespaceManager):
         self._nsManager = nsManager
+        # Prefix bindings cannot change once made so a string that parsed and
+        # validated once always will. Taxonomies repeat the same few data type
+        # QNames thousands of times.
+        self._validatedParts: dict[str, _QNameTuple] = {}
 
     def _getAndValidateParts(self, /, qname: str) -> _QNameTuple:
+        if (q := self._validatedParts.get(qname)) is not None:
+            return q
         if not (qname and len(parts := qname.split(":", 1)) == 2):
             raise BrokenQNameException(
                 f'QName does not look format ("prefix:part") valid: "{qname}"'
@@ -166,6 +192,7 @@ class QNameMaker:
             raise BrokenQNameException(f"QName {qname} has an unknown prefix.") from k
         q = _QNameTuple(prefix=prefix, localName=localName, namespace=namespace)
         self._partsValidator(q)
+        self._validatedParts[qname] = q
         return q
 
     def _partsValidator(self, /, q: _QNameTuple) -> None:
@@ -179,6 +206,11 @@ class QNameMaker:
                 f"QName local name {q.localName} does not look like an NCName."
             )
 
+    def forgetValidatedStrings(self) -> None:
+        """Empty the memo of strings already parsed and validated, for when a
+        burst of parsing (such as loading a taxonomy) is over."""
+        self._validatedParts.clear()
+
     def isValidQName(self, /, qname: str) -> bool:
         try:
             self._getAndValidateParts(qname)
@@ -202,6 +234,12 @@ class QNameMaker:
     def hasNamespace(self, namespace: str) -> bool:
         return self._nsManager.hasNamespace(namespace)
 
+    def getPrefixForNamespace(self, namespace: str) -> str | None:
+        """The prefix QNames in namespace are given, if it has one yet."""
+        if not self._nsManager.hasNamespace(namespace):
+            return None
+        return self._nsManager.getPrefixForNamespace(namespace)
+
     @property
     def namespacePrefixesMap(self) -> Mapping[str, str]:
         """Get a mapping of prefix to namespace for all known prefixes."""
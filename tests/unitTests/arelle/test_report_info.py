@@ -12,11 +12,14 @@ from typing import Any
 
 import pytest
 
+from mireport.arelle import report_info
 from mireport.arelle.report_info import (
     ArelleReportProcessor,
     _singleFileFromResponseZip,
+    _taxonomyPackagesFingerprint,
 )
-from mireport.arelle.support import ArelleRelatedException
+from mireport.arelle.support import ArelleProcessingResult, ArelleRelatedException
+from mireport.filesupport import FilelikeAndFileName
 
 
 def makeZip(entries: dict[str, bytes]) -> BytesIO:
@@ -57,7 +60,8 @@ class TestMakeOptions:
         options = self.makeProcessor()._makeOptions()
         assert options.internetConnectivity == "offline"
         assert options.keepOpen is True
-        assert options.logFile == "logToBuffer"
+        # Logging goes to the ArelleLogCollector handed to Session.run().
+        assert options.logFile is None
         assert options.logFormat == "%(message)s"
         assert options.logPropagate is False
         assert options.packages == ["a.zip", "b.zip"]
@@ -82,3 +86,116 @@ class TestMakeOptions:
         assert options.plugins == "saveLoadableOIM"
         # RuntimeOptions flattens pluginOptions into attributes via setattr
         assert options.saveLoadableOIM == "out.json"
+
+
+class TestProcessReportPackage:
+    """Checks the single Arelle run is asked for the right outputs and that
+    each output is picked up from where Arelle writes it."""
+
+    SOURCE = FilelikeAndFileName(fileContent=b"", filename="report.zip")
+
+    def runCapturing(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        writeViewer: bool = True,
+        **kwargs: Any,
+    ) -> tuple[Any, ArelleProcessingResult]:
+        processor = ArelleReportProcessor()
+        captured: dict[str, Any] = {}
+
+        def fakeRun(
+            source: FilelikeAndFileName, options: Any, responseZipStream: Any = None
+        ) -> ArelleProcessingResult:
+            captured["options"] = options
+            if responseZipStream is not None:
+                responseZipStream.write(makeZip({"r.json": b"{}"}).getvalue())
+            viewerDest = getattr(options, "saveViewerDest", None)
+            if viewerDest is not None and writeViewer:
+                viewerDest.write(makeZip({"v.html": b"<html/>"}).getvalue())
+            return ArelleProcessingResult()
+
+        monkeypatch.setattr(processor, "_run", fakeRun)
+        result = processor.processReportPackage(self.SOURCE, **kwargs)
+        return captured["options"], result
+
+    def test_both_outputs_from_one_run(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        options, result = self.runCapturing(monkeypatch)
+        assert options.plugins == "ixbrl-viewer|saveLoadableOIM"
+        assert result.viewer.filename == "report_viewer.html"
+        assert result.viewer.fileContent == b"<html/>"
+        assert result.xbrl_json.filename == "report.json"
+        assert result.xbrl_json.fileContent == b"{}"
+
+    def test_validation_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        options, result = self.runCapturing(
+            monkeypatch, viewer=False, xbrlJson=False, disableCalculationValidation=True
+        )
+        assert options.plugins is None
+        assert options.calcs == "none"
+        assert not result.has_viewer
+        assert not result.has_json
+
+    def test_missing_viewer_recorded_json_kept(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _, result = self.runCapturing(monkeypatch, writeViewer=False)
+        assert not result.has_viewer
+        assert result.has_json
+        assert result.has_exceptions
+
+
+class TestTaxonomyPackagesFingerprint:
+    def test_tracks_package_changes(self, tmp_path: Path) -> None:
+        package = tmp_path / "a.zip"
+        package.write_bytes(b"one")
+        before = _taxonomyPackagesFingerprint([package])
+        assert before == _taxonomyPackagesFingerprint([package])
+        package.write_bytes(b"three")
+        assert before != _taxonomyPackagesFingerprint([package])
+
+    def test_tolerates_missing_package(self, tmp_path: Path) -> None:
+        missing = tmp_path / "missing.zip"
+        assert _taxonomyPackagesFingerprint([missing]) == ((str(missing), -1, -1),)
+
+    def test_packages_found_again_in_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "a.zip").write_bytes(b"one")
+        processor = ArelleReportProcessor(
+            taxonomyPackageDir=tmp_path, taxonomyPackageRescanSeconds=0
+        )
+        assert processor.taxonomyPackages == [tmp_path / "a.zip"]
+        before = processor.refreshTaxonomyPackages()
+        (tmp_path / "b.zip").write_bytes(b"two")
+        assert processor.refreshTaxonomyPackages() != before
+
+        packages: list[list[str]] = []
+
+        def fakeRun(
+            source: FilelikeAndFileName, options: Any, responseZipStream: Any = None
+        ) -> ArelleProcessingResult:
+            packages.append(options.packages)
+            return ArelleProcessingResult()
+
+        monkeypatch.setattr(processor, "_run", fakeRun)
+        (tmp_path / "c.zip").write_bytes(b"three")
+        processor.validateReportPackage(TestProcessReportPackage.SOURCE)
+        assert packages == [[str(tmp_path / f"{n}.zip") for n in "abc"]]
+
+    def test_dir_looked_in_at_most_once_per_interval(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "a.zip").write_bytes(b"one")
+        scans: list[Path] = []
+
+        def countingFind(taxonomyPackageDir: Path) -> list[Path]:
+            scans.append(taxonomyPackageDir)
+            return [tmp_path / "a.zip"]
+
+        monkeypatch.setattr(report_info, "_findTaxonomyPackages", countingFind)
+        processor = ArelleReportProcessor(
+            taxonomyPackageDir=tmp_path, taxonomyPackageRescanSeconds=60
+        )
+        fingerprints = {processor.refreshTaxonomyPackages() for _ in range(10)}
+        assert len(scans) == 1
+        assert len(fingerprints) == 1
@@ -0,0 +1,147 @@
+"""Unit tests for result_cache.py's on-disk Arelle result cache."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mireport.arelle.report_info import _taxonomyPackagesFingerprint
+from mireport.arelle.result_cache import (
+    ArelleResultCache,
+    CachingArelleReportProcessor,
+)
+from mireport.arelle.support import ArelleProcessingResult
+from mireport.conversionresults import Message, MessageType, Severity
+from mireport.filesupport import FilelikeAndFileName
+
+SOURCE = FilelikeAndFileName(fileContent=b"zip bytes", filename="report.zip")
+
+
+def makeResult(text: str = "all good") -> ArelleProcessingResult:
+    result = ArelleProcessingResult()
+    result._validationMessages.append(
+        Message(text, Severity.INFO, MessageType.XbrlValidation)
+    )
+    result._xbrlJson = FilelikeAndFileName(b"{}", "report.json")
+    return result
+
+
+class CountingProcessor:
+    def __init__(self, result: ArelleProcessingResult) -> None:
+        self.result = result
+        self.calls: list[dict[str, Any]] = []
+        self.taxonomyPackages: list[Path] = []
+        self.workOffline = True
+        self.keepTextLog = False
+
+    def refreshTaxonomyPackages(self) -> tuple[tuple[str, int, int], ...]:
+        return _taxonomyPackagesFingerprint(self.taxonomyPackages)
+
+    def processReportPackage(
+        self, source: FilelikeAndFileName, **kwargs: Any
+    ) -> ArelleProcessingResult:
+        self.calls.append(kwargs)
+        return self.result
+
+
+class TestArelleResultCache:
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        cache = ArelleResultCache(tmp_path, maxBytes=2**20)
+        assert cache.get("k") is None
+        cache.put("k", makeResult())
+        hit = cache.get("k")
+        assert hit is not None
+        assert [m.messageText for m in hit.messages] == ["all good"]
+        assert hit.xbrl_json.fileContent == b"{}"
+
+    def test_least_recently_used_evicted(self, tmp_path: Path) -> None:
+        cache = ArelleResultCache(tmp_path, maxBytes=2**20)
+        cache.put("old", makeResult())
+        size = (tmp_path / "old.arelle").stat().st_size
+        cache.maxBytes = 2 * size
+        cache.put("newer", makeResult())
+        os.utime(tmp_path / "old.arelle", ns=(1, 1))
+        os.utime(tmp_path / "newer.arelle", ns=(2, 2))
+        cache.put("newest", makeResult())
+        assert cache.get("old") is None
+        assert cache.get("newer") is not None
+        assert cache.get("newest") is not None
+
+    def test_failed_put_leaves_nothing_behind(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = ArelleResultCache(tmp_path, maxBytes=2**20)
+
+        def failingReplace(src: Any, dst: Any) -> None:
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(os, "replace", failingReplace)
+        with pytest.raises(OSError):
+            cache.put("k", makeResult())
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_entry_discarded(self, tmp_path: Path) -> None:
+        cache = ArelleResultCache(tmp_path, maxBytes=2**20)
+        (tmp_path / "bad.arelle").write_bytes(b"\xc1 not msgpack")
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.arelle").exists()
+
+
+class TestCachingArelleReportProcessor:
+    def test_hit_skips_arelle(self, tmp_path: Path) -> None:
+        processor = CountingProcessor(makeResult())
+        caching = CachingArelleReportProcessor(
+            processor, ArelleResultCache(tmp_path, maxBytes=2**20)
+        )
+        caching.generateXBRLJson(SOURCE)
+        again = caching.generateXBRLJson(SOURCE)
+        assert len(processor.calls) == 1
+        assert again.has_json
+
+    def test_options_are_part_of_the_key(self, tmp_path: Path) -> None:
+        processor = CountingProcessor(makeResult())
+        caching = CachingArelleReportProcessor(
+            processor, ArelleResultCache(tmp_path, maxBytes=2**20)
+        )
+        caching.validateReportPackage(SOURCE)
+        caching.validateReportPackage(SOURCE, disableCalculationValidation=True)
+        caching.validateReportPackage(
+            FilelikeAndFileName(b"other bytes", SOURCE.filename)
+        )
+        assert len(processor.calls) == 3
+
+    def test_taxonomy_packages_are_part_of_the_key(self, tmp_path: Path) -> None:
+        processor = CountingProcessor(makeResult())
+        caching = CachingArelleReportProcessor(
+            processor, ArelleResultCache(tmp_path / "cache", maxBytes=2**20)
+        )
+        caching.validateReportPackage(SOURCE)
+        package = tmp_path / "a.zip"
+        package.write_bytes(b"one")
+        processor.taxonomyPackages.append(package)
+        caching.validateReportPackage(SOURCE)
+        package.write_bytes(b"changed")
+        caching.validateReportPackage(SOURCE)
+        assert len(processor.calls) == 3
+
+    def test_text_log_is_part_of_the_key(self, tmp_path: Path) -> None:
+        processor = CountingProcessor(makeResult())
+        caching = CachingArelleReportProcessor(
+            processor, ArelleResultCache(tmp_path, maxBytes=2**20)
+        )
+        caching.validateReportPackage(SOURCE)
+        processor.keepTextLog = True
+        caching.validateReportPackage(SOURCE)
+        assert len(processor.calls) == 2
+
+    def test_results_with_exceptions_not_cached(self, tmp_path: Path) -> None:
+        failed = makeResult()
+        failed.addException(ValueError("boom"))
+        processor = CountingProcessor(failed)
+        caching = CachingArelleReportProcessor(
+            processor, ArelleResultCache(tmp_path, maxBytes=2**20)
+        )
+        caching.validateReportPackage(SOURCE)
+        caching.validateReportPackage(SOURCE)
+        assert len(processor.calls) == 2
@@ -1,12 +1,13 @@
 """Unit tests for support.py's Arelle session/QName support classes."""
 
-import json
+import logging
 
 import pytest
 from arelle.ModelValue import QName
 
 from mireport.arelle.diagnostics import Diagnostic
 from mireport.arelle.support import (
+    ArelleLogCollector,
     ArelleModelInconsistency,
     ArelleProcessingResult,
     ArelleQNameCanonicaliser,
@@ -17,16 +18,21 @@ from mireport.filesupport import FilelikeAndFileName
 from mireport.xml import getBootstrapQNameMaker
 
 
-def makeJsonLog(*records: tuple[str, str, str]) -> str:
-    """Build an Arelle JSON log from (code, level, text) tuples."""
-    return json.dumps(
-        {
-            "log": [
-                {"code": code, "level": level, "message": {"text": text}}
-                for code, level, text in records
-            ]
-        }
+def emitRecord(
+    collector: ArelleLogCollector,
+    code: str,
+    levelname: str,
+    msg: str,
+    args: dict | None = None,
+) -> None:
+    record = logging.LogRecord(
+        "arelle", logging.getLevelName(levelname), "", 0, msg, None, None
     )
+    # LogRecord's constructor unpacks a mapping args argument, so set it after.
+    record.args = args or {}
+    record.levelname = levelname
+    record.messageCode = code
+    collector.emit(record)
 
 
 class TestArelleProcessingResultDiagnostics:
@@ -49,36 +55,38 @@ class TestArelleProcessingResultDiagnostics:
         assert len(result.diagnostics) == 1
 
 
-class TestImportArelleMessages:
+def collect(
+    *records: tuple[str, str, str], keepTextLog: bool = False
+) -> ArelleProcessingResult:
+    """Feed (code, levelname, text) log records through an ArelleLogCollector."""
+    collector = ArelleLogCollector(keepTextLog=keepTextLog)
+    for code, levelname, text in records:
+        emitRecord(collector, code, levelname, text)
+    return collector.finish()
+
+
+class TestImportRecord:
     def test_coded_record_becomes_validation_message(self) -> None:
-        result = ArelleProcessingResult.fromArelleLogs(
-            makeJsonLog(("xbrl.5.2.5.2:calcInconsistency", "error", "Bad calc")), []
-        )
+        result = collect(("xbrl.5.2.5.2:calcInconsistency", "ERROR", "Bad calc"))
         [message] = result.messages
         assert message.messageText == "[xbrl.5.2.5.2:calcInconsistency] Bad calc"
         assert message.severity is Severity.ERROR
         assert message.messageType is MessageType.XbrlValidation
 
     def test_severity_is_worst_of_code_and_level(self) -> None:
-        result = ArelleProcessingResult.fromArelleLogs(
-            makeJsonLog(("warning", "info", "Careful now")), []
-        )
+        result = collect(("warning", "INFO", "Careful now"))
         [message] = result.messages
         assert message.severity is Severity.WARNING
 
     def test_blank_code_kept_as_devinfo(self) -> None:
-        result = ArelleProcessingResult.fromArelleLogs(
-            makeJsonLog(("", "info", "Anything at all")), []
-        )
+        result = collect(("", "INFO", "Anything at all"))
         [message] = result.messages
         assert message.messageText == "Anything at all"
         assert message.severity is Severity.INFO
         assert message.messageType is MessageType.DevInfo
 
     def test_interesting_info_kept_as_devinfo(self) -> None:
-        result = ArelleProcessingResult.fromArelleLogs(
-            makeJsonLog(("info", "info", "report.xhtml validated in 1.23 secs")), []
-        )
+        result = collect(("info", "INFO", "report.xhtml validated in 1.23 secs"))
         [message] = result.messages
         assert message.messageType is MessageType.DevInfo
 
@@ -92,16 +100,56 @@ class TestImportArelleMessages:
         ],
     )
     def test_other_info_produces_no_message(self, text: str) -> None:
-        result = ArelleProcessingResult.fromArelleLogs(
-            makeJsonLog(("info", "info", text)), []
-        )
-        assert result.messages == []
+        assert collect(("info", "INFO", text)).messages == []
 
     def test_log_lines_are_kept(self) -> None:
-        result = ArelleProcessingResult.fromArelleLogs(makeJsonLog(), ["one", "two"])
+        result = collect(("", "INFO", "one"), ("info", "INFO", "two"), keepTextLog=True)
         assert result.log_lines == ["one", "two"]
 
 
+class TestArelleLogCollector:
+    def test_records_classified_as_emitted(self) -> None:
+        collector = ArelleLogCollector()
+        emitRecord(collector, "calc:bad", "ERROR", "Sum of %(n)s wrong", {"n": 3})
+        emitRecord(collector, "info", "INFO", "r.xhtml validated in 1 secs")
+        emitRecord(collector, "info", "INFO", "Activation of plug-in X")
+        result = collector.finish()
+        assert [(m.messageText, m.messageType) for m in result.messages] == [
+            ("[calc:bad] Sum of 3 wrong", MessageType.XbrlValidation),
+            ("r.xhtml validated in 1 secs", MessageType.DevInfo),
+        ]
+        assert result.messages[0].severity is Severity.ERROR
+
+    def test_text_log_only_kept_on_request(self) -> None:
+        quiet = ArelleLogCollector()
+        emitRecord(quiet, "", "INFO", "hello")
+        assert quiet.finish().log_lines == []
+        chatty = ArelleLogCollector(keepTextLog=True)
+        emitRecord(chatty, "", "INFO", "hello")
+        assert chatty.finish().log_lines == ["hello"]
+
+    def test_messages_capped_per_code(self) -> None:
+        collector = ArelleLogCollector(maxMessagesPerCode=2)
+        for _ in range(3):
+            emitRecord(collector, "dup:fact", "WARNING", "Duplicate")
+        emitRecord(collector, "dup:fact", "ERROR", "Duplicate")
+        emitRecord(collector, "other", "WARNING", "Other")
+        messages = collector.finish().messages
+        assert [m.messageText for m in messages] == [
+            "[dup:fact] Duplicate",
+            "[dup:fact] Duplicate",
+            "[other] Other",
+            "[dup:fact] +2 more messages with this code not shown.",
+        ]
+        assert messages[-1].severity is Severity.ERROR
+
+    def test_no_cap(self) -> None:
+        collector = ArelleLogCollector(maxMessagesPerCode=None)
+        for _ in range(150):
+            emitRecord(collector, "dup:fact", "WARNING", "Duplicate")
+        assert len(collector.finish().messages) == 150
+
+
 class TestArelleProcessingResultOutputs:
     def test_xbrl_json_raises_when_absent(self) -> None:
         result = ArelleProcessingResult()
@@ -134,6 +182,21 @@ class TestArelleProcessingResultOutputs:
         assert any("boom" in m.messageText for m in result.messages)
 
 
+class TestArelleProcessingResultDict:
+    def test_round_trip_through_msgpack(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        result = collect(("calc:inconsistency", "ERROR", "Sum wrong"), keepTextLog=True)
+        result._viewer = FilelikeAndFileName(b"<html/>", "r_viewer.html")
+        packed = msgpack.packb(result.toDict(), use_bin_type=True)
+        restored = ArelleProcessingResult.fromDict(msgpack.unpackb(packed))
+        assert [m.toDict() for m in restored.messages] == [
+            m.toDict() for m in result.messages
+        ]
+        assert restored.log_lines == ["Sum wrong"]
+        assert restored.viewer == result.viewer
+        assert restored.has_json is False
+
+
 class TestArelleModelInconsistency:
     def test_from_string(self) -> None:
         exc = ArelleModelInconsistency("plain message")
@@ -336,3 +336,27 @@ class TestGetLabelsForRoleType:
         assert labels == {"en": "Energy usage"}
         assert len(diagnostics) == 1
         assert "duplicate labels" in diagnostics[0].text
+
+
+class TestPhaseTimings:
+    def test_all_phases_reported_in_order(self) -> None:
+        extractor, _token = makeExtractor({})
+        assert list(extractor.phaseTimings) == list(
+            TaxonomyInfoExtractor.EXTRACTION_PHASES
+        )
+        assert set(extractor.phaseTimings.values()) == {0}
+
+    def test_timed_phase_accumulates(self) -> None:
+        extractor, _token = makeExtractor({})
+        with extractor.timedPhase("labels"):
+            pass
+        first = extractor.phaseTimings["labels"]
+        with extractor.timedPhase("labels"):
+            pass
+        assert extractor.phaseTimings["labels"] >= first > 0
+
+    def test_timed_phase_counts_failures(self) -> None:
+        extractor, _token = makeExtractor({})
+        with pytest.raises(ValueError), extractor.timedPhase("concepts"):
+            raise ValueError("boom")
+        assert extractor.phaseTimings["concepts"] > 0
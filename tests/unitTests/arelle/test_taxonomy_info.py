@@ -7,7 +7,10 @@ tests/integrationTests/test_taxonomy_info_regeneration.py.
 
 from __future__ import annotations
 
-from mireport.arelle.taxonomy_info import TaxonomyInfoPluginData
+from mireport.arelle.taxonomy_info import (
+    TaxonomyInfoPluginData,
+    callArelleForTaxonomyInfoInParallel,
+)
 
 
 class TestTaxonomyInfoPluginData:
@@ -24,3 +27,8 @@ class TestTaxonomyInfoPluginData:
         first.UTR["utr"] = [{"unitId": "kg"}]
         assert second.UTR == {}
         assert first.UTR is not second.UTR
+
+
+class TestCallArelleForTaxonomyInfoInParallel:
+    def test_no_jobs_starts_nothing(self) -> None:
+        assert callArelleForTaxonomyInfoInParallel([], ["vsme.zip"]) == {}
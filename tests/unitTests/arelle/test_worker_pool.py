@@ -0,0 +1,110 @@
+"""Unit tests for worker_pool.py's ArelleWorkerPool.
+
+Argument checking is tested directly; the slow test starts a real worker
+process and runs Arelle in it.
+"""
+
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from mireport.arelle.support import ArelleProcessingResult, ArelleRelatedException
+from mireport.arelle.worker_pool import ArelleWorkerPool
+from mireport.conversionresults import MessageType
+from mireport.filesupport import FilelikeAndFileName
+
+
+def validationOutcome(
+    result: ArelleProcessingResult,
+) -> list[tuple[str, str, str | None]]:
+    """The severity, type and text of each message, less the text of Arelle's
+    informational messages as they carry timings and timestamps."""
+    return [
+        (
+            m.severity.name,
+            m.messageType.name,
+            None if m.messageType is MessageType.DevInfo else m.messageText,
+        )
+        for m in result.messages
+    ]
+
+
+def makeReportPackage() -> FilelikeAndFileName:
+    stream = BytesIO()
+    with zipfile.ZipFile(stream, "w") as zf:
+        zf.writestr(
+            "a/reports/report.xhtml",
+            '<html xmlns="http://www.w3.org/1999/xhtml"><body/></html>',
+        )
+        zf.writestr(
+            "a/META-INF/reportPackage.json",
+            '{"documentInfo": {"documentType": "https://xbrl.org/report-package/2023"}}',
+        )
+    return FilelikeAndFileName(fileContent=stream.getvalue(), filename="report.zip")
+
+
+class TestArelleWorkerPoolArguments:
+    def test_rejects_zero_workers(self) -> None:
+        with pytest.raises(ArelleRelatedException, match="at least one worker"):
+            ArelleWorkerPool(workers=0)
+
+    def test_rejects_zero_tasks_per_worker(self) -> None:
+        with pytest.raises(ArelleRelatedException, match="at least one task"):
+            ArelleWorkerPool(workers=1, maxTasksPerWorker=0)
+
+    def test_close_before_use_is_harmless(self) -> None:
+        pool = ArelleWorkerPool(workers=2)
+        pool.close()
+        assert pool._executor is None
+
+    def test_workers_replaced_when_packages_change(self, tmp_path: Path) -> None:
+        package = tmp_path / "a.zip"
+        package.write_bytes(b"one")
+        pool = ArelleWorkerPool(
+            workers=1, taxonomyPackages=[package], taxonomyPackageRescanSeconds=0
+        )
+        try:
+            # Executors start their processes lazily so nothing is spawned.
+            first = pool._getExecutor()
+            assert pool._getExecutor() is first
+            package.write_bytes(b"changed")
+            assert pool._getExecutor() is not first
+        finally:
+            pool.close()
+
+    def test_workers_replaced_when_package_added_to_dir(self, tmp_path: Path) -> None:
+        (tmp_path / "a.zip").write_bytes(b"one")
+        pool = ArelleWorkerPool(
+            workers=1, taxonomyPackageDir=tmp_path, taxonomyPackageRescanSeconds=0
+        )
+        try:
+            first = pool._getExecutor()
+            assert pool._getExecutor() is first
+            (tmp_path / "b.zip").write_bytes(b"two")
+            assert pool._getExecutor() is not first
+            assert pool.taxonomyPackages == [tmp_path / "a.zip", tmp_path / "b.zip"]
+        finally:
+            pool.close()
+
+    def test_copies_taxonomy_packages(self) -> None:
+        packages: list = []
+        pool = ArelleWorkerPool(workers=1, taxonomyPackages=packages)
+        packages.append("late.zip")
+        assert pool.taxonomyPackages == []
+
+
+@pytest.mark.slow
+class TestArelleWorkerPoolProcessing:
+    def test_validation_result_comes_back_from_worker(self) -> None:
+        pool = ArelleWorkerPool(workers=1, maxTasksPerWorker=1)
+        try:
+            first = pool.validateReportPackage(makeReportPackage())
+            # The only worker has been recycled by now, so this needs a new one.
+            second = pool.validateReportPackage(makeReportPackage())
+        finally:
+            pool.close()
+        assert isinstance(first, ArelleProcessingResult)
+        assert first.messages
+        assert validationOutcome(first) == validationOutcome(second)
@@ -3,6 +3,7 @@ from time import sleep
 import pytest
 
 from mireport.conversionresults import (
+    CellSet,
     ConversionResults,
     ConversionResultsBuilder,
     Message,
@@ -341,3 +342,43 @@ def test_isXbrlValid_mixed_message_types(builder):
     result = builder.build()
     # Only XBRL validation errors matter for isXbrlValid
     assert result.isXbrlValid
+
+
+class TestCellSet:
+    def test_union_of_cells_and_ranges(self):
+        cells = CellSet([("Sheet1", 1, 1), ("Sheet1", 1, 1), ("Sheet2", 1, 1)])
+        assert len(cells) == 2
+        cells.addRange("Sheet1", 1, 1, 3, 2)
+        assert len(cells) == 7
+        cells.addRange("Sheet1", 2, 2, 4, 3)
+        assert len(cells) == 7 + 4
+        assert ("Sheet1", 4, 3) in cells
+        assert ("Sheet1", 4, 1) not in cells
+        assert ("Sheet3", 1, 1) not in cells
+
+    def test_iteration(self):
+        cells = CellSet()
+        cells.addRange("Sheet1", 2, 3, 3, 4)
+        cells.add("Sheet1", 1, 200)
+        assert list(cells) == [
+            ("Sheet1", 1, 200),
+            ("Sheet1", 2, 3),
+            ("Sheet1", 2, 4),
+            ("Sheet1", 3, 3),
+            ("Sheet1", 3, 4),
+        ]
+        assert set(cells) == set(CellSet(cells))
+
+    def test_update_from_cell_set(self, builder):
+        cells = CellSet()
+        cells.addRange("Sheet1", 1, 1, 100, 26)
+        builder.addCellQueries(cells)
+        builder.addCellQueries(cells)
+        builder.addCellQueries([("Sheet1", 1, 1), ("Sheet1", 101, 1)])
+        assert builder.numCellQueries == 100 * 26 + 1
+
+    def test_empty_range(self):
+        cells = CellSet()
+        cells.addRange("Sheet1", 5, 1, 4, 1)
+        assert len(cells) == 0
+        assert not list(cells)
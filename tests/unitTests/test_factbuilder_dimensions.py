@@ -0,0 +1,142 @@
+"""Tests for FactBuilder's checks of a fact's dimensions against the taxonomy."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mireport.exceptions import InlineReportException
+from mireport.report.factbuilder import FactBuilder
+from mireport.taxonomy import Concept, Taxonomy, getTaxonomy, listTaxonomies
+
+
+@pytest.fixture(scope="module")
+def taxonomy() -> Taxonomy:
+    return getTaxonomy(max(listTaxonomies()))
+
+
+@pytest.fixture(scope="module")
+def primaryItem(taxonomy: Taxonomy) -> Concept:
+    return next(
+        c
+        for c in sorted(taxonomy.concepts)
+        if c.isReportable
+        and taxonomy.getExplicitDimensionsForPrimaryItem(c)
+        and not taxonomy.getTypedDimensionsForPrimaryItem(c)
+    )
+
+
+@pytest.fixture(scope="module")
+def requiredDimensionItem(taxonomy: Taxonomy) -> Concept:
+    """A primary item with an explicit dimension that has no default."""
+    return next(
+        c
+        for c in sorted(taxonomy.concepts)
+        if c.isReportable
+        and not taxonomy.getTypedDimensionsForPrimaryItem(c)
+        and any(
+            taxonomy.getDimensionDefault(d) is None
+            for d in taxonomy.getExplicitDimensionsForPrimaryItem(c)
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def otherTaxonomy() -> Taxonomy:
+    """A taxonomy whose concepts aren't in the newest one."""
+    return getTaxonomy(min(listTaxonomies()))
+
+
+def builder(taxonomy: Taxonomy, concept: Concept) -> FactBuilder:
+    report = MagicMock()
+    report.taxonomy = taxonomy
+    return FactBuilder(report).setConcept(concept)
+
+
+def validMembers(taxonomy: Taxonomy, item: Concept) -> dict[Concept, Concept]:
+    chosen = {}
+    for dimension in sorted(taxonomy.getExplicitDimensionsForPrimaryItem(item)):
+        default = taxonomy.getDimensionDefault(dimension)
+        members = sorted(taxonomy.getDomainMembersForExplicitDimension(dimension))
+        chosen[dimension] = next(m for m in members if m != default)
+    return chosen
+
+
+class TestValidateExplicitDimensions:
+    def test_valid_members_accepted(self, taxonomy, primaryItem) -> None:
+        chosen = validMembers(taxonomy, primaryItem)
+        fb = builder(taxonomy, primaryItem)
+        for dimension, member in chosen.items():
+            fb.setExplicitDimension(dimension, member)
+        fb.validateExplicitDimensions(taxonomy, dict(chosen))
+
+    def test_default_member_removed(self, taxonomy, primaryItem) -> None:
+        chosen = validMembers(taxonomy, primaryItem)
+        defaulted = next(
+            (d for d in chosen if taxonomy.getDimensionDefault(d) is not None), None
+        )
+        if defaulted is None:
+            pytest.skip("no defaulted dimension")
+        chosen[defaulted] = taxonomy.getDimensionDefault(defaulted)
+        fb = builder(taxonomy, primaryItem)
+        for dimension, member in chosen.items():
+            fb.setExplicitDimension(dimension, member)
+        fb.validateExplicitDimensions(taxonomy, chosen)
+        assert defaulted not in chosen
+        assert defaulted.qname not in fb._aspects
+
+    def test_missing_dimension(self, taxonomy, requiredDimensionItem) -> None:
+        chosen = validMembers(taxonomy, requiredDimensionItem)
+        required = next(d for d in chosen if taxonomy.getDimensionDefault(d) is None)
+        del chosen[required]
+        with pytest.raises(
+            InlineReportException, match=f"Missing explicit.*{required.qname}"
+        ):
+            builder(taxonomy, requiredDimensionItem).validateExplicitDimensions(
+                taxonomy, chosen
+            )
+
+    def test_unexpected_dimension(self, taxonomy, primaryItem) -> None:
+        chosen = validMembers(taxonomy, primaryItem)
+        extra = next(
+            c
+            for c in sorted(taxonomy.concepts)
+            if c.isExplicitDimension and c not in chosen
+        )
+        chosen[extra] = primaryItem
+        with pytest.raises(InlineReportException, match="Unexpected explicit"):
+            builder(taxonomy, primaryItem).validateExplicitDimensions(taxonomy, chosen)
+
+    def test_dimension_from_another_taxonomy(
+        self, taxonomy, otherTaxonomy, primaryItem
+    ) -> None:
+        chosen = validMembers(taxonomy, primaryItem)
+        foreign = next(
+            c
+            for c in sorted(otherTaxonomy.concepts)
+            if c.isExplicitDimension and c not in taxonomy.concepts
+        )
+        chosen[foreign] = primaryItem
+        with pytest.raises(InlineReportException, match="Unexpected explicit"):
+            builder(taxonomy, primaryItem).validateExplicitDimensions(taxonomy, chosen)
+
+    def test_member_outside_domain(self, taxonomy, primaryItem) -> None:
+        chosen = validMembers(taxonomy, primaryItem)
+        dimension = next(iter(chosen))
+        chosen[dimension] = primaryItem
+        with pytest.raises(InlineReportException, match="cannot be set to"):
+            builder(taxonomy, primaryItem).validateExplicitDimensions(taxonomy, chosen)
+
+
+class TestValidateTypedDimensions:
+    def test_dimension_from_another_taxonomy(
+        self, taxonomy, otherTaxonomy, primaryItem
+    ) -> None:
+        foreign = next(
+            c
+            for c in sorted(otherTaxonomy.concepts)
+            if c.isTypedDimension and c not in taxonomy.concepts
+        )
+        with pytest.raises(InlineReportException, match="Unexpected typed"):
+            builder(taxonomy, primaryItem).validateTypedDimensions(
+                taxonomy, {foreign: "1"}
+            )
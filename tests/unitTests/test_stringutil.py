@@ -1,9 +1,13 @@
+import difflib
+
 import pytest
 from markupsafe import Markup
 
 from mireport.stringutil import (
+    CloseMatchIndex,
     format_bytes,
     format_time_ns,
+    labelLookupVariants,
     normalizeLabelText,
     str_to_markupsafe,
     stripLabelPrefix,
@@ -109,6 +113,41 @@ class TestNormalizeLabelText:
         assert normalizeLabelText("   \t\n  ") == ""
 
 
+class TestLabelLookupVariants:
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("Revenue", ("Revenue", "Revenue", "revenue")),
+            (
+                " Net\N{EN DASH}profit  [total] ",
+                ("Net-profit [total]", "Net-profit", "net-profit"),
+            ),
+            ("[only suffix]", ("[only suffix]", "[only suffix]", "[only suffix]")),
+            ("", ("", "", "")),
+        ],
+        ids=["plain", "normalised-and-suffixed", "only-suffix", "empty"],
+    )
+    def test_variants(self, label: str, expected: tuple[str, str, str]) -> None:
+        assert labelLookupVariants(label) == expected
+
+    def test_same_as_separate_functions(self) -> None:
+        label = "A\N{EM DASH}b\N{NO-BREAK SPACE} c [D]"
+        normalised = normalizeLabelText(label)
+        noSuffix = stripLabelSuffix(normalised)
+        assert labelLookupVariants(label) == (normalised, noSuffix, noSuffix.lower())
+
+    def test_unchanged_text_is_shared(self) -> None:
+        label = "already normal"
+        normalised, noSuffix, lowered = labelLookupVariants(label)
+        assert normalised is label
+        assert noSuffix is label
+        assert lowered == "already normal"
+
+    def test_remembered(self) -> None:
+        label = "Remembered label"
+        assert labelLookupVariants(label) is labelLookupVariants(label)
+
+
 class TestStripLabelSuffix:
     @pytest.mark.parametrize(
         "input_text, expected",
@@ -388,3 +427,54 @@ class TestTruthy:
     def test_unsupported_types_raise(self, value: object) -> None:
         with pytest.raises(TypeError):
             truthy(value)  # type: ignore[arg-type]
+
+
+class TestCloseMatchIndex:
+    LABELS = (
+        "A - 01 Crop and animal production",
+        "A - 01.1 Growing of non-perennial crops",
+        "A - 01.11 Growing of cereals",
+        "A - 01.12 Growing of rice",
+        "B - MINING AND QUARRYING",
+        "Germany",
+        "Greece",
+        "Grenada",
+        "abcd",
+        "abce",
+    )
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Growing of rice",
+            "A - 01.12 growing of rice",
+            "a - 01.1 Growing of crops",
+            "MINING",
+            "mining and quarrying",
+            "Germny",
+            "Grece",
+            "abc",
+            "abcf",
+            "zzz qqq 12345 xyzzy",
+            "",
+        ],
+    )
+    def test_agrees_with_difflib(self, text: str) -> None:
+        expected = difflib.get_close_matches(text, self.LABELS, n=1, cutoff=0.6)
+        index = CloseMatchIndex(self.LABELS)
+        assert index.closest(text) == (expected[0] if expected else None)
+
+    def test_ties_prefer_greater_label(self) -> None:
+        # "abcd" and "abce" both score 0.75 against "abcf".
+        assert CloseMatchIndex(self.LABELS).closest("abcf") == "abce"
+
+    def test_cutoff(self) -> None:
+        assert CloseMatchIndex(["Germany"], cutoff=0.95).closest("Germny") is None
+        assert CloseMatchIndex(["Germany"], cutoff=0.95).closest("Germany") == "Germany"
+
+    def test_duplicate_labels_indexed_once(self) -> None:
+        assert len(CloseMatchIndex(["Greece", "Greece", "Grenada"])) == 2
+
+    def test_rejects_invalid_cutoff(self) -> None:
+        with pytest.raises(ValueError, match="cutoff"):
+            CloseMatchIndex(self.LABELS, cutoff=1.5)
@@ -0,0 +1,138 @@
+"""Tests for the per primary item dimension tables."""
+
+import pytest
+
+from mireport.exceptions import AmbiguousComponentException
+from mireport.taxonomy import Concept, Taxonomy, getTaxonomy, listTaxonomies
+
+
+@pytest.fixture(scope="module")
+def taxonomy() -> Taxonomy:
+    return getTaxonomy(max(listTaxonomies()))
+
+
+@pytest.fixture(scope="module")
+def primaryItems(taxonomy: Taxonomy) -> list[Concept]:
+    items = sorted(
+        c for c in taxonomy.concepts if taxonomy.getExplicitDimensionsForPrimaryItem(c)
+    )
+    assert items, "fixture self-check"
+    return items
+
+
+class TestDimensionalValidity:
+    def test_matches_taxonomy_queries(
+        self, taxonomy: Taxonomy, primaryItems: list[Concept]
+    ) -> None:
+        for item in primaryItems:
+            validity = taxonomy.getDimensionalValidity(item)
+            explicit = taxonomy.getExplicitDimensionsForPrimaryItem(item)
+            assert (
+                set(taxonomy.conceptsFromBits(validity.explicitDimensions)) == explicit
+            )
+            assert set(
+                taxonomy.conceptsFromBits(validity.typedDimensions)
+            ) == taxonomy.getTypedDimensionsForPrimaryItem(item)
+            assert set(
+                taxonomy.conceptsFromBits(validity.requiredExplicitDimensions)
+            ) == {d for d in explicit if taxonomy.getDimensionDefault(d) is None}
+            for dimension in explicit:
+                assert validity.defaults.get(dimension) == taxonomy.getDimensionDefault(
+                    dimension
+                )
+                assert set(
+                    taxonomy.conceptsFromBits(validity.permittedMembers[dimension])
+                ) == taxonomy.getDomainMembersForExplicitDimension(dimension)
+
+    def test_not_a_primary_item(self, taxonomy: Taxonomy) -> None:
+        hypercube = next(iter(taxonomy.hypercubes))
+        validity = taxonomy.getDimensionalValidity(hypercube)
+        assert validity.explicitDimensions == validity.typedDimensions == 0
+        assert not validity.defaults
+
+    def test_computed_once(
+        self, taxonomy: Taxonomy, primaryItems: list[Concept]
+    ) -> None:
+        item = primaryItems[0]
+        assert taxonomy.getDimensionalValidity(item) is taxonomy.getDimensionalValidity(
+            item
+        )
+
+
+class TestConceptBits:
+    def test_round_trip(self, taxonomy: Taxonomy) -> None:
+        concepts = sorted(taxonomy.concepts)[::7]
+        found = taxonomy.conceptsFromBits(taxonomy.conceptBits(concepts))
+        assert set(found) == set(concepts)
+        assert [c._position for c in found] == sorted(c._position for c in found)
+
+    def test_equal_concept_from_another_taxonomy(self, taxonomy: Taxonomy) -> None:
+        other = getTaxonomy(min(listTaxonomies()))
+        concept = next(c for c in sorted(other.concepts) if c in taxonomy.concepts)
+        assert taxonomy.conceptBit(concept) == taxonomy.conceptBit(
+            taxonomy.getConcept(concept.qname)
+        )
+
+    def test_unknown_concept(self, taxonomy: Taxonomy) -> None:
+        other = getTaxonomy(min(listTaxonomies()))
+        missing = [c for c in other.concepts if c not in taxonomy.concepts]
+        if not missing:
+            pytest.skip("every concept of the oldest taxonomy is in the newest")
+        assert taxonomy.conceptBit(missing[0]) == 0
+
+    def test_empty(self, taxonomy: Taxonomy) -> None:
+        assert taxonomy.conceptBits([]) == 0
+        assert taxonomy.conceptsFromBits(0) == []
+
+
+class TestExplicitDimensionForDomainMember:
+    def test_member_of_each_dimension(
+        self, taxonomy: Taxonomy, primaryItems: list[Concept]
+    ) -> None:
+        for item in primaryItems:
+            explicit = taxonomy.getExplicitDimensionsForPrimaryItem(item)
+            found = set()
+            for dimension in explicit:
+                for member in taxonomy.getDomainMembersForExplicitDimension(dimension):
+                    if (
+                        got := taxonomy.getExplicitDimensionForDomainMember(
+                            item, member
+                        )
+                    ) is not None:
+                        assert got in explicit
+                        assert member in taxonomy.getDomainMembersForExplicitDimension(
+                            got
+                        )
+                        found.add(got)
+            assert found == explicit
+
+    def test_not_a_member(
+        self, taxonomy: Taxonomy, primaryItems: list[Concept]
+    ) -> None:
+        item = primaryItems[0]
+        assert taxonomy.getExplicitDimensionForDomainMember(item, item) is None
+        hypercube = next(iter(taxonomy.hypercubes))
+        assert taxonomy.getExplicitDimensionForDomainMember(hypercube, item) is None
+
+    def test_tables_shared_between_primary_items(self, taxonomy: Taxonomy) -> None:
+        tables = taxonomy._explicitDimensionByMember
+        assert len({id(t) for t in tables.values()}) < len(tables)
+
+    def test_ambiguous_member(
+        self,
+        taxonomy: Taxonomy,
+        primaryItems: list[Concept],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        item = primaryItems[0]
+        dimensions = sorted(taxonomy.getExplicitDimensionsForPrimaryItem(item))
+        member = next(
+            iter(taxonomy.getDomainMembersForExplicitDimension(dimensions[0]))
+        )
+        candidates = (dimensions[0], item)
+        monkeypatch.setitem(
+            taxonomy._explicitDimensionByMember[item], member, candidates
+        )
+        with pytest.raises(AmbiguousComponentException) as e:
+            taxonomy.getExplicitDimensionForDomainMember(item, member)
+        assert e.value.candidates == candidates
@@ -0,0 +1,196 @@
+"""Tests for sharing equal values between the loaded taxonomies."""
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from mireport.taxonomy import (
+    STANDARD_LABEL_ROLE,
+    Taxonomy,
+    _getUTRJSON,
+    getInterningReport,
+    getTaxonomy,
+    listTaxonomies,
+)
+from mireport.taxonomy_interning import INTERNED_KINDS, TaxonomyInterner
+from mireport.utr import UTR
+from mireport.xml import (
+    ISO4217_NS,
+    UTR_NS,
+    XBRLI_NS,
+    NamespaceManager,
+    QNameMaker,
+    getBootstrapQNameMaker,
+)
+
+
+@pytest.fixture(scope="module")
+def oldest_and_newest() -> tuple[Taxonomy, Taxonomy]:
+    entryPoints = sorted(listTaxonomies())
+    return getTaxonomy(entryPoints[0]), getTaxonomy(entryPoints[-1])
+
+
+class TestSharedBetweenTaxonomies:
+    def test_concepts_share_qnames_and_labels(
+        self, oldest_and_newest: tuple[Taxonomy, Taxonomy]
+    ) -> None:
+        old, new = oldest_and_newest
+        newByQName = {c.qname: c for c in new.concepts}
+        common = [
+            (c, newByQName[c.qname]) for c in old.concepts if c.qname in newByQName
+        ]
+        assert common
+        for concept, other in common:
+            assert other.qname is concept.qname
+            assert other.dataType is concept.dataType
+        sameLabels = [(c, o) for c, o in common if c._labels and o._labels == c._labels]
+        assert sameLabels
+        for concept, other in sameLabels:
+            assert other._labels is concept._labels
+
+    def test_label_text_is_shared(
+        self, oldest_and_newest: tuple[Taxonomy, Taxonomy]
+    ) -> None:
+        old, new = oldest_and_newest
+        newByQName = {c.qname: c for c in new.concepts}
+        for concept in old.concepts:
+            if (other := newByQName.get(concept.qname)) is None:
+                continue
+            label = concept.getLabelForRole(STANDARD_LABEL_ROLE, "en")
+            if label == (
+                otherLabel := other.getLabelForRole(STANDARD_LABEL_ROLE, "en")
+            ):
+                assert label is otherLabel
+
+    def test_utr_tables_are_shared(
+        self, oldest_and_newest: tuple[Taxonomy, Taxonomy]
+    ) -> None:
+        old, new = oldest_and_newest
+        assert old.UTR is not new.UTR
+        assert old.UTR._lookupUnitEntriesByQName is new.UTR._lookupUnitEntriesByQName
+
+    def test_report_counts_savings(
+        self, oldest_and_newest: tuple[Taxonomy, Taxonomy]
+    ) -> None:
+        savedBytes, overhead = getInterningReport()
+        assert overhead > 0
+        # Whichever of the two was loaded second shares with the other.
+        loadOrder = list(savedBytes)
+        later = max(oldest_and_newest, key=lambda t: loadOrder.index(t.entryPoint))
+        saved = savedBytes[later.entryPoint]
+        assert set(saved) <= set(INTERNED_KINDS)
+        assert saved["utr"] > 0
+        assert saved["labels"] > 0
+
+
+class TestUTRSharing:
+    def test_shared_with_matching_prefixes(self) -> None:
+        utr = UTR.fromDict(_getUTRJSON(), qnameMaker=getBootstrapQNameMaker())
+        other = getBootstrapQNameMaker()
+        shared = utr.sharedWith(other)
+        assert shared is not None
+        assert shared._lookupUnitIdByDataType is utr._lookupUnitIdByDataType
+        assert shared.getQNameForUnitId("EUR") == utr.getQNameForUnitId("EUR")
+
+    def test_not_shared_with_other_prefixes(self) -> None:
+        utr = UTR.fromDict(_getUTRJSON(), qnameMaker=getBootstrapQNameMaker())
+        namespaces = NamespaceManager()
+        namespaces.add("currency", ISO4217_NS)
+        namespaces.add("utr", UTR_NS)
+        namespaces.add("xbrli", XBRLI_NS)
+        assert utr.sharedWith(QNameMaker(namespaces)) is None
+
+    def test_interner_builds_new_utr_when_not_shareable(self) -> None:
+        interner = TaxonomyInterner()
+        savings = interner.startTaxonomy("a")
+        first = interner.utr(_getUTRJSON(), getBootstrapQNameMaker(), savings)
+        namespaces = NamespaceManager()
+        namespaces.add("currency", ISO4217_NS)
+        namespaces.add("utr", UTR_NS)
+        namespaces.add("xbrli", XBRLI_NS)
+        second = interner.utr(_getUTRJSON(), QNameMaker(namespaces), savings)
+        assert second._lookupUnitEntriesByQName is not first._lookupUnitEntriesByQName
+        assert savings.savedBytes["utr"] == 0
+
+
+class TestTaxonomyInterner:
+    def test_equal_labels_pooled(self) -> None:
+        interner = TaxonomyInterner()
+        savings = interner.startTaxonomy("a")
+        word = "Label"
+        first = interner.labels({"en": {STANDARD_LABEL_ROLE: f"{word} 1"}}, savings)
+        text = f"{word} 1"
+        second = interner.labels({"en": {STANDARD_LABEL_ROLE: text}}, savings)
+        assert first is second
+        assert second["en"][STANDARD_LABEL_ROLE] is not text
+        assert savings.savedBytes["labels"] > 0
+        assert savings.savedBytes["strings"] > 0
+
+    def test_different_labels_not_pooled(self) -> None:
+        interner = TaxonomyInterner()
+        savings = interner.startTaxonomy("a")
+        first = interner.labels({"en": {STANDARD_LABEL_ROLE: "One"}}, savings)
+        second = interner.labels({"en": {STANDARD_LABEL_ROLE: "Two"}}, savings)
+        assert first is not second
+        assert savings.savedBytes["labels"] == 0
+
+    def test_duplicate_counted_once(self) -> None:
+        interner = TaxonomyInterner()
+        savings = interner.startTaxonomy("a")
+        qmaker = getBootstrapQNameMaker()
+        interner.qname(qmaker.fromString("xbrli:monetaryItemType"), savings)
+        duplicate = qmaker.fromString("xbrli:monetaryItemType")
+        interner.qname(duplicate, savings)
+        once = savings.savedBytes["qnames"]
+        interner.qname(duplicate, savings)
+        assert once > 0
+        assert savings.savedBytes["qnames"] == once
+
+    def test_restart_resets_count(self) -> None:
+        interner = TaxonomyInterner()
+        savings = interner.startTaxonomy("a")
+        savings.savedBytes["strings"] += 10
+        interner.startTaxonomy("a")
+        assert interner.savedBytes["a"] == {}
+
+
+def test_forget_validated_strings() -> None:
+    qmaker = getBootstrapQNameMaker()
+    qname = qmaker.fromString("xbrli:monetaryItemType")
+    assert qmaker._validatedParts
+    qmaker.forgetValidatedStrings()
+    assert not qmaker._validatedParts
+    assert qmaker.fromString("xbrli:monetaryItemType") == qname
+
+
+class TestPickledConcept:
+    def test_unpickled_as_the_taxonomy_concept(self) -> None:
+        taxonomy = getTaxonomy(max(listTaxonomies()))
+        concept = next(iter(taxonomy.concepts))
+        assert pickle.loads(pickle.dumps(concept)) is concept
+
+    def test_unpickled_from_another_process(self) -> None:
+        # The concept's hash is its QName's, which depends on PYTHONHASHSEED.
+        pickled = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                (
+                    "import pickle, sys\n"
+                    "from mireport.taxonomy import getTaxonomy, listTaxonomies\n"
+                    "taxonomy = getTaxonomy(max(listTaxonomies()))\n"
+                    "sys.stdout.buffer.write(pickle.dumps(sorted(taxonomy.concepts, key=str)[:5]))"
+                ),
+            ],
+            env=os.environ | {"PYTHONHASHSEED": "1"},
+            capture_output=True,
+            check=True,
+        ).stdout
+        taxonomy = getTaxonomy(max(listTaxonomies()))
+        expected = sorted(taxonomy.concepts, key=str)[:5]
+        concepts = pickle.loads(pickled)
+        assert concepts == expected
+        assert all(c in set(expected) for c in concepts)
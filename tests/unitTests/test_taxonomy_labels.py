@@ -0,0 +1,93 @@
+"""Tests for concept label lookup through the taxonomy's label tables."""
+
+import pytest
+
+from mireport.taxonomy import (
+    STANDARD_LABEL_ROLE,
+    Concept,
+    Taxonomy,
+    getTaxonomy,
+    listTaxonomies,
+)
+
+
+@pytest.fixture(scope="module")
+def taxonomy() -> Taxonomy:
+    return getTaxonomy(max(listTaxonomies()))
+
+
+@pytest.fixture(scope="module")
+def suffixed(taxonomy: Taxonomy) -> Concept:
+    """A concept whose standard label (in the default language) has a suffix."""
+    for concept in sorted(taxonomy.concepts, key=str):
+        label = concept.getStandardLabel()
+        if label and label.endswith("]"):
+            return concept
+    pytest.skip("taxonomy has no suffixed standard label")
+
+
+class TestLabelTables:
+    def test_table_built_once(self, taxonomy: Taxonomy, suffixed: Concept) -> None:
+        suffixed.getStandardLabel("en", removeSuffix=True)
+        tables = dict(taxonomy._labelTables)
+        for concept in taxonomy.concepts:
+            concept.getStandardLabel("en", removeSuffix=True)
+        assert taxonomy._labelTables == tables
+
+    def test_language_case_ignored(self, suffixed: Concept) -> None:
+        assert suffixed.getStandardLabel("EN") == suffixed.getStandardLabel("en")
+
+    def test_default_language(self, taxonomy: Taxonomy, suffixed: Concept) -> None:
+        assert suffixed.getStandardLabel() == suffixed.getStandardLabel(
+            taxonomy.defaultLanguage
+        )
+
+    def test_remove_suffix(self, suffixed: Concept) -> None:
+        label = suffixed.getStandardLabel()
+        assert label is not None
+        stripped = suffixed.getStandardLabel(removeSuffix=True)
+        assert stripped is not None
+        assert stripped != label
+        assert label.startswith(stripped)
+
+    def test_unsupported_languages_share_a_table(
+        self, taxonomy: Taxonomy, suffixed: Concept
+    ) -> None:
+        suffixed.getStandardLabel("xx", fallbackToAnyLang=True)
+        before = len(taxonomy._labelTables)
+        assert (
+            suffixed.getStandardLabel("yy-zz", fallbackToAnyLang=True)
+            == suffixed.getStandardLabel()
+        )
+        assert len(taxonomy._labelTables) == before
+        assert suffixed.getStandardLabel("xx") is None
+
+    def test_language_variants_share_a_table(
+        self, taxonomy: Taxonomy, suffixed: Concept
+    ) -> None:
+        suffixed.getStandardLabel("en-x-1")
+        before = len(taxonomy._labelTables)
+        for n in range(2, 50):
+            assert suffixed.getStandardLabel(f"en-x-{n}") == suffixed.getStandardLabel(
+                "en-x-1"
+            )
+        assert len(taxonomy._labelTables) == before
+        assert suffixed.getStandardLabel("en-x-1") == suffixed._resolveLabel(
+            STANDARD_LABEL_ROLE, "en-x-1", False, ""
+        )
+
+    def test_fallbacks_after_table(self, suffixed: Concept) -> None:
+        role = "http://example.com/role/none"
+        assert suffixed.getLabelForRole(role) is None
+        assert suffixed.getLabelForRole(role, fallbackLabel="A [b]") == "A [b]"
+        assert (
+            suffixed.getLabelForRole(role, fallbackLabel="A [b]", removeSuffix=True)
+            == "A"
+        )
+        assert suffixed.getLabelForRole(role, fallbackToQName=True) == str(
+            suffixed.qname
+        )
+
+    def test_concepts_know_their_position(self, taxonomy: Taxonomy) -> None:
+        for concept in taxonomy.concepts:
+            assert taxonomy._conceptOrder[concept._position] is concept
@@ -0,0 +1,58 @@
+"""Tests for the presentation networks and the PresentationGroups made from them."""
+
+import pytest
+
+from mireport.json import getObject
+from mireport.taxonomy import (
+    PresentationGroup,
+    Taxonomy,
+    _createTaxonomyFromJSON,
+    _getUTRJSON,
+    _taxonomyJsonFiles,
+)
+
+
+@pytest.fixture
+def taxonomy() -> Taxonomy:
+    """A newly built taxonomy, so that nothing has asked for its presentation."""
+    source = max(_taxonomyJsonFiles(), key=lambda f: f.name)
+    return _createTaxonomyFromJSON(getObject(source), _getUTRJSON())
+
+
+class TestPresentationNetworks:
+    def test_groups_made_on_first_use(self, taxonomy: Taxonomy) -> None:
+        assert "presentation" not in vars(taxonomy)
+        groups = taxonomy.presentation
+        assert len(groups) == len(taxonomy._presentationNetworks)
+        assert taxonomy.presentation is groups
+
+    def test_groups_match_networks(self, taxonomy: Taxonomy) -> None:
+        for group, network in zip(
+            taxonomy.presentation, taxonomy._presentationNetworks, strict=True
+        ):
+            assert group.roleUri == network.roleUri
+            assert group.definition == network.definition
+            assert group.labels == network.labels
+            assert [r.concept._position for r in group.relationships] == list(
+                network.concepts
+            )
+            assert [r.depth for r in group.relationships] == list(network.depths)
+            preferred = [r.preferredLabel for r in group.relationships]
+            if network.preferredLabels is None:
+                assert not any(preferred)
+            else:
+                assert preferred == list(network.preferredLabels)
+            assert {r.roleUri for r in group.relationships} <= {group.roleUri}
+
+    def test_some_groups_have_preferred_labels(self, taxonomy: Taxonomy) -> None:
+        networks = taxonomy._presentationNetworks
+        assert any(n.preferredLabels is not None for n in networks)
+        assert any(n.preferredLabels is None for n in networks)
+
+    def test_from_json(self, taxonomy: Taxonomy) -> None:
+        source = max(_taxonomyJsonFiles(), key=lambda f: f.name)
+        roleUri, metaData = next(iter(getObject(source)["presentation"].items()))
+        group = PresentationGroup.fromJSON(taxonomy, roleUri, metaData)
+        expected = next(g for g in taxonomy.presentation if g.roleUri == roleUri)
+        assert group.style is expected.style
+        assert group.relationships == expected.relationships
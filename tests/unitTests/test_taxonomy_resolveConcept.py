@@ -172,3 +172,48 @@ class TestPredicateSemantics:
     def test_no_strategy_still_raises_value_error(self, taxonomy):
         with pytest.raises(ValueError):
             taxonomy.resolveConcept("anything", predicate=lambda c: True)
+
+
+class TestResolutionCache:
+    def test_repeat_lookup_is_a_hit(self, taxonomy, unique_reportable):
+        label, concept = unique_reportable
+        taxonomy.resolveConcept(label, by_label=True)
+        before = taxonomy.resolveConceptCacheStatistics()
+        assert taxonomy.resolveConcept(label, by_label=True) is concept
+        after = taxonomy.resolveConceptCacheStatistics()
+        assert (after.hits, after.misses) == (before.hits + 1, before.misses)
+
+    def test_not_found_is_remembered(self, taxonomy):
+        text = "No concept has this label or name"
+        assert taxonomy.resolveConcept(text, by_label=True, by_name=True) is None
+        before = taxonomy.resolveConceptCacheStatistics()
+        assert taxonomy.resolveConcept(text, by_label=True, by_name=True) is None
+        assert taxonomy.resolveConceptCacheStatistics().hits == before.hits + 1
+
+    def test_strategies_cached_separately(self, taxonomy, unique_reportable):
+        _, concept = unique_reportable
+        qname = str(concept.qname)
+        assert taxonomy.resolveConcept(qname, by_label=True) is None
+        assert taxonomy.resolveConcept(qname, by_qname=True) is concept
+
+    def test_filters_apply_to_cached_candidates(self, taxonomy, ambiguous_label):
+        text, concepts = ambiguous_label
+        for _ in range(2):
+            with pytest.raises(AmbiguousComponentException):
+                taxonomy.resolveConcept(text, by_label=True, only_reportable=False)
+            for concept in concepts:
+                assert (
+                    taxonomy.resolveConcept(
+                        text,
+                        by_label=True,
+                        only_reportable=False,
+                        predicate=lambda c, concept=concept: c is concept,
+                    )
+                    is concept
+                )
+
+    def test_statistics(self, taxonomy):
+        statistics = taxonomy.resolveConceptCacheStatistics()
+        assert 0.0 <= statistics.hitRate <= 1.0
+        assert statistics.size <= statistics.maxSize
+        assert "hit rate" in str(statistics)
@@ -0,0 +1,204 @@
+"""Tests for loading the built-in taxonomies: the manifest, building them on
+first use and the binary snapshots written by buildTaxonomySnapshots()."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import msgpack
+import pytest
+
+import mireport.taxonomy as taxonomy_module
+from mireport.data import taxonomies
+from mireport.exceptions import UnknownTaxonomyException
+from mireport.json import getObject, getResource
+from mireport.taxonomy import (
+    TAXONOMY_MANIFEST_NAME,
+    TAXONOMY_SNAPSHOT_FORMAT,
+    Concept,
+    Taxonomy,
+    _createTaxonomyFromJSON,
+    _getUTRJSON,
+    _restoreTaxonomySnapshot,
+    _taxonomyJsonFiles,
+    buildTaxonomyManifest,
+    buildTaxonomySnapshots,
+    getTaxonomy,
+    getTaxonomySupportedLanguages,
+    listTaxonomies,
+    preloadTaxonomies,
+)
+
+
+@pytest.fixture(scope="module")
+def snapshots(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    written = buildTaxonomySnapshots(tmp_path_factory.mktemp("snapshots"))
+    return {path.stem: path for path in written}
+
+
+@pytest.fixture(scope="module")
+def fromJSON() -> dict[str, Taxonomy]:
+    return {
+        f.name: _createTaxonomyFromJSON(getObject(f), _getUTRJSON())
+        for f in _taxonomyJsonFiles()
+    }
+
+
+@pytest.fixture
+def unloaded(monkeypatch: pytest.MonkeyPatch) -> dict[str, Taxonomy]:
+    """A fresh, empty registry so that tests see taxonomies loaded on demand."""
+    registry: dict[str, Taxonomy] = {}
+    monkeypatch.setattr(taxonomy_module, "_TAXONOMIES", registry)
+    monkeypatch.setattr(taxonomy_module, "_MANIFEST", None)
+    return registry
+
+
+def rewrite(snapshot: Path, destination: Path, **changes: object) -> Path:
+    bits = msgpack.unpackb(snapshot.read_bytes(), raw=False)
+    bits.update(changes)
+    destination.write_bytes(msgpack.packb(bits, use_bin_type=True))
+    return destination
+
+
+def sourceFor(name: str):
+    return getResource(taxonomies, f"{name}.json")
+
+
+class TestManifest:
+    def test_checked_in_manifest_is_current(self, tmp_path) -> None:
+        current = getObject(getResource(taxonomies, TAXONOMY_MANIFEST_NAME))
+        assert json.loads(buildTaxonomyManifest(tmp_path).read_text()) == current
+
+    def test_listing_builds_nothing(self, unloaded) -> None:
+        assert len(listTaxonomies()) == len(_taxonomyJsonFiles())
+        assert unloaded == {}
+
+    def test_supported_languages_without_building(self, unloaded) -> None:
+        for entryPoint in listTaxonomies():
+            assert "en" in getTaxonomySupportedLanguages(entryPoint)
+        assert unloaded == {}
+
+    def test_unknown_entry_point(self, unloaded) -> None:
+        with pytest.raises(UnknownTaxonomyException):
+            getTaxonomy("https://example.com/not-a-taxonomy.xsd")
+        with pytest.raises(UnknownTaxonomyException):
+            getTaxonomySupportedLanguages("https://example.com/not-a-taxonomy.xsd")
+
+
+class TestLoadOnDemand:
+    def test_builds_only_the_requested_taxonomy(self, unloaded) -> None:
+        entryPoint = listTaxonomies()[0]
+        taxonomy = getTaxonomy(entryPoint)
+        assert taxonomy.entryPoint == entryPoint
+        assert list(unloaded) == [entryPoint]
+        assert getTaxonomy(entryPoint) is taxonomy
+
+    def test_concurrent_first_use_builds_once(self, unloaded) -> None:
+        entryPoint = listTaxonomies()[-1]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            found = list(pool.map(getTaxonomy, [entryPoint] * 8))
+        assert all(taxonomy is found[0] for taxonomy in found)
+
+    def test_languages_match_the_taxonomy(self, unloaded) -> None:
+        for entryPoint in listTaxonomies():
+            assert (
+                getTaxonomySupportedLanguages(entryPoint)
+                == getTaxonomy(entryPoint).supportedLanguages
+            )
+
+    def test_preload_builds_everything_up_front(self, unloaded, monkeypatch) -> None:
+        frozen = []
+        monkeypatch.setattr(taxonomy_module.gc, "freeze", lambda: frozen.append(1))
+        preloadTaxonomies()
+        assert frozen == [1]
+        assert set(unloaded) == set(listTaxonomies())
+        for taxonomy in unloaded.values():
+            # Cached on first use otherwise, after the workers have forked.
+            assert "defaultLanguage" in vars(taxonomy)
+            assert "_currencies" in vars(taxonomy.UTR)
+
+
+class TestRestore:
+    def test_restored_matches_json(self, snapshots, fromJSON) -> None:
+        for name, snapshot in snapshots.items():
+            restored = _restoreTaxonomySnapshot(snapshot, sourceFor(name))
+            assert restored is not None
+            expected = fromJSON[f"{name}.json"]
+            assert restored.entryPoint == expected.entryPoint
+            assert restored.concepts == expected.concepts
+            assert restored.presentation == expected.presentation
+            assert restored.hypercubes == expected.hypercubes
+            assert restored.defaultLanguage == expected.defaultLanguage
+            assert (
+                restored._lookupConceptsByStandardLabel
+                == expected._lookupConceptsByStandardLabel
+            )
+            assert (
+                restored._lookupConceptsByPretendLabel
+                == expected._lookupConceptsByPretendLabel
+            )
+            assert {c.qname: c.requiredUnitQNames for c in restored.concepts} == {
+                c.qname: c.requiredUnitQNames for c in expected.concepts
+            }
+
+    def test_restored_concepts_belong_to_their_taxonomy(self, snapshots) -> None:
+        name, snapshot = next(iter(snapshots.items()))
+        restored = _restoreTaxonomySnapshot(snapshot, sourceFor(name))
+        assert restored is not None
+        concept = next(iter(restored.concepts))
+        assert restored.getConcept(str(concept.qname)) is concept
+        assert concept._taxonomy is restored
+
+
+class TestRequiredUnits:
+    def test_restored_without_parsing_labels(self, snapshots, monkeypatch) -> None:
+        def refuse(self: Concept) -> None:
+            raise AssertionError(f"{self} parsed its measurement guidance label")
+
+        monkeypatch.setattr(Concept, "_findRequiredUnitQNames", refuse)
+        name, snapshot = next(iter(snapshots.items()))
+        restored = _restoreTaxonomySnapshot(snapshot, sourceFor(name))
+        assert restored is not None
+        assert any(c.requiredUnitQNames for c in restored.concepts)
+
+    def test_match_measurement_guidance(self, fromJSON) -> None:
+        for taxonomy in fromJSON.values():
+            for concept in taxonomy.concepts:
+                assert (
+                    concept.getRequiredUnitQNames() == concept._findRequiredUnitQNames()
+                )
+
+
+class TestStaleness:
+    def test_changed_source_is_ignored(self, snapshots, tmp_path) -> None:
+        name, snapshot = next(iter(snapshots.items()))
+        bits = msgpack.unpackb(snapshot.read_bytes(), raw=False)
+        sources = dict(bits["sources"], **{f"{name}.json": "0" * 64})
+        stale = rewrite(snapshot, tmp_path / "stale.msgpack", sources=sources)
+        assert _restoreTaxonomySnapshot(stale, sourceFor(name)) is None
+
+    def test_snapshot_of_another_taxonomy_is_ignored(self, snapshots) -> None:
+        first, second = list(snapshots)[:2]
+        assert _restoreTaxonomySnapshot(snapshots[first], sourceFor(second)) is None
+
+    def test_other_format_is_ignored(self, snapshots, tmp_path) -> None:
+        name, snapshot = next(iter(snapshots.items()))
+        other = rewrite(
+            snapshot, tmp_path / "other.msgpack", format=TAXONOMY_SNAPSHOT_FORMAT + 1
+        )
+        assert _restoreTaxonomySnapshot(other, sourceFor(name)) is None
+
+    def test_unreadable_snapshot_is_ignored(self, snapshots, tmp_path) -> None:
+        name = next(iter(snapshots))
+        broken = tmp_path / "broken.msgpack"
+        broken.write_bytes(b"\xc1 not msgpack")
+        assert _restoreTaxonomySnapshot(broken, sourceFor(name)) is None
+
+
+class TestIndexLabels:
+    def test_positions_are_unique_per_label(self, fromJSON) -> None:
+        taxonomy = next(iter(fromJSON.values()))
+        tables = Taxonomy._indexLabels(tuple(taxonomy._conceptsByString.values()))
+        for table in tables.values():
+            for positions in table.values():
+                assert len(positions) == len(set(positions))
@@ -1,3 +1,8 @@
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
 
 from mireport.exceptions import BrokenNamespacePrefixException, BrokenQNameException
@@ -139,3 +144,51 @@ def test_valid_qname_all_test_ns(qname_maker: QNameMaker) -> None:
     assert qname_maker.isValidQName("test:ValidName")
     assert qname_maker.isValidQName("data:another_one")
     assert qname_maker.isValidQName("data:another_one.two")
+
+
+def test_qname_equality_and_hash(qname_maker: QNameMaker) -> None:
+    other = QNameMaker(qname_maker._nsManager)
+    a = qname_maker.fromString("foo:Element")
+    b = other.fromString("foo:Element")
+    assert a is not b
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert a != qname_maker.fromString("foo:Other")
+    assert a != qname_maker.fromString("bar:Element")
+    assert a != "foo:Element"
+
+
+def test_qname_same_namespace_other_prefix(ns_manager: NamespaceManager) -> None:
+    ns_manager.add("foo2", "http://example.com/foo")
+    maker = QNameMaker(ns_manager)
+    a = maker.fromString("foo:Element")
+    b = maker.fromString("foo2:Element")
+    assert a.namespace == b.namespace
+    assert a != b
+
+
+def test_qname_unpickled_from_another_process(qmaker: QNameMaker) -> None:
+    # str hashes depend on PYTHONHASHSEED, so a QName pickled by a process with
+    # a different seed must not bring its hash along.
+    pickled = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import pickle, sys\n"
+                "from mireport.xml import NamespaceManager, QNameMaker\n"
+                "ns = NamespaceManager()\n"
+                "ns.add('xbrli', 'http://www.xbrl.org/2003/instance')\n"
+                "sys.stdout.buffer.write(pickle.dumps(QNameMaker(ns).fromString('xbrli:pure')))"
+            ),
+        ],
+        env=os.environ | {"PYTHONHASHSEED": "1"},
+        capture_output=True,
+        check=True,
+    ).stdout
+    qname = pickle.loads(pickled)
+    expected = qmaker.fromString("xbrli:pure")
+    assert qname == expected
+    assert hash(qname) == hash(expected)
+    assert qname in {expected}
@@ -205,7 +205,7 @@ def external_values_case_empty_cell():
     bindings = WorkbookBinder(reader, report.taxonomy, binder_results).bind()
     holder = next(crm for crm in bindings.concept_map.values() if crm.concept == chosen)
     cr = holder.cellRange
-    for row in holder.worksheet.iter_rows(
+    for row in wb[holder.worksheet.title].iter_rows(
         min_row=cr.min_row, max_row=cr.max_row, min_col=cr.min_col, max_col=cr.max_col
     ):
         for cell in row:
@@ -10,6 +10,7 @@ running this module directly:
 
 from __future__ import annotations
 
+import difflib
 import json
 from collections import Counter
 from pathlib import Path
@@ -230,6 +231,15 @@ class TestGetClosestEEMemberMatch:
     def test_garbage_returns_none(self, ee_concept):
         assert getClosestEEMemberMatch(ee_concept, "zzz qqq 12345 xyzzy") is None
 
+    def test_agrees_with_difflib(self, ee_concept):
+        labels = eeDomainByLabel(ee_concept)
+        for member in ee_concept.getEEDomain():
+            label = member.getStandardLabel()
+            for text in (label.lower(), label[:-3], f"{label} [x]", label[::2]):
+                expected = difflib.get_close_matches(text, labels, n=1, cutoff=0.6)
+                result = getClosestEEMemberMatch(ee_concept, text)
+                assert result == (labels[expected[0]] if expected else None)
+
 
 class TestResolveMemberByLabel:
     """The one implementation of the exact -> configured-alias -> closest-match
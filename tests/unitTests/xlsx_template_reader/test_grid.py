@@ -0,0 +1,136 @@
+"""Tests for WorksheetGrid and WorkbookReader's use of it."""
+
+from io import BytesIO
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.cell_range import CellRange
+
+from mireport.conversionresults import ConversionResultsBuilder
+from mireport.xlsx_template_reader._grid import (
+    GridCell,
+    MergedGridCell,
+    WorksheetGrid,
+    _mergeSpans,
+)
+from mireport.xlsx_template_reader._reader import WorkbookReader
+
+
+@pytest.fixture
+def wb() -> Workbook:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Data"
+    ws["A1"] = "heading"
+    ws["B2"] = 1.5
+    ws["B2"].number_format = "0.00"
+    ws["C2"] = None  # Exists, but empty.
+    ws.merge_cells("A3:C3")
+    ws["A3"] = "merged"
+    ws["E5"] = "outside"
+    return wb
+
+
+def _grid(worksheet, *references: str) -> WorksheetGrid:
+    grid = WorksheetGrid(worksheet.title)
+    grid.fetch(worksheet, [CellRange(r) for r in references])
+    return grid
+
+
+class TestWorksheetGrid:
+    def test_values_and_number_formats(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "A1:C3")
+        assert grid.cell(1, 1) == GridCell(1, 1, "heading")
+        assert grid.cell(2, 2) == GridCell(2, 2, 1.5, "0.00")
+        assert grid.cell(2, 2).coordinate == "B2"
+
+    def test_empty_cells(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "A1:C3")
+        assert grid.cell(2, 3) == GridCell(2, 3)
+        assert grid.cell(99, 99).value is None
+        assert grid._rows.keys() == {1, 2, 3}
+        assert 3 not in grid._rows[2]
+
+    def test_merged_cells(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "A1:C3")
+        assert grid.cell(3, 1) == GridCell(3, 1, "merged")
+        assert not isinstance(grid.cell(3, 1), MergedGridCell)
+        assert isinstance(grid.cell(3, 2), MergedGridCell)
+        assert grid.cell(3, 3).value is None
+
+    def test_only_ranges_read(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "A1:C3")
+        assert grid.cell(5, 5).value is None
+        grid.fetch(wb.active, [CellRange("E5")])
+        assert grid.cell(5, 5).value == "outside"
+
+    def test_small_range_of_large_worksheet(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "B2")
+        assert grid._rows == {2: {2: GridCell(2, 2, 1.5, "0.00")}}
+
+    def test_iter_rows(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "A1:C3")
+        rows = list(grid.iter_rows(min_row=2, min_col=1, max_row=4, max_col=2))
+        assert [[c.coordinate for c in row] for row in rows] == [
+            ["A2", "B2"],
+            ["A3", "B3"],
+            ["A4", "B4"],
+        ]
+        assert [[c.value for c in row] for row in rows] == [
+            [None, 1.5],
+            ["merged", None],
+            [None, None],
+        ]
+
+    def test_iter_populated_rows(self, wb: Workbook) -> None:
+        grid = _grid(wb.active, "A1:C3")
+        rows = grid.iterPopulatedRows(min_row=1, min_col=1, max_row=5, max_col=5)
+        assert [(row, [c.value for c in cells]) for row, cells in rows] == [
+            (1, ["heading"]),
+            (2, [1.5]),
+            (3, ["merged"]),
+        ]
+        assert not list(
+            grid.iterPopulatedRows(min_row=2, min_col=3, max_row=4, max_col=5)
+        )
+        grid.fetch(wb.active, [CellRange("E5")])
+        rows = grid.iterPopulatedRows(min_row=4, min_col=1, max_row=5, max_col=5)
+        assert [(row, [c.coordinate for c in cells]) for row, cells in rows] == [
+            (5, ["E5"])
+        ]
+
+    def test_read_only_worksheet(self, wb: Workbook) -> None:
+        saved = BytesIO()
+        wb.save(saved)
+        readOnly = load_workbook(saved, read_only=True)
+        grid = _grid(readOnly["Data"], "A1:C3", "E5")
+        assert grid.cell(1, 1).value == "heading"
+        assert grid.cell(2, 2).number_format == "0.00"
+        assert grid.cell(5, 5).value == "outside"
+        readOnly.close()
+
+
+def test_merge_spans() -> None:
+    assert _mergeSpans([(5, 6), (1, 2), (2, 3), (8, 9), (4, 4)]) == [(1, 6), (8, 9)]
+
+
+class TestReaderGrids:
+    @pytest.fixture
+    def reader(self, wb: Workbook) -> WorkbookReader:
+        wb.defined_names["Heading"] = DefinedName("Heading", attr_text="Data!$A$1")
+        wb.defined_names["Amount"] = DefinedName("Amount", attr_text="Data!$B$2")
+        return WorkbookReader(wb, ConversionResultsBuilder(consoleOutput=False))
+
+    def test_all_names_read_on_first_use(self, reader: WorkbookReader) -> None:
+        assert reader.value("Heading").as_str() == "heading"
+        grid = reader._grids["Data"]
+        assert grid.cell(2, 2).value == 1.5
+        assert reader.value("Amount").raw == 1.5
+        assert reader._grids == {"Data": grid}
+
+    def test_name_added_later(self, wb: Workbook, reader: WorkbookReader) -> None:
+        assert reader.value("Heading").as_str() == "heading"
+        wb.defined_names["Other"] = DefinedName("Other", attr_text="Data!$E$5")
+        assert reader.value("Other").as_str() == "outside"
@@ -5,9 +5,11 @@ from openpyxl import Workbook
 from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
+from mireport.xlsx_template_reader import _ranges
 from mireport.xlsx_template_reader._ranges import (
     _CellRangeDimensions,
     getEffectiveCellRangeDimensions,
+    iterPopulatedRows,
 )
 
 
@@ -63,3 +65,51 @@ def test_single_cell_range(sample_worksheet: Worksheet) -> None:
     assert dims.countPopulated == 1
     assert dims.populated_width == 1
     assert dims.populated_height == 1
+
+
+def test_empty_cells_not_created(sample_worksheet: Worksheet) -> None:
+    cells = len(sample_worksheet._cells)
+    dims = getEffectiveCellRangeDimensions(sample_worksheet, CellRange("A1:Z500"))
+
+    assert dims.countAccessed == 26 * 500
+    assert dims.countPopulated == 4
+    assert len(sample_worksheet._cells) == cells
+
+
+def test_populated_rows(sample_worksheet: Worksheet) -> None:
+    rows = iterPopulatedRows(sample_worksheet, CellRange("A1:C3"))
+
+    assert [(row, [c.coordinate for c in cells]) for row, cells in rows] == [
+        (1, ["A1", "B1"]),
+        (2, ["A2"]),
+        (3, ["B3"]),
+    ]
+
+
+def test_populated_rows_index_shared_by_ranges(
+    sample_worksheet: Worksheet, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    builds: list[Worksheet] = []
+    build = _ranges._RowIndex.build
+
+    def countingBuild(ws: Worksheet) -> _ranges._RowIndex:
+        builds.append(ws)
+        return build(ws)
+
+    monkeypatch.setattr(_ranges._RowIndex, "build", countingBuild)
+    for ref in ("A1:A3", "B1:B3", "A2:C2"):
+        list(iterPopulatedRows(sample_worksheet, CellRange(ref)))
+    assert len(builds) == 1
+
+
+def test_populated_rows_see_new_cells_and_values(sample_worksheet: Worksheet) -> None:
+    list(iterPopulatedRows(sample_worksheet, CellRange("A1:C3")))
+    sample_worksheet["C2"] = "New"
+    sample_worksheet["A1"] = None
+    rows = iterPopulatedRows(sample_worksheet, CellRange("A1:C3"))
+
+    assert [(row, [c.coordinate for c in cells]) for row, cells in rows] == [
+        (1, ["B1"]),
+        (2, ["A2", "C2"]),
+        (3, ["B3"]),
+    ]
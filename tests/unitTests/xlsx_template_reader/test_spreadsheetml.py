@@ -0,0 +1,129 @@
+"""Tests for reading workbooks straight from their SpreadsheetML.
+
+The parity tests convert every workbook in digital-templates with both the
+SpreadsheetML and the openpyxl backends and check that the facts (and the
+messages) are the same.
+"""
+
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.cell.rich_text import CellRichText, TextBlock
+from openpyxl.cell.text import InlineFont
+from openpyxl.workbook.defined_name import DefinedName
+
+from mireport.conversionresults import ConversionResultsBuilder
+from mireport.data.disclosures import VSME_DEFAULTS
+from mireport.exceptions import EarlyAbortException, SpreadsheetMLException
+from mireport.xlsx_template_reader._grid import GridCell, MergedGridCell
+from mireport.xlsx_template_reader._reader import TemplateWorkbook
+from mireport.xlsx_template_reader._spreadsheetml import (
+    SpreadsheetMLWorkbook,
+    loadSpreadsheetMLFromPathOrFileLike,
+)
+from mireport.xlsx_template_reader.processor import XlsxProcessor
+from mireport.xlsx_template_reader.util import loadReferencedSheetsFromPathOrFileLike
+
+TEMPLATES = sorted(
+    (Path(__file__).parent.parent.parent.parent / "digital-templates").glob("*.xlsx")
+)
+
+
+@pytest.fixture
+def saved() -> BytesIO:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Data"
+    ws["A1"] = "heading"
+    ws["B2"] = 1.5
+    ws["B2"].number_format = "0.00"
+    ws["B3"] = 42
+    ws["B4"] = datetime(2024, 6, 15)
+    ws["B5"] = True
+    ws["B6"] = CellRichText("plain ", TextBlock(InlineFont(b=True), "bold"))
+    ws.merge_cells("A8:C8")
+    ws["A8"] = "merged"
+    wb.create_sheet("Unreferenced")["A1"] = "unread"
+    wb.defined_names["Data"] = DefinedName("Data", attr_text="Data!$A$1:$C$8")
+    saved = BytesIO()
+    wb.save(saved)
+    saved.seek(0)
+    return saved
+
+
+class TestLoadSpreadsheetML:
+    def test_values_and_number_formats(self, saved: BytesIO) -> None:
+        cells = loadSpreadsheetMLFromPathOrFileLike(saved)["Data"]._cells
+        assert cells[(1, 1)] == GridCell(1, 1, "heading")
+        assert cells[(2, 2)] == GridCell(2, 2, 1.5, "0.00")
+        assert cells[(3, 2)].value == 42
+        assert cells[(4, 2)].value == datetime(2024, 6, 15)
+        assert cells[(5, 2)].value is True
+        assert isinstance(cells[(6, 2)].value, CellRichText)
+        assert str(cells[(6, 2)].value) == "plain bold"
+
+    def test_merged_cells(self, saved: BytesIO) -> None:
+        cells = loadSpreadsheetMLFromPathOrFileLike(saved)["Data"]._cells
+        assert cells[(8, 1)] == GridCell(8, 1, "merged")
+        assert isinstance(cells[(8, 2)], MergedGridCell)
+        assert isinstance(cells[(8, 3)], MergedGridCell)
+
+    def test_only_referenced_sheets_read(self, saved: BytesIO) -> None:
+        wb = loadSpreadsheetMLFromPathOrFileLike(saved)
+        assert wb.sheetnames == ["Data"]
+        assert list(wb.defined_names) == ["Data"]
+        with pytest.raises(KeyError):
+            wb["Unreferenced"]
+
+    def test_same_cells_as_openpyxl(self, saved: BytesIO) -> None:
+        cells = loadSpreadsheetMLFromPathOrFileLike(saved)["Data"]._cells
+        ws = loadReferencedSheetsFromPathOrFileLike(saved)["Data"]
+        assert {
+            k: c.value for k, c in cells.items() if not isinstance(c, MergedGridCell)
+        } == {k: c.value for k, c in ws._cells.items() if c.value is not None}
+
+    def test_not_a_workbook(self) -> None:
+        with pytest.raises(SpreadsheetMLException):
+            loadSpreadsheetMLFromPathOrFileLike(BytesIO(b"not a zip file"))
+
+    def test_processor_uses_spreadsheetml(self, saved: BytesIO) -> None:
+        processor = XlsxProcessor.from_bytes(
+            saved.getvalue(), ConversionResultsBuilder(consoleOutput=False), {}
+        )
+        assert isinstance(processor._reader._workbook, SpreadsheetMLWorkbook)
+
+
+def _convert(
+    workbook: TemplateWorkbook,
+) -> tuple[list[tuple[str, str, list[tuple[str, str]]]], list[str]]:
+    results = ConversionResultsBuilder(consoleOutput=False)
+    processor = XlsxProcessor(workbook, results, VSME_DEFAULTS)
+    try:
+        report = processor.createReport()
+    except EarlyAbortException:
+        # The blank templates stop at the missing required metadata.
+        return [], [str(m) for m in results.build().messages]
+    facts = [
+        (
+            str(fact.concept.qname),
+            str(fact.value),
+            sorted((str(k), str(v)) for k, v in fact.aspects.items()),
+        )
+        for fact in report.facts
+    ]
+    return facts, [str(m) for m in results.build().messages]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("template", TEMPLATES, ids=lambda p: p.name)
+def test_same_facts_as_openpyxl(template: Path) -> None:
+    facts, messages = _convert(loadSpreadsheetMLFromPathOrFileLike(template))
+    expectedFacts, expectedMessages = _convert(
+        loadReferencedSheetsFromPathOrFileLike(template)
+    )
+    assert facts == expectedFacts
+    assert messages == expectedMessages
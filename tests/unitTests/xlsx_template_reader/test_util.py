@@ -1,11 +1,25 @@
 """Tests for xlsx_template_reader.util helpers."""
 
 from datetime import date, datetime
+from pathlib import Path
 
 import pytest
 from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
 
-from mireport.xlsx_template_reader.util import get_decimal_places, getDateFromValue
+from mireport.xlsx_template_reader.util import (
+    get_decimal_places,
+    getDateFromValue,
+    loadExcelFromPathOrFileLike,
+    loadReferencedSheetsFromPathOrFileLike,
+    referencedSheetNames,
+)
+
+SAMPLE = (
+    Path(__file__).parent.parent.parent
+    / "data"
+    / "VSME-Digital-Template-Sample-1.2.0.xlsx"
+)
 
 
 def _cell(number_format: str):
@@ -58,3 +72,56 @@ class TestGetDateFromValue:
     def test_unsupported_type_raises(self):
         with pytest.raises(TypeError):
             getDateFromValue(42)
+
+
+class TestReferencedSheetNames:
+    def test_lookup_lists_ignored(self):
+        names = [
+            DefinedName("template_currency", attr_text="'General Information'!$D$5"),
+            DefinedName("enum_units", attr_text="'Enumeration Lists'!$A$1:$A$9"),
+            DefinedName("Revenue", attr_text="Sheet1!$B$2"),
+        ]
+        assert referencedSheetNames(names) == {"General Information", "Sheet1"}
+
+    def test_damaged_name_ignored(self):
+        assert referencedSheetNames([DefinedName("broken", attr_text="#REF!")]) == set()
+
+
+@pytest.fixture(scope="module")
+def workbooks():
+    full = loadExcelFromPathOrFileLike(SAMPLE)
+    streamed = loadReferencedSheetsFromPathOrFileLike(SAMPLE)
+    yield full, streamed
+    full.close()
+    streamed.close()
+
+
+class TestLoadReferencedSheets:
+    def test_only_referenced_sheets_loaded(self, workbooks):
+        full, streamed = workbooks
+        expected = referencedSheetNames(full.defined_names.values())
+        assert set(streamed.sheetnames) == expected
+        assert set(streamed.sheetnames) < set(full.sheetnames)
+        assert "Enumeration Lists" not in streamed.sheetnames
+
+    def test_defined_names_kept(self, workbooks):
+        full, streamed = workbooks
+        assert {n: dn.attr_text for n, dn in streamed.defined_names.items()} == {
+            n: dn.attr_text for n, dn in full.defined_names.items()
+        }
+
+    def test_same_cells(self, workbooks):
+        full, streamed = workbooks
+        for ws in streamed.worksheets:
+            original = full[ws.title]
+            assert {str(m) for m in ws.merged_cells} == {
+                str(m) for m in original.merged_cells
+            }
+            for row in original.iter_rows():
+                for cell in row:
+                    copy = ws.cell(row=cell.row, column=cell.column)
+                    assert type(copy) is type(cell)
+                    assert str(copy.value) == str(cell.value)
+                    if cell.value is not None:
+                        assert type(copy.value) is type(cell.value)
+                        assert copy.number_format == cell.number_format
@@ -3,6 +3,7 @@
 import json
 import logging
 
+import digital_converter_webapp
 import mireport
 from digital_converter_webapp import create_app
 
@@ -66,6 +67,18 @@ class TestBrokenConfig:
         assert any("SESSION_FILE_DIR" in r.message for r in caplog.records)
 
 
+class TestPreloadTaxonomies:
+    def test_preloaded_only_when_configured(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            digital_converter_webapp, "preloadTaxonomies", lambda: calls.append(1)
+        )
+        create_app({"TESTING": True})
+        assert calls == []
+        create_app({"TESTING": True, "PRELOAD_TAXONOMIES": "true"})
+        assert calls == [1]
+
+
 class TestDebugSession:
     def test_not_found_when_debug_off(self, client):
         resp = client.get("/debug_session")